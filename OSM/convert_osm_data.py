@@ -10,6 +10,7 @@ from simulation.Order import Order
 
 from solver.Solver import Solver
 from solver.Solution import Solution
+from solver.DistanceMatrixCache import DistanceMatrixCache
 
 from geojson import FeatureCollection, Feature, Point, LineString
 
@@ -80,7 +81,7 @@ def main():
     #orderList = list(map(lambda x: Order(x), simulation.pickRandomBuildings(150))) # 350 is good medium
     orderList = list(map(lambda x: Order(x), simulation.getBuildingList()[0::299]))
 
-    solver = Solver(droneList, depot, simulation.getChargingStationList(), orderList)
+    solver = Solver(droneList, depot, simulation.getChargingStationList(), orderList, simulation.getDistanceModel(), DistanceMatrixCache('./cache'))
 
     print(f'---------------------------------------------------------------------------------------------------------------')
 
@@ -0,0 +1,33 @@
+from enum import Enum
+
+class DistanceModel(Enum):
+    # Define the supported distance models
+    WGS84 = ('wgs84')
+    HAVERSINE = ('haversine')
+    TANGENT_PLANE = ('tangent-plane')
+
+    # Constructor for setting custom parameter
+    def __init__(self, label):
+        # Set the model parameters
+        self.label = label
+
+    # Define a getByName function for conversion
+    @staticmethod
+    def from_str(label: str) -> 'DistanceModel':
+        # Check if the model is the exact ellipsoid model
+        if label.upper() in ('WGS84', 'GEODESIC'):
+            # Return the wgs84 enum model
+            return DistanceModel.WGS84
+
+        # Check if the model is the spherical model
+        if label.upper() in ('HAVERSINE', 'SPHERE'):
+            # Return the haversine enum model
+            return DistanceModel.HAVERSINE
+
+        # Check if the model is the planar model
+        if label.upper() in ('TANGENT-PLANE', 'TANGENT_PLANE', 'PLANE'):
+            # Return the tangent plane enum model
+            return DistanceModel.TANGENT_PLANE
+
+        # If no match is found throw an error
+        raise NotImplementedError
@@ -1,11 +1,30 @@
 from .ElementType import ElementType
+from .DistanceModel import DistanceModel
 
 from typing import Self
 
+import numpy as np
+
 from geographiclib.polygonarea import PolygonArea
 from geographiclib.geodesic import Geodesic
 
 class Element():
+    # Define the WGS84 ellipsoid constants for the vectorized distance calculation
+    WGS84_SEMI_MAJOR_AXIS = Geodesic.WGS84.a
+    WGS84_FLATTENING = Geodesic.WGS84.f
+    WGS84_SEMI_MINOR_AXIS = (1 - Geodesic.WGS84.f) * Geodesic.WGS84.a
+    WGS84_ECCENTRICITY_SQUARED = Geodesic.WGS84.f * (2 - Geodesic.WGS84.f)
+
+    # Define the mean earth radius for the spherical distance calculation
+    MEAN_EARTH_RADIUS = 6371008.8
+
+    # Define the convergence parameters of the vectorized distance calculation
+    VINCENTY_CONVERGENCE_THRESHOLD = 1e-12
+    VINCENTY_MAX_ITERATIONS = 200
+
+    # Define the maximum number of point pairs calculated at once to limit the memory of the vectorized distance calculation
+    DISTANCE_BLOCK_SIZE = 1 << 20
+
     def __init__(self, osmElement: dict):
         # Set the mandatory element parameters
         self.id = Element.GetIdentifier(osmElement)
@@ -42,12 +61,20 @@ class Element():
         return self.sourceElement
     
     # Getter function for the 2D distance between this and another element
-    def getDistanceTo(self, dstElement: 'Element | tuple[float, float]') -> float:
+    def getDistanceTo(self, dstElement: 'Element | tuple[float, float]', distanceModel: DistanceModel = DistanceModel.WGS84) -> float:
         # Check if the dstElement is an Element and resolve the coordinates
         if isinstance(dstElement, Element): dstElement = dstElement.getCoordinates()
 
+        # Check if the distance model is not the exact one and use the vectorized function for the single pair
+        if distanceModel != DistanceModel.WGS84: return float(self.getDistancesTo([dstElement], distanceModel)[0])
+
         # Use the internal functions to get the coordinates and calculate the geo distance
         return Element.__CalcDistanceByGeodesic(self.getCoordinates(), dstElement)
+
+    # Getter function for the 2D distances between this and a list of other elements
+    def getDistancesTo(self, dstElements: 'list[Element | tuple[float, float]] | np.ndarray', distanceModel: DistanceModel = DistanceModel.WGS84) -> np.ndarray:
+        # Use the vectorized distance matrix function with this element as the only source and flatten the single row
+        return Element.GetDistanceMatrix([self.getCoordinates()], dstElements, distanceModel)[0]
     
     # Overwrite the string representation
     def __str__(self):
@@ -83,6 +110,126 @@ class Element():
     #################### Public Static Functions ####################
     #################################################################
 
+    # Utils function to convert a list of elements or coordinates into a (n, 2) latitude/longitude array
+    @staticmethod
+    def GetCoordinateArray(elements: 'list[Element | tuple[float, float]] | np.ndarray') -> np.ndarray:
+        # Check if the elements are already a coordinate array
+        if isinstance(elements, np.ndarray): return elements.reshape(-1, 2).astype(np.float64, copy=False)
+
+        # Resolve the coordinates of the elements and convert them into a float array
+        return np.array([x.getCoordinates() if isinstance(x, Element) else x for x in elements], dtype=np.float64).reshape(-1, 2)
+
+    # Utils function to project a list of elements or coordinates onto a local tangent plane in meters (x east, y north)
+    @staticmethod
+    def GetProjectedCoordinates(elements: 'list[Element | tuple[float, float]] | np.ndarray', referenceCoordinates: tuple[float, float] = None) -> np.ndarray:
+        # Convert the elements into a coordinate array
+        coordinates = Element.GetCoordinateArray(elements)
+
+        # Check if the reference coordinates are set or use the center of the coordinates as the tangent point
+        if referenceCoordinates is None: referenceCoordinates = coordinates.mean(axis=0) if len(coordinates) else (0.0, 0.0)
+
+        # Calculate the meridional and prime vertical radius of curvature at the reference latitude
+        meridionalRadius, primeVerticalRadius = Element.__CalcRadiiOfCurvature(np.radians(referenceCoordinates[0]))
+
+        # Scale the latitude/longitude offsets to the reference point with the radii of curvature
+        return np.column_stack((
+            np.radians(coordinates[:, 1] - referenceCoordinates[1]) * primeVerticalRadius * np.cos(np.radians(referenceCoordinates[0])),
+            np.radians(coordinates[:, 0] - referenceCoordinates[0]) * meridionalRadius
+        ))
+
+    # Utils function to calculate the 2D distances between two lists of elements or coordinates as a matrix
+    @staticmethod
+    def GetDistanceMatrix(srcElements: 'list[Element | tuple[float, float]] | np.ndarray', dstElements: 'list[Element | tuple[float, float]] | np.ndarray' = None, distanceModel: DistanceModel = DistanceModel.WGS84) -> np.ndarray:
+        # Hint: The vectorized vincenty distance matches the geodesic distance (rounded to 2 decimals) within 0.01 m
+        # Convert the source elements into a coordinate array
+        srcCoordinates = Element.GetCoordinateArray(srcElements)
+
+        # Check if the destination elements are set or use the source elements for a symmetric matrix
+        dstCoordinates = srcCoordinates if dstElements is None else Element.GetCoordinateArray(dstElements)
+
+        # Create an empty matrix for the distances between the source and destination coordinates
+        distanceMatrix = np.zeros((len(srcCoordinates), len(dstCoordinates)), dtype=np.float64)
+
+        # Calculate the number of source rows per block to limit the memory of the vectorized calculation
+        blockSize = max(1, Element.DISTANCE_BLOCK_SIZE // max(1, len(dstCoordinates)))
+
+        # Loop through the source coordinates in blocks of rows
+        for blockStart in range(0, len(srcCoordinates), blockSize):
+            # Resolve the source coordinates of the current block
+            blockCoordinates = srcCoordinates[blockStart:(blockStart + blockSize)]
+
+            # Resolve the first destination column of the block (symmetric matrices only need the upper triangle)
+            columnStart = blockStart if dstElements is None else 0
+
+            # Calculate the distances of the block with broadcasting the source rows against the destination columns
+            distanceMatrix[blockStart:(blockStart + blockSize), columnStart:] = Element.__CalcDistancesByModel(
+                blockCoordinates[:, np.newaxis, :], dstCoordinates[np.newaxis, columnStart:, :], distanceModel)
+
+        # Check if the matrix is symmetric to mirror the upper triangle for exactly equal distances in both directions
+        if dstElements is None: distanceMatrix = np.triu(distanceMatrix, 1) + np.triu(distanceMatrix, 1).T
+
+        # Return the distance matrix
+        return distanceMatrix
+
+    # Utils function to calculate the element wise distances between two equally long lists of elements
+    @staticmethod
+    def GetPairwiseDistances(srcElements: 'list[Element | tuple[float, float]] | np.ndarray', dstElements: 'list[Element | tuple[float, float]] | np.ndarray', distanceModel: DistanceModel = DistanceModel.WGS84) -> np.ndarray:
+        # Convert the source and destination elements into coordinate arrays
+        srcCoordinates, dstCoordinates = Element.GetCoordinateArray(srcElements), Element.GetCoordinateArray(dstElements)
+
+        # Check if both lists have the same length
+        if len(srcCoordinates) != len(dstCoordinates): raise ValueError("Pairwise distances require equally long element lists")
+
+        # Create an empty array for the distances between the element pairs
+        distanceArray = np.zeros(len(srcCoordinates), dtype=np.float64)
+
+        # Loop through the element pairs in blocks to limit the memory of the vectorized calculation
+        for blockStart in range(0, len(srcCoordinates), Element.DISTANCE_BLOCK_SIZE):
+            # Calculate the distances of the block element wise
+            distanceArray[blockStart:(blockStart + Element.DISTANCE_BLOCK_SIZE)] = Element.__CalcDistancesByModel(
+                srcCoordinates[blockStart:(blockStart + Element.DISTANCE_BLOCK_SIZE)], dstCoordinates[blockStart:(blockStart + Element.DISTANCE_BLOCK_SIZE)], distanceModel)
+
+        # Return the distance array
+        return distanceArray
+
+    # Utils function to measure the deviation of a distance model from the exact wgs84 distances for a list of elements
+    @staticmethod
+    def GetDistanceModelDeviation(elements: 'list[Element | tuple[float, float]] | np.ndarray', distanceModel: DistanceModel, sampleSize: int = None) -> tuple[float, float]:
+        # Convert the elements into a coordinate array
+        coordinates = Element.GetCoordinateArray(elements)
+
+        # Check if the sampleSize is set and pick evenly spaced coordinates to limit the number of compared pairs
+        if (sampleSize is not None) and (sampleSize < len(coordinates)):
+            # Use the evenly spaced indices to reduce the coordinates to the sample
+            coordinates = coordinates[np.linspace(0, len(coordinates) - 1, sampleSize).astype(int)]
+
+        # Initialize the deviation parameters
+        maximumDeviation = deviationSum = 0.0
+        pairCount = 0
+
+        # Calculate the number of rows per block to limit the memory of the compared matrices
+        blockSize = max(1, Element.DISTANCE_BLOCK_SIZE // max(1, len(coordinates)))
+
+        # Loop through the coordinates in blocks of rows
+        for blockStart in range(0, len(coordinates), blockSize):
+            # Resolve the coordinates of the current block
+            blockCoordinates = coordinates[blockStart:(blockStart + blockSize)]
+
+            # Calculate the absolute deviation between the exact and the given model for the block rows
+            deviationMatrix = np.abs(Element.GetDistanceMatrix(blockCoordinates, coordinates, DistanceModel.WGS84)
+                - Element.GetDistanceMatrix(blockCoordinates, coordinates, distanceModel))
+
+            # Reduce the deviations to the upper triangle of the complete matrix to count each pair once
+            deviationList = deviationMatrix[np.triu(np.ones(deviationMatrix.shape, dtype=bool), blockStart + 1)]
+
+            # Update the maximum deviation, deviation sum and pair count with the block
+            maximumDeviation = max(maximumDeviation, float(deviationList.max(initial=0)))
+            deviationSum += float(deviationList.sum())
+            pairCount += len(deviationList)
+
+        # Return the maximum and mean deviation in meters
+        return (maximumDeviation, (deviationSum / pairCount) if pairCount else 0.0)
+
     # Utils function to extract the id from the osmElement
     @staticmethod
     def GetIdentifier(osmElement: dict) -> int:
@@ -260,6 +407,125 @@ class Element():
         # Extract the 2D distance and round it
         return round(float(geod['s12']), 2)
 
+    # Utils function to calculate the distances between broadcastable coordinate arrays with the given distance model
+    @staticmethod
+    def __CalcDistancesByModel(firstPoints: np.ndarray, secondPoints: np.ndarray, distanceModel: DistanceModel) -> np.ndarray:
+        # Check if the distance model is the spherical one
+        if distanceModel == DistanceModel.HAVERSINE:
+            # Calculate the distances with the haversine formula
+            return Element.__CalcDistancesByHaversine(firstPoints, secondPoints)
+
+        # Check if the distance model is the planar one
+        if distanceModel == DistanceModel.TANGENT_PLANE:
+            # Calculate the distances with the local tangent plane
+            return Element.__CalcDistancesByTangentPlane(firstPoints, secondPoints)
+
+        # Default to the exact ellipsoid distances with the vincenty formula
+        return Element.__CalcDistancesByVincenty(firstPoints, secondPoints)
+
+    # Utils function to calculate the meridional and prime vertical radius of curvature of the wgs84 ellipsoid at the given latitudes
+    @staticmethod
+    def __CalcRadiiOfCurvature(latitude: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Calculate the shared denominator term of the radii
+        denominator = 1 - Element.WGS84_ECCENTRICITY_SQUARED * np.sin(latitude) ** 2
+
+        # Return the meridional and prime vertical radius of curvature
+        return (Element.WGS84_SEMI_MAJOR_AXIS * (1 - Element.WGS84_ECCENTRICITY_SQUARED) / denominator ** 1.5,
+            Element.WGS84_SEMI_MAJOR_AXIS / np.sqrt(denominator))
+
+    # Utils function to calculate the spherical distances between broadcastable coordinate arrays with the haversine formula
+    @staticmethod
+    def __CalcDistancesByHaversine(firstPoints: np.ndarray, secondPoints: np.ndarray) -> np.ndarray:
+        # Convert the latitude/longitude coordinates into radians
+        firstLat, firstLon = np.radians(firstPoints[..., 0]), np.radians(firstPoints[..., 1])
+        secondLat, secondLon = np.radians(secondPoints[..., 0]), np.radians(secondPoints[..., 1])
+
+        # Calculate the haversine of the central angle between the points
+        haversine = np.sin((secondLat - firstLat) / 2) ** 2 + np.cos(firstLat) * np.cos(secondLat) * np.sin((secondLon - firstLon) / 2) ** 2
+
+        # Calculate the distances on the sphere and round them like the geodesic calculation
+        return np.round(2 * Element.MEAN_EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(haversine, 0, 1))), 2)
+
+    # Utils function to calculate the planar distances between broadcastable coordinate arrays on the tangent plane at each pair midpoint
+    @staticmethod
+    def __CalcDistancesByTangentPlane(firstPoints: np.ndarray, secondPoints: np.ndarray) -> np.ndarray:
+        # Convert the latitude/longitude coordinates into radians
+        firstLat, firstLon = np.radians(firstPoints[..., 0]), np.radians(firstPoints[..., 1])
+        secondLat, secondLon = np.radians(secondPoints[..., 0]), np.radians(secondPoints[..., 1])
+
+        # Calculate the radii of curvature at the midpoint latitude of each pair
+        midpointLat = (firstLat + secondLat) / 2
+        meridionalRadius, primeVerticalRadius = Element.__CalcRadiiOfCurvature(midpointLat)
+
+        # Calculate the planar distances with the scaled latitude/longitude offsets and round them like the geodesic calculation
+        return np.round(np.hypot((secondLon - firstLon) * primeVerticalRadius * np.cos(midpointLat), (secondLat - firstLat) * meridionalRadius), 2)
+
+    # Utils function to calculate the geodesic distances between broadcastable coordinate arrays with the vincenty formula
+    @staticmethod
+    def __CalcDistancesByVincenty(firstPoints: np.ndarray, secondPoints: np.ndarray) -> np.ndarray:
+        # Resolve the ellipsoid constants for easier access
+        a, b, f = Element.WGS84_SEMI_MAJOR_AXIS, Element.WGS84_SEMI_MINOR_AXIS, Element.WGS84_FLATTENING
+
+        # Convert the latitude/longitude coordinates into radians and broadcast them to the same shape
+        firstLat, firstLon, secondLat, secondLon = np.broadcast_arrays(
+            np.radians(firstPoints[..., 0]), np.radians(firstPoints[..., 1]),
+            np.radians(secondPoints[..., 0]), np.radians(secondPoints[..., 1]))
+
+        # Calculate the reduced latitudes and the longitude difference of the points
+        sinU1, cosU1 = np.sin(np.arctan((1 - f) * np.tan(firstLat))), np.cos(np.arctan((1 - f) * np.tan(firstLat)))
+        sinU2, cosU2 = np.sin(np.arctan((1 - f) * np.tan(secondLat))), np.cos(np.arctan((1 - f) * np.tan(secondLat)))
+        lonDelta = secondLon - firstLon
+
+        # Initialize the iteration parameters with the longitude difference
+        lambdaValue = lonDelta.copy()
+        converged = np.zeros(lonDelta.shape, dtype=bool)
+
+        # Iterate the lambda value until all point pairs converged or the iteration limit is reached
+        for _ in range(Element.VINCENTY_MAX_ITERATIONS):
+            # Calculate the angular distance of the points on the auxiliary sphere
+            sinLambda, cosLambda = np.sin(lambdaValue), np.cos(lambdaValue)
+            sinSigma = np.hypot(cosU2 * sinLambda, cosU1 * sinU2 - sinU1 * cosU2 * cosLambda)
+            cosSigma = sinU1 * sinU2 + cosU1 * cosU2 * cosLambda
+            sigma = np.arctan2(sinSigma, cosSigma)
+
+            # Calculate the azimuth of the geodesic at the equator (coincident points have no azimuth)
+            sinAlpha = np.divide(cosU1 * cosU2 * sinLambda, sinSigma, out=np.zeros_like(sinSigma), where=(sinSigma != 0))
+            cosSqAlpha = 1 - sinAlpha ** 2
+
+            # Calculate the angular distance of the midpoint to the equator (equatorial lines have no midpoint)
+            cos2SigmaM = np.divide(2 * sinU1 * sinU2, cosSqAlpha, out=np.zeros_like(cosSqAlpha), where=(cosSqAlpha != 0))
+            cos2SigmaM = np.where(cosSqAlpha != 0, cosSigma - cos2SigmaM, 0)
+
+            # Calculate the next lambda value
+            c = f / 16 * cosSqAlpha * (4 + f * (4 - 3 * cosSqAlpha))
+            nextLambdaValue = lonDelta + (1 - c) * f * sinAlpha * (sigma + c * sinSigma * (cos2SigmaM + c * cosSigma * (-1 + 2 * cos2SigmaM ** 2)))
+
+            # Check the convergence of the lambda value and save the next value
+            converged = np.abs(nextLambdaValue - lambdaValue) <= Element.VINCENTY_CONVERGENCE_THRESHOLD
+            lambdaValue = nextLambdaValue
+
+            # Check if all point pairs converged
+            if converged.all(): break
+
+        # Calculate the ellipsoidal correction terms of the distance
+        uSq = cosSqAlpha * (a ** 2 - b ** 2) / (b ** 2)
+        bigA = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+        bigB = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+        deltaSigma = bigB * sinSigma * (cos2SigmaM + bigB / 4 * (cosSigma * (-1 + 2 * cos2SigmaM ** 2)
+            - bigB / 6 * cos2SigmaM * (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2)))
+
+        # Calculate the distances on the ellipsoid
+        distances = b * bigA * (sigma - deltaSigma)
+
+        # Loop through the point pairs that did not converge (nearly antipodal) to fallback to the geodesic calculation
+        for pairIndex in zip(*np.nonzero(~converged)):
+            # Use the geodesic calculation for the point pair with the original degree coordinates
+            distances[pairIndex] = Geodesic.WGS84.Inverse(np.degrees(firstLat[pairIndex]), np.degrees(firstLon[pairIndex]),
+                np.degrees(secondLat[pairIndex]), np.degrees(secondLon[pairIndex]))['s12']
+
+        # Round the distances like the geodesic calculation
+        return np.round(distances, 2)
+
     # Utils function to calculate a geodesic area by coordinates
     @staticmethod
     def __CalcAreaByGeodesic(coordinates: list[tuple[float, float]] = []) -> float:
@@ -7,15 +7,21 @@ from model.Building import Building
 from model.District import District
 from model.ChargingStation import ChargingStation
 
+from osm.Element import Element
+from osm.DistanceModel import DistanceModel
+
 from .Event import Event
 from .Drone import Drone
  
 class Simulation():
     # Constructor the simulation with a given district
-    def __init__(self, districtList: list[District], droneList: list[Drone], depot: Depot, chargingStations: int | list[ChargingStation], initialEvents: list[Event] = [], initialTime: int = 0):
+    def __init__(self, districtList: list[District], droneList: list[Drone], depot: Depot, chargingStations: int | list[ChargingStation], initialEvents: list[Event] = [], initialTime: int = 0, distanceModel: DistanceModel = DistanceModel.WGS84):
         # Save the districtList for later use
         self.districtList = districtList
 
+        # Save the distanceModel for the distance calculations
+        self.distanceModel = distanceModel
+
         # Save the droneList for later use
         self.droneList = droneList
 
@@ -79,6 +85,10 @@ class Simulation():
     def getCurrentTime(self) -> int:
         # Return the currentTime
         return self.currentTime
+
+    def getDistanceModel(self) -> DistanceModel:
+        # Return the distanceModel
+        return self.distanceModel
     
     def sortEventList(self) -> None:
         # Sort the event list by the timestamp of each event
@@ -122,6 +132,10 @@ class Simulation():
         return choices(buildingList, populationList, k=buildingCount)
         
 
+    def validateDistanceModel(self, sampleSize: int = None) -> tuple[float, float]:
+        # Use the element function to measure the maximum and mean deviation of the distance model from the exact wgs84 distances
+        return Element.GetDistanceModelDeviation(self.getBuildingList(), self.distanceModel, sampleSize)
+
     def calculateChargingStationCoordinates(self, stationCount: int, takeNearestNeighbor: bool = False) -> list[ChargingStation]:
         # Use the integrated python loops to get the flatMapped distric building coordinates
         buildingCoordinateList = [building.getCoordinates() for district 
@@ -151,8 +165,8 @@ class Simulation():
             # Loop over the list of labels per index, filter all index entries that are in the current cluster and resolve the corresponding data
             mappedClusterDataList = [ buildingCoordinateList[idx] for idx, clu_num in enumerate(kmeans.labels_.tolist()) if clu_num == stationIndex ]
 
-            # Use the min function on the clusterDataList to finde the geographically clostest building for each charging station
-            nearestStationNeighbor = min(mappedClusterDataList, key=lambda x: tempStationObject.getDistanceTo(x))
+            # Use the vectorized one-to-many distances of the station to finde the geographically clostest building for each charging station
+            nearestStationNeighbor = mappedClusterDataList[int(tempStationObject.getDistancesTo(mappedClusterDataList, self.distanceModel).argmin())]
 
             # Create a charging station object with the station index and given coordinated as a simple node
             nearestNeighborList.append(ChargingStation.CreateFromAttributes(stationIndex + 1, 'node', nearestStationNeighbor))
@@ -0,0 +1,33 @@
+from enum import Enum
+
+class AcceptanceStrategy(Enum):
+    # Define the strategies to select a move from the neighborhood
+    BEST_IMPROVEMENT = ('best-improvement')
+    FIRST_IMPROVEMENT = ('first-improvement')
+    BEST_OF_SAMPLE = ('best-of-sample')
+
+    # Constructor for setting custom parameter
+    def __init__(self, label):
+        # Set the type parameters
+        self.label = label
+
+    # Define a getByName function for conversion
+    @staticmethod
+    def from_str(label: str) -> 'AcceptanceStrategy':
+        # Check if the best move of the whole neighborhood is selected
+        if label.upper() in ('BEST-IMPROVEMENT', 'BEST_IMPROVEMENT', 'BEST'):
+            # Return the best improvement enum type
+            return AcceptanceStrategy.BEST_IMPROVEMENT
+
+        # Check if the first improving move of the neighborhood is selected
+        if label.upper() in ('FIRST-IMPROVEMENT', 'FIRST_IMPROVEMENT', 'FIRST'):
+            # Return the first improvement enum type
+            return AcceptanceStrategy.FIRST_IMPROVEMENT
+
+        # Check if the best move of the first sampled moves is selected
+        if label.upper() in ('BEST-OF-SAMPLE', 'BEST_OF_SAMPLE', 'BEST-OF-K', 'SAMPLE'):
+            # Return the best of sample enum type
+            return AcceptanceStrategy.BEST_OF_SAMPLE
+
+        # If no match is found throw an error
+        raise NotImplementedError
@@ -0,0 +1,70 @@
+class ChargingProfile():
+    # Constructor the charging profile with given arguemnts
+    def __init__(self, distancePrefixList: list[float], closestDistanceList: list[float]):
+        # Save the distance from the tour start up to each order
+        self.distancePrefixList = distancePrefixList
+
+        # Save the distance between each order and its closest charging station
+        self.closestDistanceList = closestDistanceList
+
+        # Create the sparse tables of the range maximum for the forward (prefix) and the backward (suffix) direction of the tour
+        self.forwardTable = ChargingProfile.CalculateSparseTable([x + y for x, y in zip(distancePrefixList, closestDistanceList)])
+        self.backwardTable = ChargingProfile.CalculateSparseTable([y - x for x, y in zip(distancePrefixList, closestDistanceList)])
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getDistancePrefixList(self) -> list[float]:
+        # Return the distancePrefixList
+        return self.distancePrefixList
+
+    def getClosestDistanceList(self) -> list[float]:
+        # Return the closestDistanceList
+        return self.closestDistanceList
+
+    ################################################################################
+    ################################ LOOKUP FUNCTIONS ##############################
+    ################################################################################
+
+    def findFirstForward(self, startIndex: int, endIndex: int, threshold: float) -> int:
+        # Hint: Finds the first order (walking forward) whose prefix distance plus closest charging station distance exceeds the threshold
+        # Start at the first index and skip the blocks whose maximum does not exceed the threshold (largest blocks first)
+        currentIndex = startIndex
+        for level in range(len(self.forwardTable) - 1, -1, -1):
+            # Check if the block fits into the range and does not exceed the threshold to skip it
+            if (currentIndex + (1 << level) - 1 <= endIndex) and (self.forwardTable[level][currentIndex] <= threshold): currentIndex += 1 << level
+
+        # Return the found index or -1 if all orders of the range are within the threshold
+        return currentIndex if currentIndex <= endIndex else -1
+
+    def findFirstBackward(self, startIndex: int, endIndex: int, threshold: float) -> int:
+        # Hint: Finds the first order (walking backward from the start to the lower end index) whose closest charging station distance minus prefix distance exceeds the threshold
+        # Start at the first index and skip the blocks whose maximum does not exceed the threshold (largest blocks first)
+        currentIndex = startIndex
+        for level in range(len(self.backwardTable) - 1, -1, -1):
+            # Check if the block fits into the range and does not exceed the threshold to skip it
+            if (currentIndex - (1 << level) + 1 >= endIndex) and (self.backwardTable[level][currentIndex - (1 << level) + 1] <= threshold): currentIndex -= 1 << level
+
+        # Return the found index or -1 if all orders of the range are within the threshold
+        return currentIndex if currentIndex >= endIndex else -1
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def CalculateSparseTable(valueList: list[float]) -> list[list[float]]:
+        # Create the first level with the values themselves
+        sparseTable = [valueList]
+
+        # Double the block size of each level while the block fits into the values (maximum of the two halves of the block)
+        while (1 << len(sparseTable)) <= len(valueList):
+            # Resolve the previous level and its half block size
+            previousLevel, halfBlockSize = sparseTable[-1], 1 << (len(sparseTable) - 1)
+
+            # Save the maximum of each block that fits into the values
+            sparseTable.append([max(previousLevel[index], previousLevel[index + halfBlockSize]) for index in range(len(previousLevel) - halfBlockSize)])
+
+        # Return the sparse table
+        return sparseTable
@@ -0,0 +1,148 @@
+import numpy as np
+
+from bisect import bisect_right
+
+from model.ChargingStation import ChargingStation
+
+from .DistanceMatrix import DistanceMatrix
+
+class ChargingStationTable():
+    # Define constants for the charging station table class
+    FLOAT_POSITIVE_INFINITY = float('+inf')
+
+    # Constructor the charging station table with given arguemnts
+    def __init__(self, distanceMatrix: DistanceMatrix, chargingStationList: list[ChargingStation]):
+        # Save the list of charging stations in a fixed order
+        self.chargingStationList = list(chargingStationList)
+
+        # Resolve the matrix indices of the charging stations
+        chargingStationIndices = np.array([distanceMatrix.getBuildingIndex(x) for x in self.chargingStationList], dtype=np.intp)
+
+        # Resolve the distances between every matrix index and all charging stations at once
+        distanceTable = distanceMatrix.getDistances(np.arange(distanceMatrix.getIndexCount())[:, np.newaxis], chargingStationIndices[np.newaxis, :])
+
+        # Sort the charging stations of every matrix index by distance (stable to keep the station order for equal distances)
+        sortedStationTable = np.argsort(distanceTable, axis=1, kind='stable')
+
+        # Save the sorted distances of every matrix index as lists for the binary search of the range queries
+        self.sortedDistanceTable = np.take_along_axis(distanceTable, sortedStationTable, axis=1).tolist()
+
+        # Save the sorted charging stations of every matrix index
+        self.sortedStationTable = [[self.chargingStationList[x] for x in row] for row in sortedStationTable.tolist()]
+
+        # Save the matrix indices of the sorted charging stations of every matrix index (the reachability graph between the orders and the charging stations)
+        self.sortedStationIndexTable = chargingStationIndices[sortedStationTable].tolist()
+
+        # Save the closest charging station and its distance of every matrix index (infinite if there is no station)
+        self.closestDistanceList = [row[0] if row else ChargingStationTable.FLOAT_POSITIVE_INFINITY for row in self.sortedDistanceTable]
+        self.closestStationList = [row[0] if row else None for row in self.sortedStationTable]
+
+        # Save the matrix indices of the charging stations and the distances between the charging stations for the station hops
+        self.stationIndexList = chargingStationIndices.tolist()
+        self.stationDistanceTable = distanceTable[chargingStationIndices]
+
+        # Create the cache of the station hop tables by range and stop distance
+        self.stationHopCache = {}
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getChargingStationList(self) -> list[ChargingStation]:
+        # Return the chargingStationList
+        return self.chargingStationList
+
+    ################################################################################
+    ################################ LOOKUP FUNCTIONS ##############################
+    ################################################################################
+
+    def isChargingStationInRange(self, index: int, range: float) -> bool:
+        # Compare the precalculated distance of the closest charging station with the range
+        return self.closestDistanceList[index] <= range
+
+    def getChargingStationsInRange(self, index: int, range: float) -> list[ChargingStation]:
+        # Use a binary search on the sorted distances to slice the charging stations within the range
+        return self.sortedStationTable[index][:bisect_right(self.sortedDistanceTable[index], range)]
+
+    def getChargingStationCandidates(self, index: int, range: float, candidateCount: int) -> list[tuple[ChargingStation, int, float]]:
+        # Use a binary search on the sorted distances to limit the candidates to the closest charging stations within the range
+        candidateCount = min(candidateCount, bisect_right(self.sortedDistanceTable[index], range))
+
+        # Return the charging stations with their matrix indices and distances
+        return list(zip(self.sortedStationTable[index][:candidateCount], self.sortedStationIndexTable[index][:candidateCount], self.sortedDistanceTable[index][:candidateCount]))
+
+    def getSortedChargingStations(self, index: int) -> list[ChargingStation]:
+        # Return the charging stations sorted by distance
+        return self.sortedStationTable[index]
+
+    def getSortedChargingStationDistances(self, index: int) -> list[float]:
+        # Return the charging station distances sorted ascending
+        return self.sortedDistanceTable[index]
+
+    def getClosestChargingStation(self, index: int) -> ChargingStation:
+        # Return the precalculated closest charging station
+        return self.closestStationList[index]
+
+    def getClosestChargingStationDistance(self, index: int) -> float:
+        # Return the precalculated distance of the closest charging station
+        return self.closestDistanceList[index]
+
+    ################################################################################
+    ################################# HOP FUNCTIONS ################################
+    ################################################################################
+
+    def getStationHops(self, range: float, stopDistance: float = 0.0) -> dict[int, list[tuple[int, ChargingStation, float]]]:
+        # Return the charging stations reachable over a chain of charging stops from every charging station (by matrix index)
+        return self.getStationHopTable(range, stopDistance)[0]
+
+    def getStationHopPath(self, range: float, stopDistance: float, sourceIndex: int, destinationIndex: int) -> list[ChargingStation]:
+        # Resolve the successor table of the range and stop distance
+        stationNextTable = self.getStationHopTable(range, stopDistance)[1]
+
+        # Resolve the positions of the source and the destination in the charging station list
+        stationPosition, destinationPosition = self.stationIndexList.index(sourceIndex), self.stationIndexList.index(destinationIndex)
+
+        # Follow the successors from the source to the destination station (both included)
+        stationPath = [self.chargingStationList[stationPosition]]
+        while stationPosition != destinationPosition:
+            # Move to the next station on the cheapest chain
+            stationPosition = stationNextTable[stationPosition][destinationPosition]
+            stationPath.append(self.chargingStationList[stationPosition])
+
+        # Return the charging stations of the chain
+        return stationPath
+
+    def getStationHopTable(self, range: float, stopDistance: float) -> tuple[dict[int, list[tuple[int, ChargingStation, float]]], list[list[int]]]:
+        # Check if the hop table of the range and stop distance is already calculated
+        stationHopTable = self.stationHopCache.get((range, stopDistance))
+        if stationHopTable is not None:
+            # Return the cached hop table
+            return stationHopTable
+
+        # Create the direct hops between the charging stations within the range (every hop ends with a charging stop)
+        stationCount = len(self.chargingStationList)
+        costTable = np.where(self.stationDistanceTable <= range, self.stationDistanceTable + stopDistance, ChargingStationTable.FLOAT_POSITIVE_INFINITY)
+        np.fill_diagonal(costTable, 0.0)
+
+        # Create the successor table of the direct hops
+        nextTable = np.tile(np.arange(stationCount, dtype=np.intp), (stationCount, 1))
+
+        # Use floyd warshall to find the cheapest chain of charging stops between every pair of charging stations
+        for viaPosition in np.arange(stationCount):
+            # Calculate the cost of the chains over the via station
+            viaCostTable = costTable[:, viaPosition, np.newaxis] + costTable[np.newaxis, viaPosition, :]
+
+            # Keep the cheaper chains and route them over the via station
+            improvedMask = viaCostTable < costTable
+            costTable = np.where(improvedMask, viaCostTable, costTable)
+            nextTable = np.where(improvedMask, nextTable[:, viaPosition, np.newaxis], nextTable)
+
+        # Collect the reachable charging stations of every charging station with the cost of the chain
+        stationHops = {}
+        for stationPosition, stationIndex in enumerate(self.stationIndexList):
+            # Add the other charging stations with a finite chain
+            stationHops[stationIndex] = [(self.stationIndexList[x], self.chargingStationList[x], float(costTable[stationPosition, x])) for x in np.flatnonzero(np.isfinite(costTable[stationPosition])) if x != stationPosition]
+
+        # Cache and return the hop table
+        stationHopTable = self.stationHopCache[(range, stopDistance)] = (stationHops, nextTable.tolist())
+        return stationHopTable
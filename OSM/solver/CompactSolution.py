@@ -0,0 +1,127 @@
+from array import array
+
+from simulation.Drone import Drone
+from simulation.Order import Order
+
+from .ProblemInstance import ProblemInstance
+
+class CompactSolution():
+    # Define the memory layout of the compact solution (no instance dict)
+    __slots__ = ('problemInstance', 'orderCodeArray', 'tourOffsetArray', 'timeScore')
+
+    # Define the typecodes of the buffers (signed short if the values fit, signed int otherwise)
+    SHORT_ARRAY_TYPECODE = 'h'
+    INT_ARRAY_TYPECODE = 'i'
+    SHORT_ARRAY_LIMIT = 2 ** 15
+
+    # Constructor the compact solution with given arguemnts
+    def __init__(self, problemInstance: ProblemInstance, orderCodeArray: array, tourOffsetArray: array, timeScore: float):
+        # Save the shared problem instance
+        self.problemInstance = problemInstance
+
+        # Save the order codes of all drone tours in the order of the drone list as one flat buffer
+        self.orderCodeArray = orderCodeArray
+
+        # Save the start offset of each drone tour in the order code buffer (one more entry for the end of the last tour)
+        self.tourOffsetArray = tourOffsetArray
+
+        # Save the time score of the encoded solution (compared by the searches without decoding the tours)
+        self.timeScore = timeScore
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getProblemInstance(self) -> ProblemInstance:
+        # Return the problemInstance
+        return self.problemInstance
+
+    def getOrderCodeArray(self) -> array:
+        # Return the orderCodeArray
+        return self.orderCodeArray
+
+    def getTourOffsetArray(self) -> array:
+        # Return the tourOffsetArray
+        return self.tourOffsetArray
+
+    def getTimeScore(self) -> float:
+        # Return the timeScore
+        return self.timeScore
+
+    ################################################################################
+    ################################ ACCESS FUNCTIONS ##############################
+    ################################################################################
+
+    def getDroneTourCodes(self, droneIndex: int) -> array:
+        # Slice the order codes of the drone tour from the flat buffer
+        return self.orderCodeArray[self.tourOffsetArray[droneIndex]:self.tourOffsetArray[droneIndex + 1]]
+
+    def getDroneTour(self, drone: Drone) -> list[Order]:
+        # Decode the order codes of the drone tour into orders
+        return list(map(self.problemInstance.getOrderByCode, self.getDroneTourCodes(self.problemInstance.getDroneList().index(drone))))
+
+    def getSolutionCopy(self) -> 'CompactSolution':
+        # Copy both buffers with a flat memory copy and share the problem instance
+        return CompactSolution(self.problemInstance, self.orderCodeArray[:], self.tourOffsetArray[:], self.timeScore)
+
+    def getSolution(self, templateSolution: 'Solution' = None) -> 'Solution':
+        # Hint: The depot codes decode to the shared depot order, the template solution (with the same tour ends) keeps the original depot orders at both tour ends
+        # Import the solution here to avoid the circular import of both solution types
+        from .Solution import Solution
+
+        # Create an empty solution of the shared problem instance
+        solution = Solution(self.problemInstance)
+
+        # Loop through the drones to decode their tours (depot and charging orders decode to the shared orders of the instance)
+        for droneIndex, drone in enumerate(self.problemInstance.getDroneList()):
+            droneTour = list(map(self.problemInstance.getOrderByCode, self.getDroneTourCodes(droneIndex)))
+
+            # Check if the template solution is set to restore the depot orders at both tour ends
+            if templateSolution is not None: droneTour[0], droneTour[-1] = templateSolution.getSolutionMatrix()[drone][0], templateSolution.getSolutionMatrix()[drone][-1]
+
+            # Set the decoded drone tour
+            solution.setDroneTour(drone, droneTour)
+
+        # Return the decoded solution
+        return solution
+
+    ################################################################################
+    ################################ CLASS FUNCTIONS ###############################
+    ################################################################################
+
+    def __eq__(self, other):
+        # Check if the other solution is compact and has the same tours
+        return isinstance(other, CompactSolution) and (self.tourOffsetArray == other.tourOffsetArray) and (self.orderCodeArray == other.orderCodeArray)
+
+    def __hash__(self):
+        # Hash the raw bytes of both buffers
+        return hash((self.tourOffsetArray.tobytes(), self.orderCodeArray.tobytes()))
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def FromSolution(solution: 'Solution') -> 'CompactSolution':
+        # Resolve the shared problem instance and the solution matrix of the solution
+        problemInstance = solution.getProblemInstance()
+        solutionMatrix = solution.getSolutionMatrix()
+
+        # Encode the orders of all drone tours in the order of the drone list
+        orderCodeList, tourOffsetList = [], [0]
+        for drone in problemInstance.getDroneList():
+            # Encode the orders of the drone tour and save the end offset of the tour
+            orderCodeList.extend(map(problemInstance.getOrderCode, solutionMatrix[drone]))
+            tourOffsetList.append(len(orderCodeList))
+
+        # Resolve the largest absolute order code (the order list positions or the codes of the charging stations)
+        maximumOrderCode = max(len(problemInstance.getOrderList()), len(problemInstance.getChargingStationList()) - ProblemInstance.CHARGING_ORDER_CODE_OFFSET)
+
+        # Return the compact solution with the smallest buffer types for the codes and offsets
+        return CompactSolution(problemInstance, array(CompactSolution.GetArrayTypecode(maximumOrderCode), orderCodeList),
+            array(CompactSolution.GetArrayTypecode(tourOffsetList[-1]), tourOffsetList), solution.getTimeScore())
+
+    @staticmethod
+    def GetArrayTypecode(maximumValue: int) -> str:
+        # Use the signed short buffer if the value fits into it, otherwise the signed int buffer
+        return CompactSolution.SHORT_ARRAY_TYPECODE if maximumValue < CompactSolution.SHORT_ARRAY_LIMIT else CompactSolution.INT_ARRAY_TYPECODE
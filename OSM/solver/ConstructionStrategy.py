@@ -0,0 +1,39 @@
+from enum import Enum
+
+class ConstructionStrategy(Enum):
+    # Define the heuristics to construct the initial solution with
+    BACKTRACKING = ('backtracking')
+    SAVINGS = ('savings')
+    SWEEP = ('sweep')
+    REGRET = ('regret')
+
+    # Constructor for setting custom parameter
+    def __init__(self, label):
+        # Set the type parameters
+        self.label = label
+
+    # Define a getByName function for conversion
+    @staticmethod
+    def from_str(label: str) -> 'ConstructionStrategy':
+        # Check if the orders are assigned in the order of the order list with backtracking
+        if label.upper() in ('BACKTRACKING', 'DEFAULT'):
+            # Return the backtracking enum type
+            return ConstructionStrategy.BACKTRACKING
+
+        # Check if the routes are merged by the clarke wright savings
+        if label.upper() in ('SAVINGS', 'CLARKE-WRIGHT', 'CLARKE_WRIGHT'):
+            # Return the savings enum type
+            return ConstructionStrategy.SAVINGS
+
+        # Check if the orders are clustered by their angle around the depot
+        if label.upper() in ('SWEEP', 'ANGULAR'):
+            # Return the sweep enum type
+            return ConstructionStrategy.SWEEP
+
+        # Check if the orders are inserted in parallel by their regret
+        if label.upper() in ('REGRET', 'REGRET-INSERTION', 'REGRET_INSERTION'):
+            # Return the regret enum type
+            return ConstructionStrategy.REGRET
+
+        # If no match is found throw an error
+        raise NotImplementedError
@@ -0,0 +1,150 @@
+import numpy as np
+
+from collections.abc import Mapping
+
+from osm.Element import Element
+from osm.DistanceModel import DistanceModel
+
+class DistanceMatrix(Mapping):
+    # Constructor the distance matrix with given arguemnts
+    def __init__(self, buildingList: list[Element], distanceModel: DistanceModel = DistanceModel.WGS84, matrix: np.ndarray = None, buildingIndexList: list[int] = None):
+        # Save the list of unique buildings in the order of their first appearance (dict keys preserve the insertion order)
+        self.buildingList = list(dict.fromkeys(buildingList))
+
+        # Check if the buildingIndexList is set or use the position of each unique building as its matrix index
+        if buildingIndexList is None: buildingIndexList = range(len(self.buildingList))
+
+        # Save the matrix index of each unique building as an array for the vectorized row access
+        self.buildingIndexArray = np.array(buildingIndexList, dtype=np.intp)
+
+        # Create a dictionary to look up the stable matrix index for each building in a constant time
+        self.buildingIndexDictionary = dict(zip(self.buildingList, self.buildingIndexArray.tolist()))
+
+        # Save the distance model the matrix is calculated with
+        self.distanceModel = distanceModel
+
+        # Check if the matrix parameter is set or calculate it with the unique building list
+        if matrix is None: matrix = DistanceMatrix.CalculateMatrix(self.buildingList, distanceModel)
+
+        # Save the matrix as a contiguous float array for the index based access
+        self.matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+
+        # Bind the item function of the matrix as the index based distance function to avoid a python level call per lookup
+        self.getDistance = self.matrix.item
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getBuildingList(self) -> list[Element]:
+        # Return the buildingList
+        return self.buildingList
+
+    def getBuildingIndexArray(self) -> np.ndarray:
+        # Return the buildingIndexArray
+        return self.buildingIndexArray
+
+    def getBuildingIndexDictionary(self) -> dict[Element, int]:
+        # Return the buildingIndexDictionary
+        return self.buildingIndexDictionary
+
+    def getDistanceModel(self) -> DistanceModel:
+        # Return the distanceModel
+        return self.distanceModel
+
+    def getMatrix(self) -> np.ndarray:
+        # Hint: Only dense distance matrices have a matrix (see hasDenseMatrix)
+        # Return the matrix
+        return self.matrix
+
+    ################################################################################
+    ############################### ACCESS FUNCTIONS ###############################
+    ################################################################################
+
+    def hasDenseMatrix(self) -> bool:
+        # A distance matrix stores all distances in its dense matrix
+        return True
+
+    def getIndexCount(self) -> int:
+        # Return the number of matrix indices (rows)
+        return self.matrix.shape[0]
+
+    def getBuildingIndex(self, building: Element) -> int:
+        # Use the building index dictionary to resolve the matrix index of the building
+        return self.buildingIndexDictionary[building]
+
+    def getDistances(self, sourceIndices: np.ndarray, destinationIndices: np.ndarray) -> np.ndarray:
+        # Use the fancy indexing of numpy to get the element wise distances between the index arrays
+        return self.matrix[sourceIndices, destinationIndices]
+
+    def getBuildingDistance(self, sourceBuilding: Element, destinationBuilding: Element) -> float:
+        # Resolve the indices of both buildings and return the distance between them
+        return self.matrix.item(self.buildingIndexDictionary[sourceBuilding], self.buildingIndexDictionary[destinationBuilding])
+
+    ################################################################################
+    ############################### CLASS FUNCTIONS ################################
+    ################################################################################
+
+    def __getitem__(self, building: Element) -> 'DistanceMatrixRow':
+        # Create a lightweight row view for the dict-of-dicts compatibility access
+        return DistanceMatrixRow(self, self.buildingIndexDictionary[building])
+
+    def __iter__(self):
+        # Iterate over the unique buildings in the order of their first appearance
+        return iter(self.buildingList)
+
+    def __len__(self) -> int:
+        # Return the number of unique buildings
+        return len(self.buildingList)
+
+    def __contains__(self, building: object) -> bool:
+        # Use the building index dictionary to check if the building is part of the matrix
+        return building in self.buildingIndexDictionary
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def CalculateMatrix(buildingList: list[Element], distanceModel: DistanceModel = DistanceModel.WGS84) -> np.ndarray:
+        # Use the vectorized many-to-many distance function of the elements to calculate the symmetric matrix at once
+        return Element.GetDistanceMatrix(buildingList, None, distanceModel)
+
+################################################################################
+################################ SUPPORT CLASSES ###############################
+################################################################################
+
+class DistanceMatrixRow(Mapping):
+    # Constructor the distance matrix row with given arguemnts
+    def __init__(self, distanceMatrix: DistanceMatrix, rowIndex: int):
+        # Save the distance matrix the row belongs to
+        self.distanceMatrix = distanceMatrix
+
+        # Save the index of the row in the distance matrix
+        self.rowIndex = rowIndex
+
+    ################################################################################
+    ############################### CLASS FUNCTIONS ################################
+    ################################################################################
+
+    def __getitem__(self, building: Element) -> float:
+        # Resolve the column index of the building and return the distance from the matrix
+        return self.distanceMatrix.getDistance(self.rowIndex, self.distanceMatrix.getBuildingIndex(building))
+
+    def __iter__(self):
+        # Resolve the buildings of the matrix to map the sorted indices back to buildings
+        buildingList = self.distanceMatrix.getBuildingList()
+
+        # Resolve the row distances of all buildings with their matrix index (buildings can share a matrix index)
+        rowDistances = self.distanceMatrix.getDistances(self.rowIndex, self.distanceMatrix.getBuildingIndexArray())
+
+        # Iterate over the buildings sorted by distance (stable to keep the appearance order for equal distances)
+        return (buildingList[index] for index in np.argsort(rowDistances, kind='stable'))
+
+    def __len__(self) -> int:
+        # Return the number of buildings in the row
+        return len(self.distanceMatrix)
+
+    def __contains__(self, building: object) -> bool:
+        # Use the distance matrix to check if the building is part of the row
+        return building in self.distanceMatrix
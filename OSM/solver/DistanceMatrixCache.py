@@ -0,0 +1,202 @@
+import os
+import hashlib
+import tempfile
+import warnings
+
+import numpy as np
+
+from osm.Element import Element
+from osm.DistanceModel import DistanceModel
+
+from .DistanceMatrix import DistanceMatrix
+
+class DistanceMatrixCache():
+    # Define constants for the distance matrix cache class
+    CACHE_FORMAT_VERSION = 1
+    CACHE_FILE_EXTENSION = '.npy'
+
+    # Constructor the distance matrix cache with given arguemnts
+    def __init__(self, cacheDirectory: str = './cache', maximumCacheSize: int = 1 << 30):
+        # Save the directory of the cache files
+        self.cacheDirectory = cacheDirectory
+
+        # Save the maximum size of all cache files [byte]
+        self.maximumCacheSize = maximumCacheSize
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getCacheDirectory(self) -> str:
+        # Return the cacheDirectory
+        return self.cacheDirectory
+
+    def getMaximumCacheSize(self) -> int:
+        # Return the maximumCacheSize
+        return self.maximumCacheSize
+
+    ################################################################################
+    ################################ CACHE FUNCTIONS ###############################
+    ################################################################################
+
+    def getDistanceMatrix(self, buildingList: list[Element], distanceModel: DistanceModel = DistanceModel.WGS84) -> DistanceMatrix:
+        # Resolve the unique buildings in the order of their first appearance (like the distance matrix does)
+        uniqueBuildingList = list(dict.fromkeys(buildingList))
+
+        # Sort the unique coordinates into a canonical order so any permutation of the buildings shares the same cache entry
+        canonicalCoordinates, buildingIndexList = np.unique(Element.GetCoordinateArray(uniqueBuildingList), axis=0, return_inverse=True)
+
+        # Calculate the fingerprint of the canonical coordinates and distance model as the cache key
+        fingerprint = DistanceMatrixCache.CalculateFingerprint(canonicalCoordinates, distanceModel)
+
+        # Try to open the memory-mapped matrix of the fingerprint from the cache
+        matrix = self.loadMatrix(fingerprint, len(canonicalCoordinates))
+
+        # Check if the matrix is not cached yet
+        if matrix is None:
+            # Calculate the matrix for the canonical coordinates and save it into the cache
+            matrix = Element.GetDistanceMatrix(canonicalCoordinates, None, distanceModel)
+            self.storeMatrix(fingerprint, matrix)
+
+        # Create the distance matrix that remaps each building onto the row of its canonical coordinates
+        return DistanceMatrix(uniqueBuildingList, distanceModel, matrix, buildingIndexList.reshape(-1).tolist())
+
+    def loadMatrix(self, fingerprint: str, matrixSize: int = None) -> np.ndarray | None:
+        # Resolve the path of the cache file
+        cacheFilePath = self.getCacheFilePath(fingerprint)
+
+        # Check if the cache file exists
+        if not os.path.isfile(cacheFilePath): return None
+
+        # Try to open the cache file memory-mapped and read-only so no data is loaded or copied upfront
+        try: matrix = np.load(cacheFilePath, mmap_mode='r')
+
+        # Catch the exception and warn the user about the corrupt cache file
+        except (OSError, ValueError) as ex:
+            warnings.warn(f'Loading of distance matrix cache file {cacheFilePath} failed: {ex}', RuntimeWarning, stacklevel=2)
+            return None
+
+        # Check if the cached matrix has the expected square shape and warn the user about the corrupt cache file
+        if (matrix.ndim != 2) or (matrix.shape[0] != matrix.shape[1]) or ((matrixSize is not None) and (matrix.shape[0] != matrixSize)):
+            warnings.warn(f'Loading of distance matrix cache file {cacheFilePath} failed: unexpected matrix shape {matrix.shape}', RuntimeWarning, stacklevel=2)
+            return None
+
+        # Update the modification time of the cache file to mark it as recently used for the eviction
+        try: os.utime(cacheFilePath)
+
+        # Ignore read-only cache directories, the entry is still usable
+        except OSError: pass
+
+        # Return the memory-mapped matrix
+        return matrix
+
+    def storeMatrix(self, fingerprint: str, matrix: np.ndarray) -> bool:
+        # Set the temporary file path as not created yet
+        temporaryFilePath = None
+
+        # Try to write the cache file
+        try:
+            # Create the cache directory if necesarry
+            os.makedirs(self.cacheDirectory, exist_ok=True)
+
+            # Write the matrix into a temporary file of the cache directory first
+            fileDescriptor, temporaryFilePath = tempfile.mkstemp(suffix='.tmp', dir=self.cacheDirectory)
+
+            # Open the temporary file descriptor and save the matrix in the numpy format
+            with os.fdopen(fileDescriptor, 'wb') as temporaryFile: np.save(temporaryFile, matrix)
+
+            # Replace the cache file atomically so parallel processes never see a partial file
+            os.replace(temporaryFilePath, self.getCacheFilePath(fingerprint))
+
+        # Catch the exception and warn the user about the failed write
+        except OSError as ex:
+            # Try to remove the partial temporary file (ignore it if it was never created or already moved)
+            if temporaryFilePath is not None:
+                try: os.remove(temporaryFilePath)
+                except OSError: pass
+
+            warnings.warn(f'Saving of distance matrix cache file into {self.cacheDirectory} failed: {ex}', RuntimeWarning, stacklevel=2)
+            return False
+
+        # Evict the least recently used cache files if the cache exceeds the maximum size
+        self.evictEntries(fingerprint)
+
+        # Cache write worked
+        return True
+
+    def evictEntries(self, keepFingerprint: str = None) -> list[str]:
+        # Create an empty list for the evicted fingerprints
+        evictedFingerprintList = []
+
+        # Resolve the paths of all cache files with their size and modification time
+        cacheFileList = self.getCacheFileList()
+
+        # Sum up the size of all cache files
+        cacheSize = sum(cacheFile[1] for cacheFile in cacheFileList)
+
+        # Loop through the cache files from the least to the most recently used one
+        for cacheFilePath, cacheFileSize, _ in sorted(cacheFileList, key=lambda x: x[2]):
+            # Check if the cache size is within the limit
+            if cacheSize <= self.maximumCacheSize: break
+
+            # Resolve the fingerprint of the cache file
+            fingerprint = os.path.basename(cacheFilePath)[:-len(DistanceMatrixCache.CACHE_FILE_EXTENSION)]
+
+            # Check if the cache file should be kept (e.g. the just written entry)
+            if fingerprint == keepFingerprint: continue
+
+            # Try to remove the cache file (open memory maps of other processes stay valid)
+            try: os.remove(cacheFilePath)
+
+            # Ignore files that were already removed by another process
+            except OSError: continue
+
+            # Update the cache size and save the evicted fingerprint
+            cacheSize -= cacheFileSize
+            evictedFingerprintList.append(fingerprint)
+
+        # Return the list of evicted fingerprints
+        return evictedFingerprintList
+
+    def getCacheFilePath(self, fingerprint: str) -> str:
+        # Join the cache directory and the fingerprint with the file extension
+        return os.path.join(self.cacheDirectory, fingerprint + DistanceMatrixCache.CACHE_FILE_EXTENSION)
+
+    def getCacheFileList(self) -> list[tuple[str, int, float]]:
+        # Check if the cache directory exists
+        if not os.path.isdir(self.cacheDirectory): return []
+
+        # Create an empty list for the cache files
+        cacheFileList = []
+
+        # Loop through the entries of the cache directory
+        for directoryEntry in os.scandir(self.cacheDirectory):
+            # Check if the entry is a cache file
+            if not directoryEntry.name.endswith(DistanceMatrixCache.CACHE_FILE_EXTENSION): continue
+
+            # Try to resolve the size and modification time of the cache file
+            try: fileStat = directoryEntry.stat()
+
+            # Ignore files that were removed in the meantime
+            except OSError: continue
+
+            # Add the path, size and modification time of the cache file
+            cacheFileList.append((directoryEntry.path, fileStat.st_size, fileStat.st_mtime))
+
+        # Return the list of cache files
+        return cacheFileList
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def CalculateFingerprint(canonicalCoordinates: np.ndarray, distanceModel: DistanceModel) -> str:
+        # Create a hash with the cache format version and the distance model as a prefix
+        fingerprintHash = hashlib.sha256(f'{DistanceMatrixCache.CACHE_FORMAT_VERSION}:{distanceModel.label}:'.encode())
+
+        # Add the raw bytes of the canonical coordinates to the hash
+        fingerprintHash.update(np.ascontiguousarray(canonicalCoordinates, dtype=np.float64).tobytes())
+
+        # Return the hex representation of the hash as the fingerprint
+        return fingerprintHash.hexdigest()
@@ -6,6 +6,7 @@ class ExitCode(Enum):
     ORDER_NOT_IN_RANGE = (1)
     NO_CHARGING_STATION_IN_RANGE = (2)
     NO_SOLUTION = (3)
+    NODE_BUDGET_EXCEEDED = (4)
 
     # Constructor for setting custom parameter
     def __init__(self, codeIndex: int):
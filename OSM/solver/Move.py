@@ -0,0 +1,84 @@
+from simulation.Drone import Drone
+
+from .MoveType import MoveType
+
+class Move():
+    # Define the memory layout of the move (no instance dict)
+    __slots__ = ('moveType', 'sourceDrone', 'destinationDrone', 'sourceIndex', 'destinationIndex', 'lengthDelta', 'timeScore', 'timeScoreDelta')
+
+    # Constructor the move with given arguemnts
+    def __init__(self, moveType: MoveType, sourceDrone: Drone, destinationDrone: Drone, sourceIndex: int, destinationIndex: int, lengthDelta: float):
+        # Save the type of the move
+        self.moveType = moveType
+
+        # Save the drones of the changed tours (the same drone for two-opt moves)
+        self.sourceDrone = sourceDrone
+        self.destinationDrone = destinationDrone
+
+        # Save the indices of the move in the tours without charging orders
+        self.sourceIndex = sourceIndex
+        self.destinationIndex = destinationIndex
+
+        # Save the distance delta of the move
+        self.lengthDelta = lengthDelta
+
+        # Set the time score and time score delta of the moved solution as not evaluated yet
+        self.timeScore = None
+        self.timeScoreDelta = None
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getMoveType(self) -> MoveType:
+        # Return the moveType
+        return self.moveType
+
+    def getSourceDrone(self) -> Drone:
+        # Return the sourceDrone
+        return self.sourceDrone
+
+    def getDestinationDrone(self) -> Drone:
+        # Return the destinationDrone
+        return self.destinationDrone
+
+    def getSourceIndex(self) -> int:
+        # Return the sourceIndex
+        return self.sourceIndex
+
+    def getDestinationIndex(self) -> int:
+        # Return the destinationIndex
+        return self.destinationIndex
+
+    def getLengthDelta(self) -> float:
+        # Return the lengthDelta
+        return self.lengthDelta
+
+    def getTimeScore(self) -> float | None:
+        # Return the timeScore
+        return self.timeScore
+
+    def getTimeScoreDelta(self) -> float | None:
+        # Return the timeScoreDelta
+        return self.timeScoreDelta
+
+    ################################################################################
+    ############################### SETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def setTimeScore(self, timeScore: float, currentTimeScore: float):
+        # Save the time score of the moved solution and the delta to the current solution
+        self.timeScore = timeScore
+        self.timeScoreDelta = round(timeScore - currentTimeScore, 2)
+
+    ################################################################################
+    ################################ CLASS FUNCTIONS ###############################
+    ################################################################################
+
+    # Overwrite the string representation
+    def __str__(self):
+        return f'Move(type={self.moveType.label}, source={self.sourceDrone.getId()}:{self.sourceIndex}, destination={self.destinationDrone.getId()}:{self.destinationIndex}, lengthDelta={self.lengthDelta})'
+
+    # Overwrite the class representation
+    def __repr__(self):
+        return f'Move(type={self.moveType.label}, source={self.sourceDrone.getId()}:{self.sourceIndex}, destination={self.destinationDrone.getId()}:{self.destinationIndex}, lengthDelta={self.lengthDelta})'
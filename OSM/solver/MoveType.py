@@ -0,0 +1,39 @@
+from enum import Enum
+
+class MoveType(Enum):
+    # Define the neighborhood move types
+    TWO_OPT = ('two-opt')
+    RELOCATE = ('relocate')
+    EXCHANGE = ('exchange')
+    CROSS = ('cross')
+
+    # Constructor for setting custom parameter
+    def __init__(self, label):
+        # Set the type parameters
+        self.label = label
+
+    # Define a getByName function for conversion
+    @staticmethod
+    def from_str(label: str) -> 'MoveType':
+        # Check if the move is a two-opt move
+        if label.upper() in ('TWO-OPT', 'TWO_OPT', '2-OPT'):
+            # Return the two-opt enum type
+            return MoveType.TWO_OPT
+
+        # Check if the move is a relocate move
+        if label.upper() in ('RELOCATE', 'SHIFT'):
+            # Return the relocate enum type
+            return MoveType.RELOCATE
+
+        # Check if the move is an exchange move
+        if label.upper() in ('EXCHANGE', 'SWAP'):
+            # Return the exchange enum type
+            return MoveType.EXCHANGE
+
+        # Check if the move is a cross move
+        if label.upper() in ('CROSS', 'CROSSOVER'):
+            # Return the cross enum type
+            return MoveType.CROSS
+
+        # If no match is found throw an error
+        raise NotImplementedError
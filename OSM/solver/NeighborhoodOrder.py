@@ -0,0 +1,39 @@
+from enum import Enum
+
+class NeighborhoodOrder(Enum):
+    # Define the orders the neighborhood moves are generated in
+    SEQUENTIAL = ('sequential')
+    RANDOM = ('random')
+    NEAREST_NEIGHBOR = ('nearest-neighbor')
+    ESTIMATED_DELTA = ('estimated-delta')
+
+    # Constructor for setting custom parameter
+    def __init__(self, label):
+        # Set the type parameters
+        self.label = label
+
+    # Define a getByName function for conversion
+    @staticmethod
+    def from_str(label: str) -> 'NeighborhoodOrder':
+        # Check if the moves are generated in the order of the order list
+        if label.upper() in ('SEQUENTIAL', 'DEFAULT'):
+            # Return the sequential enum type
+            return NeighborhoodOrder.SEQUENTIAL
+
+        # Check if the moves are generated in a random order
+        if label.upper() in ('RANDOM', 'SHUFFLE'):
+            # Return the random enum type
+            return NeighborhoodOrder.RANDOM
+
+        # Check if the moves are generated with the drones of the nearest orders first
+        if label.upper() in ('NEAREST-NEIGHBOR', 'NEAREST_NEIGHBOR', 'NEAREST'):
+            # Return the nearest neighbor enum type
+            return NeighborhoodOrder.NEAREST_NEIGHBOR
+
+        # Check if the moves are generated with the orders of the largest estimated delta first
+        if label.upper() in ('ESTIMATED-DELTA', 'ESTIMATED_DELTA', 'DELTA'):
+            # Return the estimated delta enum type
+            return NeighborhoodOrder.ESTIMATED_DELTA
+
+        # If no match is found throw an error
+        raise NotImplementedError
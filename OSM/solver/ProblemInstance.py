@@ -0,0 +1,257 @@
+import numpy as np
+
+from simulation.Drone import Drone
+from simulation.Order import Order
+
+from model.Depot import Depot
+from model.Building import Building
+from model.ChargingStation import ChargingStation
+
+from osm.DistanceModel import DistanceModel
+
+from .DistanceMatrix import DistanceMatrix
+from .DistanceMatrixCache import DistanceMatrixCache
+from .SparseDistanceMatrix import SparseDistanceMatrix
+from .SpatialIndex import SpatialIndex
+from .ChargingStationTable import ChargingStationTable
+from .ZobristTable import ZobristTable
+
+class ProblemInstance():
+    # Define the default number of nearest orders kept per order in the neighborhood matrix
+    DEFAULT_NEIGHBORHOOD_SIZE = 25
+
+    # Define the default memory budget of the distances before switching to the sparse distance matrix [byte]
+    DEFAULT_DISTANCE_MEMORY_BUDGET = 1 << 30
+
+    # Define the dwell time of the charging orders [s]
+    CHARGING_ORDER_DWELL_TIME = 900
+
+    # Define the compact order codes of the depot and the first charging station (charging stations count downwards)
+    DEPOT_ORDER_CODE = -1
+    CHARGING_ORDER_CODE_OFFSET = -2
+
+    # Constructor the problem instance with given arguemnts
+    def __init__(self, droneList: list[Drone], depot: Depot, chargingStationList: list[ChargingStation], orderList: list[Order], distanceModel: DistanceModel = DistanceModel.WGS84, distanceCache: DistanceMatrixCache = None,
+        neighborhoodSize: int = DEFAULT_NEIGHBORHOOD_SIZE, distanceMemoryBudget: int = DEFAULT_DISTANCE_MEMORY_BUDGET):
+        # Save the list of drones
+        self.droneList = droneList
+
+        # Save the depot
+        self.depot = depot
+
+        # Save the list of charging stations as a set
+        self.chargingStationList = set(chargingStationList)
+
+        # Save the list of orders
+        self.orderList = orderList
+
+        # Merged building list of depot, charging stations and order destinations for distance precalculation
+        self.buildingList = [depot] + chargingStationList + [order.getDestination() for order in orderList]
+
+        # Precalculate the distance matrix between the different buildings with the given distance model (or load it from the cache or use a sparse one within the memory budget)
+        self.distanceMatrix = ProblemInstance.CalculateDistanceMatrix(self.buildingList, distanceModel, distanceCache, [depot] + chargingStationList, neighborhoodSize, distanceMemoryBudget)
+
+        # Precalculate the matrix index of each order destination for a constant time index lookup
+        self.orderIndexDictionary = OrderIndexDictionary(self.distanceMatrix, self.orderList)
+
+        # Precalculate the closest and the distance sorted charging stations of each building for the constant time range checks
+        self.chargingStationTable = ChargingStationTable(self.distanceMatrix, chargingStationList)
+
+        # Create a spatial index over the unique buildings of the distance matrix for the k-nearest neighbor queries
+        self.spatialIndex = SpatialIndex(self.distanceMatrix.getBuildingList())
+
+        # Precalculate the truncated order neighborhood matrix with a spatial index for improved neighborhood search alogirthms
+        self.orderNeighborhoodMatrix = ProblemInstance.CalculateOrderNeighborhoodMatrix(self.orderList, self.distanceMatrix, neighborhoodSize)
+
+        # Create a dictionary with the position of each order in the order list as its compact order code
+        self.orderCodeDictionary = dict(map(reversed, enumerate(self.orderList)))
+
+        # Create a dictionary with the position of each charging station in the charging station table as its compact order code
+        self.chargingStationCodeDictionary = dict((chargingStation, ProblemInstance.CHARGING_ORDER_CODE_OFFSET - chargingStationIndex)
+            for chargingStationIndex, chargingStation in enumerate(self.chargingStationTable.getChargingStationList()))
+
+        # Create the shared depot and charging orders the compact order codes are decoded into
+        self.depotOrder = Order(depot)
+        self.chargingOrderList = [Order(chargingStation, 0, ProblemInstance.CHARGING_ORDER_DWELL_TIME) for chargingStation in self.chargingStationTable.getChargingStationList()]
+
+        # Create the random keys of the drone tour edges (over all order codes) for the incremental fingerprints of the solutions
+        self.zobristTable = ZobristTable(self.droneList, range(ProblemInstance.CHARGING_ORDER_CODE_OFFSET - len(self.chargingOrderList) + 1, len(self.orderList)))
+
+        # Set the statistics of the granular neighborhoods and the route pruning
+        self.skippedCandidateCount = 0
+        self.prunedCandidateCount = 0
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getDroneList(self) -> list[Drone]:
+        # Return the droneList
+        return self.droneList
+
+    def getDepot(self) -> Depot:
+        # Return the depot
+        return self.depot
+
+    def getChargingStationList(self) -> list[ChargingStation]:
+        # Return the chargingStationList
+        return self.chargingStationList
+
+    def getOrderList(self) -> list[Order]:
+        # Return the orderList
+        return self.orderList
+
+    def getBuildingList(self) -> list[Building]:
+        # Return the buildingList
+        return self.buildingList
+
+    def getDistanceModel(self) -> DistanceModel:
+        # Return the distanceModel of the distanceMatrix
+        return self.distanceMatrix.getDistanceModel()
+
+    def getDistanceMatrix(self) -> DistanceMatrix:
+        # Return the distanceMatrix
+        return self.distanceMatrix
+
+    def getOrderIndexDictionary(self) -> dict[Order, int]:
+        # Return the orderIndexDictionary
+        return self.orderIndexDictionary
+
+    def getChargingStationTable(self) -> ChargingStationTable:
+        # Return the chargingStationTable
+        return self.chargingStationTable
+
+    def getSpatialIndex(self) -> SpatialIndex:
+        # Return the spatialIndex
+        return self.spatialIndex
+
+    def getOrderNeighborhoodMatrix(self) -> dict[Order, list[Order]]:
+        # Return the orderNeighborhoodMatrix
+        return self.orderNeighborhoodMatrix
+
+    def getDepotOrder(self) -> Order:
+        # Return the depotOrder
+        return self.depotOrder
+
+    def getZobristTable(self) -> ZobristTable:
+        # Return the zobristTable
+        return self.zobristTable
+
+    def getSkippedCandidateCount(self) -> int:
+        # Return the skippedCandidateCount
+        return self.skippedCandidateCount
+
+    def addSkippedCandidateCount(self, candidateCount: int):
+        # Increase the number of candidates that were skipped by the granular neighborhoods
+        self.skippedCandidateCount += candidateCount
+
+    def getPrunedCandidateCount(self) -> int:
+        # Return the prunedCandidateCount
+        return self.prunedCandidateCount
+
+    def addPrunedCandidateCount(self, candidateCount: int):
+        # Increase the number of candidates that were skipped by the route pruning
+        self.prunedCandidateCount += candidateCount
+
+    def resetStatistics(self):
+        # Reset the statistics of the granular neighborhoods and the route pruning
+        self.skippedCandidateCount = 0
+        self.prunedCandidateCount = 0
+
+    ################################################################################
+    ############################# ORDER CODE FUNCTIONS #############################
+    ################################################################################
+
+    def getOrderCode(self, order: Order) -> int:
+        # Check if the order is part of the order list and return its position
+        orderCode = self.orderCodeDictionary.get(order)
+        if orderCode is not None: return orderCode
+
+        # Check if the order is a depot order (start and return-to-start orders)
+        if order.getDestination() == self.depot: return ProblemInstance.DEPOT_ORDER_CODE
+
+        # Check if the order is a charging order
+        orderCode = self.chargingStationCodeDictionary.get(order.getDestination())
+        if orderCode is not None: return orderCode
+
+        # Order is not part of the problem instance
+        raise Exception("Corrupt Solution - Order is not part of the problem instance")
+
+    def getOrderByCode(self, orderCode: int) -> Order:
+        # Check if the code is the position in the order list
+        if orderCode >= 0: return self.orderList[orderCode]
+
+        # Check if the code is the depot order
+        if orderCode == ProblemInstance.DEPOT_ORDER_CODE: return self.depotOrder
+
+        # Resolve the shared charging order by the position of the charging station
+        return self.chargingOrderList[ProblemInstance.CHARGING_ORDER_CODE_OFFSET - orderCode]
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def CalculateDistanceMatrix(buildingList: list[Building], distanceModel: DistanceModel = DistanceModel.WGS84, distanceCache: DistanceMatrixCache = None, anchorBuildingList: list[Building] = None,
+        neighborhoodSize: int = DEFAULT_NEIGHBORHOOD_SIZE, distanceMemoryBudget: int = DEFAULT_DISTANCE_MEMORY_BUDGET) -> DistanceMatrix:
+        # Check if the dense matrix of the unique buildings exceeds the memory budget to store only the nearest neighbor and anchor distances (depot and charging stations)
+        if (len(set(buildingList)) ** 2) * np.dtype(np.float64).itemsize > distanceMemoryBudget:
+            # Create the sparse distance matrix that calculates all other distances on demand within the memory budget
+            return SparseDistanceMatrix(buildingList, distanceModel, anchorBuildingList, neighborhoodSize, distanceMemoryBudget)
+
+        # Check if a distance cache is set to open the persistent matrix instead of calculating it
+        if distanceCache is not None: return distanceCache.getDistanceMatrix(buildingList, distanceModel)
+
+        # Create the index based distance matrix (rows of the matrix iterate sorted by distance for the dict compatibility)
+        return DistanceMatrix(buildingList, distanceModel)
+
+    @staticmethod
+    def CalculateOrderNeighborhoodMatrix(orderList: list[Order], distanceMatrix: DistanceMatrix, neighborhoodSize: int = DEFAULT_NEIGHBORHOOD_SIZE) -> dict[Order, list[Order]]:
+        # Create a spatial index over the order destinations to query the nearest orders without sorting all distances
+        orderSpatialIndex = SpatialIndex([order.getDestination() for order in orderList])
+
+        # Query the nearest orders of all orders at once (one more to skip the order itself)
+        _, nearestIndices = orderSpatialIndex.queryNearestIndices(orderSpatialIndex.getElementList(), neighborhoodSize + 1)
+
+        # Create an empty dictionary for the order neighborhood
+        orderNeighborhoodMatrix = dict()
+
+        # Loop through the order list once
+        for orderIndex, order in enumerate(orderList):
+            # Resolve the nearest orders without the order itself (truncated to the neighborhood size)
+            neighborhoodOrderList = [orderList[index] for index in nearestIndices[orderIndex] if index != orderIndex][:neighborhoodSize]
+
+            # Rank the nearest orders by the exact distance of the distance matrix
+            orderNeighborhoodMatrix[order] = ProblemInstance.RankByDistance(distanceMatrix, order.getDestination(), neighborhoodOrderList)
+
+        # Return the order neighborhood matrix
+        return orderNeighborhoodMatrix
+
+    @staticmethod
+    def RankByDistance(distanceMatrix: DistanceMatrix, sourceBuilding: Building, candidateList: list[Building | Order]) -> list[Building | Order]:
+        # Resolve the matrix indices of the candidates (orders by their destination)
+        candidateIndices = np.array([distanceMatrix.getBuildingIndex(candidate.getDestination() if isinstance(candidate, Order)
+            else candidate) for candidate in candidateList], dtype=np.intp)
+
+        # Resolve the distances between the source building and all candidates at once
+        candidateDistances = distanceMatrix.getDistances(np.full(len(candidateIndices), distanceMatrix.getBuildingIndex(sourceBuilding)), candidateIndices)
+
+        # Sort the candidates by their distance (stable to keep the spatial index order for equal distances)
+        return [candidateList[index] for index in np.argsort(candidateDistances, kind='stable')]
+
+################################################################################
+################################ SUPPORT CLASSES ###############################
+################################################################################
+
+class OrderIndexDictionary(dict):
+    # Constructor the order index dictionary with given arguemnts
+    def __init__(self, distanceMatrix: DistanceMatrix, orderList: list[Order]):
+        # Use the built-in dict constructor to save the matrix index of each order destination
+        super().__init__((order, distanceMatrix.getBuildingIndex(order.getDestination())) for order in orderList)
+
+        # Save the distance matrix for the fallback of unknown orders
+        self.distanceMatrix = distanceMatrix
+
+    def __missing__(self, order: Order) -> int:
+        # Fallback to the destination index for orders that are created later on (depot and charging orders) without storing them
+        return self.distanceMatrix.getBuildingIndex(order.getDestination())
@@ -1,5 +1,12 @@
-from copy import copy
-from typing import Self
+import random
+import numpy as np
+
+from typing import Self, Iterator, Iterable
+
+from bisect import bisect_left, bisect_right
+
+from itertools import accumulate
+from collections import deque
 
 from simulation.Drone import Drone
 from simulation.Order import Order
@@ -8,48 +15,115 @@ from model.Depot import Depot
 from model.Building import Building
 from model.ChargingStation import ChargingStation
 
+from osm.Element import Element
+from osm.DistanceModel import DistanceModel
+
+from .DistanceMatrix import DistanceMatrix
+from .SpatialIndex import SpatialIndex
+from .ChargingStationTable import ChargingStationTable
+from .ProblemInstance import ProblemInstance
+from .CompactSolution import CompactSolution
+from .Move import Move
+from .MoveType import MoveType
+from .NeighborhoodOrder import NeighborhoodOrder
+from .TourTimeTable import TourTimeTable
+from .ChargingProfile import ChargingProfile
+
 class Solution():
     # Define constants for the solution class
     FLOAT_POSITIVE_INFINITY = float('+inf')
     FLOAT_NEGATIVE_INFINITY = float('-inf')
 
+    # Define the relative tolerance of the delta evaluated time score to the next rounding boundary (closer scores are evaluated fully)
+    TIME_SCORE_ROUNDING_TOLERANCE = 1e-9
+
+    # Define the margin of the length delta lower bounds to the upper boundary (covers the rounding of the length deltas to two decimals)
+    LENGTH_DELTA_ROUNDING_MARGIN = 0.01
+
+    # Define the minimum number of partner tour indices that are evaluated as one batch (fewer are evaluated one by one)
+    BATCH_EVALUATION_MINIMUM = 16
+
+    # Define the number of orders above which the two-opt pairs of a tour are restricted to the nearest orders
+    TWO_OPT_NEIGHBOR_TOUR_LENGTH = 100
+
+    # Define the default number of rejected candidates after which the sampling of a random move gives up
+    DEFAULT_SAMPLE_ATTEMPT_COUNT = 100
+
+    # Define the memory layout of the solution (no instance dict, the shared data lives in the problem instance)
+    __slots__ = ('problemInstance', 'droneList', 'chargingStationList', 'orderList', 'distanceMatrix', 'orderIndexDictionary', 'chargingStationTable', 'solutionMatrix',
+        'tourMetricDictionary', 'timeScore', 'tourViewDictionary', 'orderPositionDictionary', 'tourTimeTable', 'tourPrefixDictionary',
+        'tourIndexDictionary', 'tourIndexArrayDictionary', 'tourSummaryDictionary', 'chargingProfileDictionary', 'chargingTourTimeDictionary', 'sharedCacheFlag', 'fingerprint')
+
     # Constructor the solution with given arguemnts
-    def __init__(self, droneList: list[Drone], depot: Depot, chargingStationList: list[ChargingStation], orderList: list[Order]):
-        # Save the list of drones
-        self.droneList = droneList
+    def __init__(self, problemInstance: ProblemInstance):
+        # Save the shared problem instance
+        self.problemInstance = problemInstance
 
-        # Save the depot
-        self.depot = depot
+        # Save references of the frequently used shared data for the direct access
+        self.droneList = problemInstance.getDroneList()
+        self.chargingStationList = problemInstance.getChargingStationList()
+        self.orderList = problemInstance.getOrderList()
+        self.distanceMatrix = problemInstance.getDistanceMatrix()
+        self.orderIndexDictionary = problemInstance.getOrderIndexDictionary()
+        self.chargingStationTable = problemInstance.getChargingStationTable()
 
-        # Save the list of charging stations as a set
-        self.chargingStationList = set(chargingStationList)
+        # Create and prefilled solution matrix with the drones as key and value list of orders (starting with the shared depot order)
+        self.solutionMatrix = dict(map(lambda drone: (drone, [problemInstance.getDepotOrder()]), self.droneList))
 
-        # Save the list of orders
-        self.orderList = orderList
+        # Create an empty cache for the tour metrics (distance, dwell and tour time) of each drone tour with charging orders
+        self.tourMetricDictionary = dict()
 
-        # Merged building list of depot, charging stations and order destinations for distance precalculation
-        self.buildingList = [depot] + chargingStationList + [order.getDestination() for order in orderList]
+        # Set the cached time score as not calculated yet
+        self.timeScore = None
 
-        # Precalculate the distance matrix between the different buildings 
-        self.distanceMatrix = Solution.CalculateDistanceMatrix(self.buildingList)
+        # Create an empty cache for the drone tours without charging orders
+        self.tourViewDictionary = dict()
 
-        # Precalculate the order neighborhood matrix with the distance matrix for improved neighborhood search alogirthms
-        self.orderNeighborhoodMatrix = Solution.CalculateOrderNeighborhoodMatrix(self.orderList, self.distanceMatrix)
-        
-        # Create and prefilled solution matrix with the drones as key and value list of orders
-        self.solutionMatrix = dict(map(lambda drone: (drone, [Order(depot)]), self.droneList))
+        # Set the order position index (drone and position in the tour without charging orders) as not created yet
+        self.orderPositionDictionary = None
+
+        # Set the tour time table (sum, largest and smallest tour times) as not created yet
+        self.tourTimeTable = None
+
+        # Create an empty cache for the prefix distances and dwell times of the drone tours without charging orders
+        self.tourPrefixDictionary = dict()
+
+        # Create an empty cache for the matrix indices of the drone tours without charging orders
+        self.tourIndexDictionary = dict()
+
+        # Create an empty cache for the matrix index arrays of the drone tours without charging orders (for the batch evaluation of the moves)
+        self.tourIndexArrayDictionary = dict()
+
+        # Create an empty cache for the spatial summary (center, radius and longest edge) of the drone tours without charging orders
+        self.tourSummaryDictionary = dict()
+
+        # Create an empty cache for the charging profiles (prefix and closest charging station distances) of the drone tours without charging orders
+        self.chargingProfileDictionary = dict()
+
+        # Create an empty cache for the tour times with the optimal charging stops of the drone tours without charging orders
+        self.chargingTourTimeDictionary = dict()
+
+        # Set the per drone caches as owned by the solution (not shared with a copy)
+        self.sharedCacheFlag = False
+
+        # Set the zobrist fingerprint of the drone tours without charging orders as not calculated yet
+        self.fingerprint = None
 
     ################################################################################
     ############################### GETTER FUNCTIONS ###############################
     ################################################################################
 
+    def getProblemInstance(self) -> ProblemInstance:
+        # Return the problemInstance
+        return self.problemInstance
+
     def getDroneList(self) -> list[Drone]:
         # Return the droneList
         return self.droneList
     
     def getDepot(self) -> Depot:
-        # Return the depot
-        return self.depot
+        # Return the depot of the problemInstance
+        return self.problemInstance.getDepot()
     
     def getChargingStationList(self) -> list[ChargingStation]:
         # Return the chargingStationList
@@ -60,18 +134,35 @@ class Solution():
         return self.orderList
     
     def getBuildingList(self) -> list[Building]:
-        # Return the buildingList
-        return self.buildingList
+        # Return the buildingList of the problemInstance
+        return self.problemInstance.getBuildingList()
 
-    def getDistanceMatrix(self) -> dict[Building, dict[Building, float]]:
+    def getDistanceModel(self) -> DistanceModel:
+        # Return the distanceModel of the distanceMatrix
+        return self.distanceMatrix.getDistanceModel()
+
+    def getDistanceMatrix(self) -> DistanceMatrix:
         # Return the distanceMatrix
         return self.distanceMatrix
     
+    def getOrderIndexDictionary(self) -> dict[Order, int]:
+        # Return the orderIndexDictionary
+        return self.orderIndexDictionary
+
+    def getChargingStationTable(self) -> ChargingStationTable:
+        # Return the chargingStationTable
+        return self.chargingStationTable
+
+    def getSpatialIndex(self) -> SpatialIndex:
+        # Return the spatialIndex of the problemInstance
+        return self.problemInstance.getSpatialIndex()
+
     def getOrderNeighborhoodMatrix(self) -> dict[Order, list[Order]]:
-        # Return the orderNeighborhoodMatrix
-        return self.orderNeighborhoodMatrix
+        # Return the orderNeighborhoodMatrix of the problemInstance
+        return self.problemInstance.getOrderNeighborhoodMatrix()
     
     def getSolutionMatrix(self) -> dict[Drone, list[Order]]:
+        # Hint: Changing the drone tours in place requires a call of invalidateDroneTours afterwards
         # Return the solutionMatrix
         return self.solutionMatrix
 
@@ -88,333 +179,1259 @@ class Solution():
         # sum(distance of each drone) * (1 + (longestDroneDistance - shortestDroneDistance))
 
     def getTimeScore(self) -> float:
-        # Get the tour time list of all drones as a factor for the score calculation
-        droneTourTimeList = [self.getDroneTourTime(drone, True) for drone in self.droneList]
+        # Check if the time score is already calculated and no drone tour changed since then
+        if self.timeScore is not None: return self.timeScore
 
-        # Calculate the average drone tour time as a factor for the score calculation 
-        avgDroneTourTime = (sum(droneTourTimeList) / len(droneTourTimeList))
-        
-        # Sum up the drone tour time and scale the score by the difference between the min/max and avg drone tour time
-        return round(sum(droneTourTimeList) * (1 + ((max(droneTourTimeList) - min(droneTourTimeList)) / avgDroneTourTime) / 2), 2)
+        # Calculate the time score with the tour time list of all drones (cached per drone tour)
+        self.timeScore = Solution.CalculateTimeScore([self.getDroneTourTime(drone, True) for drone in self.droneList])
+
+        # Return the cached time score
+        return self.timeScore
+
+    def getChargingTimeScore(self) -> float:
+        # Calculate the time score with the charging tour times of all drones (the time score after the insert of the optimal charging orders)
+        return Solution.CalculateTimeScore([self.getDroneChargingTourTime(drone) for drone in self.droneList])
 
     ################################################################################
     ####################### NEIGHBORHOOD SOLUTION FUNCTIONS ########################
     ################################################################################
 
-    def getNeighborhoodSolutions(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False) -> list[Self]:
+    def getNeighborhoodSolutions(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False, granularNeighborCount: int = None) -> list[Self]:
         # Create an empty solution list for the neighborhood
         neighborhoodSolutionList = []
 
         # Loop through the order list to calculate the neighborhood for each order
         for neighborhoodOrder in self.orderList:
             # Run the RelocateSolution algorithm to get all shifted solutions and add them to the neighborhoodSolutionList
-            neighborhoodSolutionList.extend(self.getRelocateSolutions(neighborhoodOrder, maximumLengthDelta, insertChargingOrders))
+            neighborhoodSolutionList.extend(self.getRelocateSolutions(neighborhoodOrder, maximumLengthDelta, insertChargingOrders, granularNeighborCount))
 
             # Run the ExchangeSolution algorithm to get all swapped solutions and add them to the neighborhoodSolutionList
-            neighborhoodSolutionList.extend(self.getExchangeSolutions(neighborhoodOrder, maximumLengthDelta, insertChargingOrders))
+            neighborhoodSolutionList.extend(self.getExchangeSolutions(neighborhoodOrder, maximumLengthDelta, insertChargingOrders, granularNeighborCount))
 
         # Return the neighborhoodSolutionList
         return neighborhoodSolutionList
     
-    def getExtendedNeighborhoodSolutions(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False) -> list[Self]:
+    def getExtendedNeighborhoodSolutions(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False, granularNeighborCount: int = None) -> list[Self]:
         # Create an prefilled solution list for the neighborhood by using the simple neighborhood function
-        neighborhoodSolutionList = self.getNeighborhoodSolutions(maximumLengthDelta, insertChargingOrders)
+        neighborhoodSolutionList = self.getNeighborhoodSolutions(maximumLengthDelta, insertChargingOrders, granularNeighborCount)
 
         # Loop through the order list to calculate the neighborhood for each order
         for neighborhoodOrder in self.orderList:
             # Run the CrossSolution algorithm to get all crossed solutions and add them to the neighborhoodSolutionList
-            neighborhoodSolutionList.extend(self.getCrossSolutions(neighborhoodOrder, maximumLengthDelta, insertChargingOrders))
+            neighborhoodSolutionList.extend(self.getCrossSolutions(neighborhoodOrder, maximumLengthDelta, insertChargingOrders, granularNeighborCount))
 
         # Return the neighborhoodSolutionList
         return neighborhoodSolutionList
 
+    ################################################################################
+    ######################### NEIGHBORHOOD MOVE FUNCTIONS ##########################
+    ################################################################################
+
+    def getNeighborhoodMoves(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, granularNeighborCount: int = None) -> list[Move]:
+        # Collect the lazily generated moves of the neighborhood into a list
+        return list(self.iterateNeighborhoodMoves(maximumLengthDelta, NeighborhoodOrder.SEQUENTIAL, granularNeighborCount))
+
+    def getExtendedNeighborhoodMoves(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, granularNeighborCount: int = None) -> list[Move]:
+        # Collect the lazily generated moves of the extended neighborhood into a list
+        return list(self.iterateExtendedNeighborhoodMoves(maximumLengthDelta, NeighborhoodOrder.SEQUENTIAL, granularNeighborCount))
+
+    def iterateNeighborhoodMoves(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, neighborhoodOrder: NeighborhoodOrder = NeighborhoodOrder.SEQUENTIAL, granularNeighborCount: int = None) -> Iterator[Move]:
+        # Loop through the order list in the given neighborhood order to generate the neighborhood for each order
+        for moveOrder in self.getNeighborhoodOrderList(neighborhoodOrder):
+            # Resolve the partner drones of the order (drones of the nearest orders first for the nearest neighbor order)
+            partnerDroneList = self.getPartnerDroneList(moveOrder) if neighborhoodOrder == NeighborhoodOrder.NEAREST_NEIGHBOR else self.droneList
+
+            # Run the RelocateMove algorithm to yield all shift moves of the order
+            yield from self.iterateRelocateMoves(moveOrder, maximumLengthDelta, partnerDroneList, granularNeighborCount)
+
+            # Run the ExchangeMove algorithm to yield all swap moves of the order
+            yield from self.iterateExchangeMoves(moveOrder, maximumLengthDelta, partnerDroneList, granularNeighborCount)
+
+    def iterateExtendedNeighborhoodMoves(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, neighborhoodOrder: NeighborhoodOrder = NeighborhoodOrder.SEQUENTIAL, granularNeighborCount: int = None) -> Iterator[Move]:
+        # Yield the moves of the simple neighborhood first
+        yield from self.iterateNeighborhoodMoves(maximumLengthDelta, neighborhoodOrder, granularNeighborCount)
+
+        # Loop through the order list in the given neighborhood order to generate the crossover neighborhood for each order
+        for moveOrder in self.getNeighborhoodOrderList(neighborhoodOrder):
+            # Resolve the partner drones of the order (drones of the nearest orders first for the nearest neighbor order)
+            partnerDroneList = self.getPartnerDroneList(moveOrder) if neighborhoodOrder == NeighborhoodOrder.NEAREST_NEIGHBOR else self.droneList
+
+            # Run the CrossMove algorithm to yield all crossover moves of the order
+            yield from self.iterateCrossMoves(moveOrder, maximumLengthDelta, partnerDroneList, granularNeighborCount)
+
+    def sampleNeighborhoodMove(self, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, granularNeighborCount: int = None, maximumAttemptCount: int = DEFAULT_SAMPLE_ATTEMPT_COUNT) -> Move | None:
+        # Hint: Draws one relocate or exchange move uniformly from the neighborhood without generating it (candidates above the upper boundary are rejected)
+        # Resolve the number of orders of each drone tour without charging orders (without both depot orders)
+        orderCountList = [len(self.getDroneTourView(drone)) - 2 for drone in self.droneList]
+
+        # Resolve the number of relocate (one more than the orders) and exchange (one per order) positions of all drone tours
+        positionCount = sum(2 * orderCount + 1 for orderCount in orderCountList)
+
+        # Weight the drones by the number of their moves (orders times the positions in the other tours) or by their orders if the neighborhood is granular
+        droneWeightList = [orderCount * (positionCount - 2 * orderCount - 1) if granularNeighborCount is None else orderCount for orderCount in orderCountList]
+
+        # Check if there is no move at all
+        if sum(droneWeightList) == 0: return None
+
+        # Loop through the attempts until a candidate is accepted
+        for _ in range(maximumAttemptCount):
+            # Select the drone by its weight and an order of its tour uniformly
+            sourceDroneIndex = random.choices(range(len(self.droneList)), droneWeightList)[0]
+            sourceDrone, sourceIndex = self.droneList[sourceDroneIndex], random.randint(1, orderCountList[sourceDroneIndex])
+
+            # Check if the neighborhood is not granular to select one of the positions in the other tours uniformly
+            if granularNeighborCount is None:
+                # Select the position and skip the positions of the own tour
+                partnerPosition = random.randrange(positionCount - 2 * orderCountList[sourceDroneIndex] - 1)
+                for partnerDroneIndex, orderCount in enumerate(orderCountList):
+                    # Check if the partner tour is the own tour or the position is behind the partner tour
+                    if partnerDroneIndex == sourceDroneIndex: continue
+                    if partnerPosition >= 2 * orderCount + 1: partnerPosition -= 2 * orderCount + 1
+                    else: break
+
+                # Resolve the partner drone of the position
+                destinationDrone = self.droneList[partnerDroneIndex]
+
+                # Convert the position into a relocate (in front of the positions 1 to orderCount + 1) or an exchange move (with the orders 1 to orderCount)
+                if partnerPosition <= orderCount: moveType, destinationIndex = MoveType.RELOCATE, partnerPosition + 1
+                else: moveType, destinationIndex = MoveType.EXCHANGE, partnerPosition - orderCount
+
+            else:
+                # Hint: The order position index of the nearest orders is recreated after each changed tour, so the granular sampling is linear once per applied move
+                # Resolve the candidates next to the nearest orders (relocate in front of or behind them, exchange with the orders before or after them)
+                candidateList = []
+                for partnerDrone, neighborPositionList in self.getGranularNeighborPositions(self.getDroneTourView(sourceDrone)[sourceIndex], granularNeighborCount).items():
+                    orderCount = len(self.getDroneTourView(partnerDrone)) - 2
+                    candidateList.extend((MoveType.RELOCATE, partnerDrone, x) for x in {y + z for y in neighborPositionList for z in (0, 1)} if 1 <= x <= orderCount + 1)
+                    candidateList.extend((MoveType.EXCHANGE, partnerDrone, x) for x in {y + z for y in neighborPositionList for z in (-1, 1)} if 1 <= x <= orderCount)
+
+                # Reject the order by the share of its candidates in the largest possible number of candidates (keeps the moves of all orders uniform)
+                if random.random() * 4 * granularNeighborCount >= len(candidateList): continue
+
+                # Select one of the candidates of the order uniformly
+                moveType, destinationDrone, destinationIndex = random.choice(candidateList)
+
+            # Create the move with its length delta and reject it if it exceeds the upper boundary
+            move = self.createMove(moveType, sourceDrone, destinationDrone, sourceIndex, destinationIndex)
+            if move.lengthDelta < maximumLengthDelta: return move
+
+        # Return None if no candidate was accepted
+        return None
+
+    def createMove(self, moveType: MoveType, sourceDrone: Drone, destinationDrone: Drone, sourceIndex: int, destinationIndex: int) -> Move:
+        # Resolve the matrix indices of the source and destination tours without charging orders
+        sourceTourIndices, destinationTourIndices = self.getDroneTourIndices(sourceDrone), self.getDroneTourIndices(destinationDrone)
+
+        # Check if the move is a relocate move and calculate the length delta of inserting the source order in front of the destination index
+        if moveType == MoveType.RELOCATE:
+            lengthDelta = self.calculateRelocateIndexLengthDelta((sourceTourIndices[sourceIndex - 1], sourceTourIndices[sourceIndex], sourceTourIndices[sourceIndex + 1]),
+                (destinationTourIndices[destinationIndex - 1], destinationTourIndices[destinationIndex]))
+
+        # Check if the move is an exchange move and calculate the length delta of swapping the orders at both indices
+        elif moveType == MoveType.EXCHANGE:
+            lengthDelta = self.calculateExchangeIndexLengthDelta((sourceTourIndices[sourceIndex - 1], sourceTourIndices[sourceIndex], sourceTourIndices[sourceIndex + 1]),
+                (destinationTourIndices[destinationIndex - 1], destinationTourIndices[destinationIndex], destinationTourIndices[destinationIndex + 1]))
+
+        # Check if the move is a cross move and calculate the length delta of swapping the tour ends after both indices
+        elif moveType == MoveType.CROSS:
+            lengthDelta = self.calculateCrossIndexLengthDelta((sourceTourIndices[sourceIndex], sourceTourIndices[sourceIndex + 1]),
+                (destinationTourIndices[destinationIndex], destinationTourIndices[destinationIndex + 1]))
+
+        # Default to the two-opt move and calculate the length delta of reversing the tour between both indices
+        else:
+            lengthDelta = self.calculateTwoOptIndexLengthDelta((sourceTourIndices[sourceIndex], sourceTourIndices[sourceIndex + 1]),
+                (sourceTourIndices[destinationIndex], sourceTourIndices[destinationIndex + 1]))
+
+        # Return the move with its length delta
+        return Move(moveType, sourceDrone, destinationDrone, sourceIndex, destinationIndex, lengthDelta)
+
+    def getNeighborhoodOrderList(self, neighborhoodOrder: NeighborhoodOrder = NeighborhoodOrder.SEQUENTIAL) -> list[Order]:
+        # Check if the neighborhood is generated in a random order and shuffle a copy of the order list
+        if neighborhoodOrder == NeighborhoodOrder.RANDOM: return random.sample(self.orderList, len(self.orderList))
+
+        # Check if the neighborhood is generated by the estimated delta and sort the orders by their removal delta (largest gain first)
+        if neighborhoodOrder == NeighborhoodOrder.ESTIMATED_DELTA: return sorted(self.orderList, key=self.calculateRemovalLengthDelta)
+
+        # Default to the order of the order list
+        return self.orderList
+
+    def getPartnerDroneList(self, order: Order) -> list[Drone]:
+        # Resolve the order position index to skip the neighbors without a position
+        orderPositionDictionary = self.getOrderPositionDictionary()
+
+        # Resolve the drones of the nearest orders in the order of their distance and append the remaining drones (dict keys remove the duplicates)
+        return list(dict.fromkeys([orderPositionDictionary[neighborOrder][0] for neighborOrder in self.getOrderNeighborhoodMatrix()[order]
+            if neighborOrder in orderPositionDictionary] + self.droneList))
+
+    def calculateRemovalLengthDelta(self, order: Order) -> float:
+        # Resolve the drone tour without charging orders and the position of the order
+        drone, orderIndex = self.getOrderPosition(order)
+        droneTour = self.getDroneTourView(drone)
+
+        # Check if the order is the first or the last order of the tour that is never moved
+        if (orderIndex == 0) or (orderIndex == (len(droneTour) - 1)): return Solution.FLOAT_POSITIVE_INFINITY
+
+        # Resolve the matrix indices of the order and its neighbors in the tour
+        a, b, c = self.getOrderIndices(droneTour[(orderIndex - 1):(orderIndex + 2)])
+
+        # Calculate the length delta of removing the order from its tour (negative for a shorter tour)
+        return self.distanceMatrix.getDistance(a, c) - self.distanceMatrix.getDistance(a, b) - self.distanceMatrix.getDistance(b, c)
+
+    def getGranularNeighborPositions(self, order: Order, granularNeighborCount: int) -> dict[Drone, list[int]]:
+        # Resolve the order position index and the drone of the order
+        orderPositionDictionary = self.getOrderPositionDictionary()
+        orderDrone = orderPositionDictionary[order][0]
+
+        # Create an empty dictionary for the positions of the nearest orders in each partner tour
+        neighborPositionDictionary = dict()
+        neighborCount = 0
+
+        # Loop through the precalculated nearest orders in the order of their distance
+        for neighborOrder in self.getOrderNeighborhoodMatrix()[order]:
+            # Check if the number of nearest orders in other tours is reached
+            if neighborCount >= granularNeighborCount: break
+
+            # Resolve the position of the nearest order and skip orders without a position or in the own tour
+            neighborPosition = orderPositionDictionary.get(neighborOrder)
+            if (neighborPosition is None) or (neighborPosition[0] == orderDrone): continue
+
+            # Save the position of the nearest order in its partner tour
+            neighborPositionDictionary.setdefault(neighborPosition[0], []).append(neighborPosition[1])
+            neighborCount += 1
+
+        # Return the positions of the nearest orders
+        return neighborPositionDictionary
+
+    def getGranularPartnerTourIndices(self, neighborPositionDictionary: dict[Drone, list[int]] | None, partnerDrone: Drone, partnerTourIndexRange: range, positionOffsets: tuple[int, ...]) -> Iterable[int]:
+        # Check if the neighborhood is not granular to use all partner tour indices
+        if neighborPositionDictionary is None: return partnerTourIndexRange
+
+        # Resolve the valid partner tour indices next to the nearest orders in the tour order (set removes the duplicates of adjacent nearest orders)
+        partnerTourIndexList = sorted(partnerTourIndex for partnerTourIndex in set(neighborPosition + positionOffset for neighborPosition in neighborPositionDictionary.get(partnerDrone, ())
+            for positionOffset in positionOffsets) if partnerTourIndex in partnerTourIndexRange)
+
+        # Count the candidates that are skipped by the granular neighborhood
+        self.problemInstance.addSkippedCandidateCount(len(partnerTourIndexRange) - len(partnerTourIndexList))
+
+        # Return the granular partner tour indices
+        return partnerTourIndexList
+
+    def selectBatchLengthDeltas(self, partnerTourIndexArray: np.ndarray, lengthDeltaArray: np.ndarray, maximumLengthDelta: float) -> Iterator[tuple[int, float]]:
+        # Select the candidates that are below the upper boundary before the rounding (with the margin of the rounded deltas)
+        candidateMask = lengthDeltaArray < maximumLengthDelta + Solution.LENGTH_DELTA_ROUNDING_MARGIN
+
+        # Loop through the selected candidates to round their length deltas like the single evaluation
+        for partnerTourIndex, lengthDelta in zip(partnerTourIndexArray[candidateMask].tolist(), lengthDeltaArray[candidateMask].tolist()):
+            # Round the length delta and check it against the upper boundary
+            lengthDelta = round(lengthDelta, 2)
+            if (lengthDelta >= maximumLengthDelta): continue
+
+            # Yield the partner tour index with the rounded length delta
+            yield partnerTourIndex, lengthDelta
+
+    def isPartnerTourPruned(self, lowerBound: float, maximumLengthDelta: float, candidateCount: int) -> bool:
+        # Check if the lower bound of the length delta already exceeds the upper boundary (with the margin of the rounded deltas)
+        if lowerBound < maximumLengthDelta + Solution.LENGTH_DELTA_ROUNDING_MARGIN: return False
+
+        # Count the candidates that are skipped by the route pruning
+        self.problemInstance.addPrunedCandidateCount(candidateCount)
+
+        # The positions between the orders of the partner tour are pruned
+        return True
+
+    def calculateRelocateLowerBound(self, firstPath: tuple[int, int, int], partnerDrone: Drone, maximumLengthDelta: float) -> float:
+        # Resolve the summary of the partner tour and check if there is a finite boundary and a summary to bound the delta
+        tourSummary = self.getDroneTourSummary(partnerDrone) if maximumLengthDelta != Solution.FLOAT_POSITIVE_INFINITY else None
+        if tourSummary is None: return Solution.FLOAT_NEGATIVE_INFINITY
+
+        # Resolve the index based distance function and the summary of the partner tour
+        distance = self.distanceMatrix.getDistance
+        centerIndex, radius, longestEdgeLength = tourSummary
+
+        # Calculate the exact removal delta and the lower bound of the insertion between two orders of the partner tour (triangle inequality)
+        return (distance(firstPath[0], firstPath[2]) - distance(firstPath[0], firstPath[1]) - distance(firstPath[1], firstPath[2])
+            + max(0.0, 2 * max(0.0, distance(firstPath[1], centerIndex) - radius) - longestEdgeLength))
+
+    def calculateExchangeLowerBound(self, firstPath: tuple[int, int, int], partnerDrone: Drone, maximumLengthDelta: float) -> float:
+        # Resolve the summary of the partner tour and check if there is a finite boundary and a summary to bound the delta
+        tourSummary = self.getDroneTourSummary(partnerDrone) if maximumLengthDelta != Solution.FLOAT_POSITIVE_INFINITY else None
+        if tourSummary is None: return Solution.FLOAT_NEGATIVE_INFINITY
+
+        # Resolve the index based distance function and the summary of the partner tour
+        distance = self.distanceMatrix.getDistance
+        centerIndex, radius, longestEdgeLength = tourSummary
+
+        # Calculate the lower bound of the swap with an order between two orders of the partner tour (triangle inequality on both sides)
+        return (4 * max(0.0, distance(firstPath[1], centerIndex) - radius) - 2 * (distance(firstPath[0], firstPath[1]) + distance(firstPath[1], firstPath[2]))
+            - 4 * longestEdgeLength)
+
+    def calculateCrossLowerBound(self, firstPath: tuple[int, int], partnerDrone: Drone, maximumLengthDelta: float) -> float:
+        # Resolve the summary of the partner tour and check if there is a finite boundary and a summary to bound the delta
+        tourSummary = self.getDroneTourSummary(partnerDrone) if maximumLengthDelta != Solution.FLOAT_POSITIVE_INFINITY else None
+        if tourSummary is None: return Solution.FLOAT_NEGATIVE_INFINITY
+
+        # Resolve the index based distance function and the summary of the partner tour
+        distance = self.distanceMatrix.getDistance
+        centerIndex, radius, longestEdgeLength = tourSummary
+
+        # Calculate the lower bound of the crossover with an edge between two orders of the partner tour (triangle inequality on both new edges)
+        return (max(0.0, distance(firstPath[0], centerIndex) - radius) + max(0.0, distance(firstPath[1], centerIndex) - radius)
+            - distance(firstPath[0], firstPath[1]) - longestEdgeLength)
+
+    def applyMove(self, move: Move) -> Self:
+        # Check if the move is a two-opt move and create the two-opt solution
+        if move.moveType == MoveType.TWO_OPT:
+            return self.createTwoOptSolution(move.sourceDrone, move.sourceIndex, move.destinationIndex)
+
+        # Check if the move is a relocate move and create the relocate solution with the order at the source index
+        if move.moveType == MoveType.RELOCATE:
+            return self.createRelocateSolution(move.sourceDrone, move.destinationDrone, self.getDroneTourView(move.sourceDrone)[move.sourceIndex], move.destinationIndex)
+
+        # Check if the move is an exchange move and create the exchange solution
+        if move.moveType == MoveType.EXCHANGE:
+            return self.createExchangeSolution(move.sourceDrone, move.destinationDrone, move.sourceIndex, move.destinationIndex)
+
+        # Default to the cross move and create the cross solution
+        return self.createCrossSolution(move.sourceDrone, move.destinationDrone, move.sourceIndex, move.destinationIndex)
+
+    def applyMoveInPlace(self, move: Move):
+        # Hint: Changes the tours of the solution itself (without copying the solution), so the solution must not be shared
+        # Update the fingerprint with the changed edges of the move if it is already calculated
+        moveFingerprint = None if self.fingerprint is None else self.getMoveFingerprint(move)
+
+        # Loop through the changed tours of the move to replace them in the solution matrix
+        for drone, droneTour in self.getMoveTours(move).items():
+            # Replace the drone tour and invalidate its cached metrics
+            self.setDroneTour(drone, droneTour)
+
+        # Save the updated fingerprint of the moved tours
+        self.fingerprint = moveFingerprint
+
+    def evaluateMove(self, move: Move) -> float:
+        # Check if the move is already evaluated
+        if move.timeScore is not None: return move.timeScore
+
+        # Resolve the tour time table of the current tours and the changed tour times of the move in a constant time
+        tourTimeTable = self.getTourTimeTable()
+        moveTourTimeDictionary = self.calculateMoveTourTimes(move)
+
+        # Calculate the unrounded time score of the moved solution with the delta of the tour time sum and the updated extreme tour times
+        rawTimeScore = Solution.CalculateRawTimeScore(tourTimeTable.getTourTimeSum() + tourTimeTable.getTourTimeSumDelta(moveTourTimeDictionary), tourTimeTable.getTourTimeCount(),
+            tourTimeTable.getMaximumTourTime(moveTourTimeDictionary), tourTimeTable.getMinimumTourTime(moveTourTimeDictionary))
+
+        # Check if the rounding of the delta score is not affected by the floating point error of the delta (the usual case)
+        if not Solution.IsCloseToRoundingBoundary(rawTimeScore, 2):
+            # Save the rounded time score of the moved solution in the move
+            move.setTimeScore(round(rawTimeScore, 2), self.getTimeScore())
+
+            # Return the time score of the moved solution
+            return move.timeScore
+
+        # Resolve the changed tours of the move without creating the moved solution
+        moveTourDictionary = self.getMoveTours(move)
+
+        # Get the tour time list of all drones with the changed tours of the move and the cached tour times of the other drones
+        droneTourTimeList = [self.calculateTourMetrics(drone, moveTourDictionary[drone])[2] if drone in moveTourDictionary
+            else self.getDroneTourTime(drone, True) for drone in self.droneList]
+
+        # Save the fully evaluated time score of the moved solution in the move
+        move.setTimeScore(Solution.CalculateTimeScore(droneTourTimeList), self.getTimeScore())
+
+        # Return the time score of the moved solution
+        return move.timeScore
+
+    def calculateMoveTourTimes(self, move: Move) -> dict[Drone, float]:
+        # Resolve the index based distance function of the distance matrix
+        distance = self.distanceMatrix.getDistance
+
+        # Resolve the source tour without charging orders with its prefix distances and dwell times and the source index of the move
+        sourceTour, sourceIndex = self.getDroneTourView(move.sourceDrone), move.sourceIndex
+        sourceDistancePrefixList, sourceDwellPrefixList = self.getDroneTourPrefixes(move.sourceDrone)
+
+        # Resolve the destination tour without charging orders with its prefix distances and dwell times and the destination index of the move
+        destinationTour, destinationIndex = self.getDroneTourView(move.destinationDrone), move.destinationIndex
+        destinationDistancePrefixList, destinationDwellPrefixList = self.getDroneTourPrefixes(move.destinationDrone)
+
+        # Resolve the matrix index function of the orders
+        index = self.orderIndexDictionary.__getitem__
+
+        # Check if the move is a two-opt move that replaces two edges of the same tour (the reversed path keeps its length)
+        if move.moveType == MoveType.TWO_OPT:
+            # Resolve the matrix indices of the paths at both move indices
+            a, b, c, d = index(sourceTour[sourceIndex]), index(sourceTour[sourceIndex + 1]), index(sourceTour[destinationIndex]), index(sourceTour[destinationIndex + 1])
+
+            # Calculate the tour distance and dwell time after the two-opt swap
+            sourceTourDistance = sourceDistancePrefixList[-1] - distance(a, b) - distance(c, d) + distance(a, c) + distance(b, d)
+            sourceTourDwellTime = sourceDwellPrefixList[-1]
+
+            # Return the tour time of the changed drone
+            return {move.sourceDrone: move.sourceDrone.calculateFlightTime(sourceTourDistance) + sourceTourDwellTime}
+
+        # Check if the move is a relocate move that shifts the source order in front of the destination index
+        if move.moveType == MoveType.RELOCATE:
+            # Resolve the matrix indices of the source path around the order and of the destination path around the insert position
+            a, b, c = index(sourceTour[sourceIndex - 1]), index(sourceTour[sourceIndex]), index(sourceTour[sourceIndex + 1])
+            d, e = index(destinationTour[destinationIndex - 1]), index(destinationTour[destinationIndex])
+
+            # Calculate the tour distances and dwell times after removing and inserting the source order
+            sourceTourDistance = sourceDistancePrefixList[-1] - distance(a, b) - distance(b, c) + distance(a, c)
+            destinationTourDistance = destinationDistancePrefixList[-1] - distance(d, e) + distance(d, b) + distance(b, e)
+            sourceTourDwellTime = sourceDwellPrefixList[-1] - sourceTour[sourceIndex].getDwellTime()
+            destinationTourDwellTime = destinationDwellPrefixList[-1] + sourceTour[sourceIndex].getDwellTime()
+
+        # Check if the move is an exchange move that swaps the orders at both indices
+        elif move.moveType == MoveType.EXCHANGE:
+            # Resolve the matrix indices of the source and destination paths around the swapped orders
+            a, b, c = index(sourceTour[sourceIndex - 1]), index(sourceTour[sourceIndex]), index(sourceTour[sourceIndex + 1])
+            d, e, f = index(destinationTour[destinationIndex - 1]), index(destinationTour[destinationIndex]), index(destinationTour[destinationIndex + 1])
+
+            # Calculate the tour distances and dwell times after swapping the orders
+            sourceTourDistance = sourceDistancePrefixList[-1] - distance(a, b) - distance(b, c) + distance(a, e) + distance(e, c)
+            destinationTourDistance = destinationDistancePrefixList[-1] - distance(d, e) - distance(e, f) + distance(d, b) + distance(b, f)
+            sourceTourDwellTime = sourceDwellPrefixList[-1] - sourceTour[sourceIndex].getDwellTime() + destinationTour[destinationIndex].getDwellTime()
+            destinationTourDwellTime = destinationDwellPrefixList[-1] - destinationTour[destinationIndex].getDwellTime() + sourceTour[sourceIndex].getDwellTime()
+
+        # Default to the cross move that swaps the tour ends after both indices
+        else:
+            # Resolve the matrix indices of the source and destination paths at the crossover
+            a, b = index(sourceTour[sourceIndex]), index(sourceTour[sourceIndex + 1])
+            c, d = index(destinationTour[destinationIndex]), index(destinationTour[destinationIndex + 1])
+
+            # Calculate the tour distances and dwell times with the prefix of the own tour and the suffix of the other tour
+            sourceTourDistance = sourceDistancePrefixList[sourceIndex] + distance(a, d) + destinationDistancePrefixList[-1] - destinationDistancePrefixList[destinationIndex + 1]
+            destinationTourDistance = destinationDistancePrefixList[destinationIndex] + distance(c, b) + sourceDistancePrefixList[-1] - sourceDistancePrefixList[sourceIndex + 1]
+            sourceTourDwellTime = sourceDwellPrefixList[sourceIndex + 1] + destinationDwellPrefixList[-1] - destinationDwellPrefixList[destinationIndex + 1]
+            destinationTourDwellTime = destinationDwellPrefixList[destinationIndex + 1] + sourceDwellPrefixList[-1] - sourceDwellPrefixList[sourceIndex + 1]
+
+        # Return the tour times of both changed drones
+        return {move.sourceDrone: move.sourceDrone.calculateFlightTime(sourceTourDistance) + sourceTourDwellTime,
+            move.destinationDrone: move.destinationDrone.calculateFlightTime(destinationTourDistance) + destinationTourDwellTime}
+
+    def getMoveTourSegments(self, move: Move) -> dict[Drone, list[tuple[Drone, int, int]]]:
+        # Hint: Each segment is a tour part (drone, first and last position) of a current tour without charging orders (backwards if the last position is smaller)
+        # Resolve the source and destination drones, the move indices and the last positions of both tours
+        sourceDrone, sourceIndex, sourceEndIndex = move.sourceDrone, move.sourceIndex, len(self.getDroneTourView(move.sourceDrone)) - 1
+        destinationDrone, destinationIndex, destinationEndIndex = move.destinationDrone, move.destinationIndex, len(self.getDroneTourView(move.destinationDrone)) - 1
+
+        # Check if the move is a two-opt move and reverse the tour part between both indices
+        if move.moveType == MoveType.TWO_OPT:
+            return {sourceDrone: [(sourceDrone, 0, sourceIndex), (sourceDrone, destinationIndex, sourceIndex + 1), (sourceDrone, destinationIndex + 1, sourceEndIndex)]}
+
+        # Check if the move is a relocate move and shift the source order into the destination tour
+        if move.moveType == MoveType.RELOCATE:
+            return {sourceDrone: [(sourceDrone, 0, sourceIndex - 1), (sourceDrone, sourceIndex + 1, sourceEndIndex)],
+                destinationDrone: [(destinationDrone, 0, destinationIndex - 1), (sourceDrone, sourceIndex, sourceIndex), (destinationDrone, destinationIndex, destinationEndIndex)]}
+
+        # Check if the move is an exchange move and swap the orders of both tours
+        if move.moveType == MoveType.EXCHANGE:
+            return {sourceDrone: [(sourceDrone, 0, sourceIndex - 1), (destinationDrone, destinationIndex, destinationIndex), (sourceDrone, sourceIndex + 1, sourceEndIndex)],
+                destinationDrone: [(destinationDrone, 0, destinationIndex - 1), (sourceDrone, sourceIndex, sourceIndex), (destinationDrone, destinationIndex + 1, destinationEndIndex)]}
+
+        # Default to the cross move and swap the tour ends after both indices
+        return {sourceDrone: [(sourceDrone, 0, sourceIndex), (destinationDrone, destinationIndex + 1, destinationEndIndex)],
+            destinationDrone: [(destinationDrone, 0, destinationIndex), (sourceDrone, sourceIndex + 1, sourceEndIndex)]}
+
+    def calculateSegmentTourDistance(self, tourSegmentList: list[tuple[Drone, int, int]]) -> float:
+        # Resolve the prefix distances and matrix indices of the segment tours
+        segmentList = [(self.getDroneTourPrefixes(segmentDrone)[0], self.getDroneTourIndices(segmentDrone), startIndex, endIndex) for segmentDrone, startIndex, endIndex in tourSegmentList]
+
+        # Calculate the tour distance with the prefix distances inside the segments and the connecting edges between them
+        return (sum(abs(distancePrefixList[endIndex] - distancePrefixList[startIndex]) for distancePrefixList, _, startIndex, endIndex in segmentList)
+            + sum(self.distanceMatrix.getDistance(x[1][x[3]], y[1][y[2]]) for x, y in zip(segmentList[:-1], segmentList[1:])))
+
+    def calculateChargingTourDistance(self, drone: Drone, tourSegmentList: list[tuple[Drone, int, int]], tourDistance: float = None) -> tuple[float, int] | None:
+        # Hint: Simulates the greedy charging stops at the closest charging stations, so the result is an upper bound of the optimal charging stops
+        # Resolve the index based distance function and the closest charging station function of the charging station table
+        distance = self.distanceMatrix.getDistance
+        closestChargingStation = self.chargingStationTable.getClosestChargingStation
+
+        # Resolve the charging profiles, prefix distances and matrix indices of the segment tours
+        segmentList = [(self.getDroneChargingProfile(segmentDrone), self.getDroneTourIndices(segmentDrone), startIndex, endIndex) for segmentDrone, startIndex, endIndex in tourSegmentList]
+
+        # Check if the tourDistance parameter is set or calculate the tour distance of the segments
+        if tourDistance is None: tourDistance = self.calculateSegmentTourDistance(tourSegmentList)
+
+        # Resolve the remaining distance of the drone
+        droneDistance = drone.getRemainingFlightDistance()
+
+        # Not recharge if drone tour shorter then drone range (like the charging order insert)
+        if tourDistance <= droneDistance: return (tourDistance, 0)
+
+        # Save the remaining tour range, the tour distance with the charging detours, the number of charging stops and the last order (matrix index and closest charging station distance)
+        remainingTourRange = droneDistance
+        chargingTourDistance = tourDistance
+        chargingStopCount = 0
+        previousOrder = None
+
+        # Loop through the segments to simulate the charging order insert along the segments
+        for profile, tourIndices, startIndex, endIndex in segmentList:
+            # Resolve the prefix distances and closest charging station distances of the segment tour
+            distancePrefixList, closestDistanceList = profile.distancePrefixList, profile.closestDistanceList
+
+            # Check if there is a connecting edge from the last order of the previous segment to the first order of this segment
+            if previousOrder is not None:
+                # Get the current trip length of the connecting edge
+                tripLength = distance(previousOrder[0], tourIndices[startIndex])
+
+                # Check if the drone has not enought range after the connecting trip to reach a charging station with the remaning power
+                if closestDistanceList[startIndex] > remainingTourRange - tripLength:
+                    # Check if any charging station is in range to split the connecting trip with a recharge in between the orders
+                    if previousOrder[1] > remainingTourRange: return None
+
+                    # Add the charging detour and recalculate the remaining range after the charging station
+                    chargingStationIndex = self.getBuildingIndex(closestChargingStation(previousOrder[0]))
+                    chargingTourDistance += distance(previousOrder[0], chargingStationIndex) + distance(chargingStationIndex, tourIndices[startIndex]) - tripLength
+                    remainingTourRange, tripLength = droneDistance, distance(tourIndices[startIndex], chargingStationIndex)
+                    chargingStopCount += 1
+
+                # Remove the trip length from the remaining tour range
+                remainingTourRange -= tripLength
+
+            # Set the first order of the segment as the current order
+            currentIndex = startIndex
+
+            # Check if the segment is walked forward
+            if startIndex <= endIndex:
+                # Loop through the charging stops of the segment (first order that can't reach a charging station after the trip to it)
+                while (stopIndex := profile.findFirstForward(currentIndex + 1, endIndex, remainingTourRange + distancePrefixList[currentIndex])) >= 0:
+                    # Resolve the remaining range at the order in front of the charging stop and check if a charging station is in range
+                    stopRange = remainingTourRange - (distancePrefixList[stopIndex - 1] - distancePrefixList[currentIndex])
+                    if closestDistanceList[stopIndex - 1] > stopRange: return None
+
+                    # Add the charging detour and recalculate the remaining range after the charging station
+                    chargingStationIndex = self.getBuildingIndex(closestChargingStation(tourIndices[stopIndex - 1]))
+                    chargingTourDistance += (distance(tourIndices[stopIndex - 1], chargingStationIndex) + distance(chargingStationIndex, tourIndices[stopIndex])
+                        - (distancePrefixList[stopIndex] - distancePrefixList[stopIndex - 1]))
+                    remainingTourRange, currentIndex = droneDistance - distance(tourIndices[stopIndex], chargingStationIndex), stopIndex
+                    chargingStopCount += 1
+
+                # Remove the remaining segment distance from the remaining tour range
+                remainingTourRange -= distancePrefixList[endIndex] - distancePrefixList[currentIndex]
+
+            else:
+                # Loop through the charging stops of the backward segment (first order that can't reach a charging station after the trip to it)
+                while (stopIndex := profile.findFirstBackward(currentIndex - 1, endIndex, remainingTourRange - distancePrefixList[currentIndex])) >= 0:
+                    # Resolve the remaining range at the order in front of the charging stop and check if a charging station is in range
+                    stopRange = remainingTourRange - (distancePrefixList[currentIndex] - distancePrefixList[stopIndex + 1])
+                    if closestDistanceList[stopIndex + 1] > stopRange: return None
+
+                    # Add the charging detour and recalculate the remaining range after the charging station
+                    chargingStationIndex = self.getBuildingIndex(closestChargingStation(tourIndices[stopIndex + 1]))
+                    chargingTourDistance += (distance(tourIndices[stopIndex + 1], chargingStationIndex) + distance(chargingStationIndex, tourIndices[stopIndex])
+                        - (distancePrefixList[stopIndex + 1] - distancePrefixList[stopIndex]))
+                    remainingTourRange, currentIndex = droneDistance - distance(tourIndices[stopIndex], chargingStationIndex), stopIndex
+                    chargingStopCount += 1
+
+                # Remove the remaining segment distance from the remaining tour range
+                remainingTourRange -= distancePrefixList[currentIndex] - distancePrefixList[endIndex]
+
+            # Save the last order of the segment for the next connecting edge
+            previousOrder = (tourIndices[endIndex], closestDistanceList[endIndex])
+
+        # Return the tour distance with the charging detours and the number of charging stops
+        return (chargingTourDistance, chargingStopCount)
+
+    def calculateOptimalChargingTourDistance(self, drone: Drone, tourSegmentList: list[tuple[Drone, int, int]], tourDistance: float = None) -> tuple[float, int] | None:
+        # Not recharge if the tour distance is known and the drone tour shorter then drone range
+        if (tourDistance is not None) and (tourDistance <= drone.getRemainingFlightDistance()): return (tourDistance, 0)
+
+        # Create the matrix indices of the changed tour out of the segments (reversed for the backward segments)
+        tourIndices = []
+        for segmentDrone, startIndex, endIndex in tourSegmentList:
+            # Resolve the matrix indices of the segment tour and append the segment part
+            segmentIndices = self.getDroneTourIndices(segmentDrone)
+            tourIndices += segmentIndices[startIndex:(endIndex + 1)] if startIndex <= endIndex else segmentIndices[endIndex:(startIndex + 1)][::-1]
+
+        # Calculate the optimal charging stops of the changed tour
+        chargingStops = self.calculateChargingStops(tourIndices, drone.getRemainingFlightDistance(), Solution.GetChargingStopDistance(drone))
+
+        # Return the tour distance with the charging detours and the number of charging stops or None if there are no possible charging stops
+        return (chargingStops[0], len(chargingStops[1])) if chargingStops is not None else None
+
+    def evaluateMoveCharging(self, move: Move, optimalChargingStops: bool = False) -> float | None:
+        # Resolve the charging simulation (greedy upper bound or the exact optimal charging stops)
+        calculateChargingTourDistance = self.calculateOptimalChargingTourDistance if optimalChargingStops else self.calculateChargingTourDistance
+
+        # Create an empty length delta of the tours with charging orders
+        chargingLengthDelta = 0.0
+
+        # Loop through the changed tours of the move
+        for drone, tourSegmentList in self.getMoveTourSegments(move).items():
+            # Simulate the charging order insert on the segments of the changed tour and check if it is possible
+            chargingTour = calculateChargingTourDistance(drone, tourSegmentList)
+            if chargingTour is None: return None
+
+            # Add the distance change of the tour with charging orders
+            chargingLengthDelta += chargingTour[0] - self.getDroneTourDistance(drone, True)
+
+        # Return the length delta of the tours with charging orders
+        return chargingLengthDelta
+
+    def evaluateMoveChargingTime(self, move: Move, optimalChargingStops: bool = False) -> float | None:
+        # Hint: The charging aware time score of the moved solution, the changed tours get the flight time of their charging detours and the dwell times of their charging stops
+        # Resolve the charging simulation (greedy upper bound or the exact optimal charging stops)
+        calculateChargingTourDistance = self.calculateOptimalChargingTourDistance if optimalChargingStops else self.calculateChargingTourDistance
+
+        # Resolve the changed tour times of the move without charging orders and the charging tour times of the current tours
+        moveTourTimeDictionary = self.calculateMoveTourTimes(move)
+        chargingTourTimeDictionary = dict((drone, self.getDroneChargingTourTime(drone)) for drone in self.droneList)
+
+        # Loop through the changed tours of the move
+        for drone, tourSegmentList in self.getMoveTourSegments(move).items():
+            # Calculate the tour distance of the changed tour without charging orders
+            tourDistance = self.calculateSegmentTourDistance(tourSegmentList)
+
+            # Simulate the charging order insert on the segments of the changed tour and check if it is possible
+            chargingTour = calculateChargingTourDistance(drone, tourSegmentList, tourDistance)
+            if chargingTour is None: return None
+
+            # Add the flight time of the charging detours and the dwell times of the charging stops to the changed tour time
+            chargingTourTimeDictionary[drone] = moveTourTimeDictionary[drone] + drone.calculateFlightTime(chargingTour[0] - tourDistance) + chargingTour[1] * ProblemInstance.CHARGING_ORDER_DWELL_TIME
+
+        # Return the time score of the moved solution with the charging tour times
+        return Solution.CalculateTimeScore(list(chargingTourTimeDictionary.values()))
+
+    def getMoveTours(self, move: Move) -> dict[Drone, list[Order]]:
+        # Resolve the source and destination tours without charging orders and the move indices
+        sourceTour, sourceIndex = self.getDroneTourView(move.sourceDrone), move.sourceIndex
+        destinationTour, destinationIndex = self.getDroneTourView(move.destinationDrone), move.destinationIndex
+
+        # Check if the move is a two-opt move and reverse the tour between both indices
+        if move.moveType == MoveType.TWO_OPT:
+            return {move.sourceDrone: sourceTour[:(sourceIndex + 1)] + sourceTour[destinationIndex:sourceIndex:-1] + sourceTour[(destinationIndex + 1):]}
+
+        # Check if the move is a relocate move and shift the source order into the destination tour
+        if move.moveType == MoveType.RELOCATE:
+            return {move.sourceDrone: sourceTour[:sourceIndex] + sourceTour[(sourceIndex + 1):],
+                move.destinationDrone: destinationTour[:destinationIndex] + [sourceTour[sourceIndex]] + destinationTour[destinationIndex:]}
+
+        # Check if the move is an exchange move and swap the orders of both tours
+        if move.moveType == MoveType.EXCHANGE:
+            return {move.sourceDrone: sourceTour[:sourceIndex] + [destinationTour[destinationIndex]] + sourceTour[(sourceIndex + 1):],
+                move.destinationDrone: destinationTour[:destinationIndex] + [sourceTour[sourceIndex]] + destinationTour[(destinationIndex + 1):]}
+
+        # Default to the cross move and swap the tour ends after both indices
+        return {move.sourceDrone: sourceTour[:(sourceIndex + 1)] + destinationTour[(destinationIndex + 1):],
+            move.destinationDrone: destinationTour[:(destinationIndex + 1)] + sourceTour[(sourceIndex + 1):]}
+
+    def getMoveFingerprint(self, move: Move) -> int:
+        # Combine the fingerprint of the current tours with the keys of the removed and added edges of the move
+        return self.getFingerprint() ^ self.calculateMoveFingerprintDelta(move)
+
+    def calculateMoveFingerprintDelta(self, move: Move) -> int:
+        # Resolve the zobrist table with its edge key function and the order code function of the problem instance
+        zobristTable, orderCode = self.problemInstance.getZobristTable(), self.problemInstance.getOrderCode
+        edgeKey = zobristTable.getEdgeKey
+
+        # Resolve the source and destination tours without charging orders and the move indices
+        sourceDrone, sourceTour, sourceIndex = move.sourceDrone, self.getDroneTourView(move.sourceDrone), move.sourceIndex
+        destinationDrone, destinationTour, destinationIndex = move.destinationDrone, self.getDroneTourView(move.destinationDrone), move.destinationIndex
+
+        # Check if the move is a relocate move that removes three and adds three edges
+        if move.moveType == MoveType.RELOCATE:
+            # Resolve the order codes of the source path around the order and of the destination path around the insert position
+            a, b, c = orderCode(sourceTour[sourceIndex - 1]), orderCode(sourceTour[sourceIndex]), orderCode(sourceTour[sourceIndex + 1])
+            d, e = orderCode(destinationTour[destinationIndex - 1]), orderCode(destinationTour[destinationIndex])
+
+            # Combine the keys of the removed and added edges of both tours
+            return (edgeKey(sourceDrone, a, b) ^ edgeKey(sourceDrone, b, c) ^ edgeKey(sourceDrone, a, c)
+                ^ edgeKey(destinationDrone, d, e) ^ edgeKey(destinationDrone, d, b) ^ edgeKey(destinationDrone, b, e))
+
+        # Check if the move is an exchange move that replaces four edges of each tour
+        if move.moveType == MoveType.EXCHANGE:
+            # Resolve the order codes of the source and destination paths around the swapped orders
+            a, b, c = orderCode(sourceTour[sourceIndex - 1]), orderCode(sourceTour[sourceIndex]), orderCode(sourceTour[sourceIndex + 1])
+            d, e, f = orderCode(destinationTour[destinationIndex - 1]), orderCode(destinationTour[destinationIndex]), orderCode(destinationTour[destinationIndex + 1])
+
+            # Combine the keys of the removed and added edges of both tours
+            return (edgeKey(sourceDrone, a, b) ^ edgeKey(sourceDrone, b, c) ^ edgeKey(sourceDrone, a, e) ^ edgeKey(sourceDrone, e, c)
+                ^ edgeKey(destinationDrone, d, e) ^ edgeKey(destinationDrone, e, f) ^ edgeKey(destinationDrone, d, b) ^ edgeKey(destinationDrone, b, f))
+
+        # Hint: Two-opt and cross moves change the direction or the drone of a whole tour part, so their delta is linear in the changed tour part
+        # Initialize the fingerprint delta
+        fingerprintDelta = 0
+
+        # Loop through the changed tours of the move to combine the keys of the current and the moved tours
+        for drone, droneTour in self.getMoveTours(move).items():
+            fingerprintDelta ^= zobristTable.getTourKey(drone, list(map(orderCode, self.getDroneTourView(drone))))
+            fingerprintDelta ^= zobristTable.getTourKey(drone, list(map(orderCode, droneTour)))
+
+        # Return the fingerprint delta
+        return fingerprintDelta
+
+    def getMoveReassignments(self, move: Move) -> list[tuple[Order, Drone, Drone]]:
+        # Resolve the source and destination tours without charging orders and the move indices
+        sourceTour, sourceIndex = self.getDroneTourView(move.sourceDrone), move.sourceIndex
+        destinationTour, destinationIndex = self.getDroneTourView(move.destinationDrone), move.destinationIndex
+
+        # Check if the move is a two-opt move that keeps all orders in their tour
+        if move.moveType == MoveType.TWO_OPT: return []
+
+        # Check if the move is a relocate move that moves the source order into the destination tour
+        if move.moveType == MoveType.RELOCATE: return [(sourceTour[sourceIndex], move.sourceDrone, move.destinationDrone)]
+
+        # Check if the move is an exchange move that moves both orders into the other tour
+        if move.moveType == MoveType.EXCHANGE:
+            return [(sourceTour[sourceIndex], move.sourceDrone, move.destinationDrone), (destinationTour[destinationIndex], move.destinationDrone, move.sourceDrone)]
+
+        # Default to the cross move that moves the tour ends (without the final depot orders) into the other tour
+        return ([(order, move.sourceDrone, move.destinationDrone) for order in sourceTour[(sourceIndex + 1):-1]]
+            + [(order, move.destinationDrone, move.sourceDrone) for order in destinationTour[(destinationIndex + 1):-1]])
+
+    def getMoveSolutions(self, moveList: list[Move], maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False) -> list[Self]:
+        # Create an empty solution list for the moves
+        moveSolutionList = []
+
+        # Loop through the moves to create their solutions
+        for move in moveList:
+            # Check if the charging orders are reinserted to skip the moves without a possible charging order insert or a too long tour with charging orders (without creating the solution)
+            if insertChargingOrders:
+                # Simulate the greedy charging stops on the changed tours with the charging profiles of the current tours (upper bound of the optimal charging stops)
+                chargingLengthDelta = self.evaluateMoveCharging(move)
+
+                # Check if the greedy charging stops are not possible or too long to calculate the optimal charging stops
+                if (chargingLengthDelta is None) or (chargingLengthDelta >= maximumLengthDelta - Solution.LENGTH_DELTA_ROUNDING_MARGIN):
+                    chargingLengthDelta = self.evaluateMoveCharging(move, True)
+
+                # Check if the insert is not possible or the length delta clearly exceeds the upper boundary (the accepted moves are checked exactly below)
+                if (chargingLengthDelta is None) or (chargingLengthDelta >= maximumLengthDelta + Solution.LENGTH_DELTA_ROUNDING_MARGIN): continue
+
+            # Apply the move to create the moved solution
+            moveSolution = self.applyMove(move)
+
+            # Check if the new solution should have reinserted charging orders
+            if insertChargingOrders:
+                # Check if the move is a two-opt move that changes only one tour
+                if move.moveType == MoveType.TWO_OPT:
+                    # Calculate the new tour length with the delta
+                    twoOptTourLength = self.getTourDistance(self.getDroneTourView(move.sourceDrone)) + move.lengthDelta
+
+                    # Insert charging orders back into the drone tour, if not possible continue
+                    if not moveSolution.insertChargingOrders(move.sourceDrone, None, twoOptTourLength): continue
+
+                    # Get the length of the extended tour and recalculate the length delta
+                    lengthDelta = moveSolution.getDroneTourDistance(move.sourceDrone, True) - self.getDroneTourDistance(move.sourceDrone, True)
+
+                else:
+                    # Insert charging orders back into the drone tours, if not possible continue
+                    if not moveSolution.insertChargingOrders(move.sourceDrone): continue
+                    if not moveSolution.insertChargingOrders(move.destinationDrone): continue
+
+                    # Resolve the updated tour distance of the source and destination tour
+                    updatedSourceTourDistance = moveSolution.getDroneTourDistance(move.sourceDrone, True)
+                    updatedDestinationTourDistance = moveSolution.getDroneTourDistance(move.destinationDrone, True)
+
+                    # Get the length of the extended tours and recalculate the length delta with the length of the pre move tours
+                    lengthDelta = (updatedSourceTourDistance + updatedDestinationTourDistance
+                        - self.getDroneTourDistance(move.sourceDrone, True) - self.getDroneTourDistance(move.destinationDrone, True))
+
+                # Check the recalculated lengthDelta against the upper boundary
+                if (lengthDelta >= maximumLengthDelta): continue
+
+            # All checks done so save the solution
+            moveSolutionList.append(moveSolution)
+
+        # Return the moveSolutionList
+        return moveSolutionList
+
     ################################################################################
     ####################### NEIGHBORHOOD ALGORITHM FUNCTIONS #######################
     ################################################################################
 
     def getTwoOptSolutions(self, drone: Drone, maximumLengthDelta: float = 0, insertChargingOrders: bool = False) -> list[Self]:
-        # Resolve the tour and tour length with and without recharges
-        tourOrders = self.getDroneTour(drone, False)
-        tourLength = self.getTourDistance(tourOrders)
-        tourDistance = self.getDroneTourDistance(drone, True)
+        # Create the solutions of the two-opt moves of the drone
+        return self.getMoveSolutions(self.getTwoOptMoves(drone, maximumLengthDelta), maximumLengthDelta, insertChargingOrders)
+
+    def getRelocateSolutions(self, relocateOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False, granularNeighborCount: int = None) -> list[Self]:
+        # Create the solutions of the relocate moves of the order
+        return self.getMoveSolutions(self.getRelocateMoves(relocateOrder, maximumLengthDelta, granularNeighborCount), maximumLengthDelta, insertChargingOrders)
+
+    def getExchangeSolutions(self, exchangeOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False, granularNeighborCount: int = None) -> list[Self]:
+        # Create the solutions of the exchange moves of the order
+        return self.getMoveSolutions(self.getExchangeMoves(exchangeOrder, maximumLengthDelta, granularNeighborCount), maximumLengthDelta, insertChargingOrders)
+
+    def getCrossSolutions(self, crossOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False, granularNeighborCount: int = None) -> list[Self]:
+        # Create the solutions of the cross moves of the order
+        return self.getMoveSolutions(self.getCrossMoves(crossOrder, maximumLengthDelta, granularNeighborCount), maximumLengthDelta, insertChargingOrders)
+
+    def getTwoOptMoves(self, drone: Drone, maximumLengthDelta: float = 0) -> list[Move]:
+        # Collect the lazily generated two-opt moves into a list
+        return list(self.iterateTwoOptMoves(drone, maximumLengthDelta))
+
+    def getRelocateMoves(self, relocateOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, granularNeighborCount: int = None) -> list[Move]:
+        # Collect the lazily generated relocate moves into a list
+        return list(self.iterateRelocateMoves(relocateOrder, maximumLengthDelta, None, granularNeighborCount))
+
+    def getExchangeMoves(self, exchangeOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, granularNeighborCount: int = None) -> list[Move]:
+        # Collect the lazily generated exchange moves into a list
+        return list(self.iterateExchangeMoves(exchangeOrder, maximumLengthDelta, None, granularNeighborCount))
 
-        # Create an empty solution list for the two-opt
-        twoOptSolutionList = []
+    def getCrossMoves(self, crossOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, granularNeighborCount: int = None) -> list[Move]:
+        # Collect the lazily generated cross moves into a list
+        return list(self.iterateCrossMoves(crossOrder, maximumLengthDelta, None, granularNeighborCount))
+
+    def iterateTwoOptMoves(self, drone: Drone, maximumLengthDelta: float = 0) -> Iterator[Move]:
+        # Resolve the tour without recharges and its matrix indices
+        tourOrders = self.getDroneTourView(drone)
+        tourIndices = self.getDroneTourIndices(drone)
+
+        # Check if the tour has enough edge pairs to calculate the path deltas of all two-opt swaps at once with the index array of the tour
+        if (len(tourOrders) - 2) * (len(tourOrders) - 3) // 2 >= Solution.BATCH_EVALUATION_MINIMUM:
+            # Resolve the edge pairs of the tour in the loop order (as flat index of the pair matrix)
+            edgeCount = len(tourOrders) - 1
+            outerIndexArray, innerIndexArray = self.getTwoOptPairArrays(drone)
+
+            # Use a dedicated function to calculate the path deltas for the two-opt swaps of all edge pairs at once
+            tourIndexArray = self.getDroneTourIndexArray(drone)
+            lengthDeltaArray = self.calculateTwoOptBatchLengthDeltas((tourIndexArray[outerIndexArray], tourIndexArray[outerIndexArray + 1]),
+                (tourIndexArray[innerIndexArray], tourIndexArray[innerIndexArray + 1]))
+
+            # Loop over the edge pairs with a lengthDelta below the upper boundary to yield their two-opt moves
+            for pairIndex, lengthDelta in self.selectBatchLengthDeltas(outerIndexArray * edgeCount + innerIndexArray, lengthDeltaArray, maximumLengthDelta):
+                yield Move(MoveType.TWO_OPT, drone, drone, pairIndex // edgeCount, pairIndex % edgeCount, lengthDelta)
+
+            # All two-opt moves are yielded
+            return
 
         # Loop over the tour of the drone for potential edges
         for outerTourIndex in range(0, len(tourOrders) - 3, 1):
             # Loop over the rest of the tours after this to check for potential swaps
             for innerTourIndex in range(outerTourIndex + 2, len(tourOrders) - 1, 1):
                 # Use a dedicated function to calculate the path delta for the two-opt
-                lengthDelta = self.calculateTwoOptPathLengthDelta(
-                    (tourOrders[outerTourIndex], tourOrders[outerTourIndex + 1]), 
-                    (tourOrders[innerTourIndex], tourOrders[innerTourIndex + 1])
+                lengthDelta = self.calculateTwoOptIndexLengthDelta(
+                    (tourIndices[outerTourIndex], tourIndices[outerTourIndex + 1]), 
+                    (tourIndices[innerTourIndex], tourIndices[innerTourIndex + 1])
                 )
 
                 # Check the lengthDelta against the upper boundary
                 if (lengthDelta >= maximumLengthDelta): continue
 
-                # Create the two-opt solution by changing the given paths
-                twoOptSolution = self.createTwoOptSolution(
-                    drone, outerTourIndex, innerTourIndex)
-                
-                # Check if the new solution should have reinserted charging orders
-                if insertChargingOrders:
-                    # Calculate the new tour length with the delta
-                    twoOptTourLength = tourLength + lengthDelta
+                # Yield the two-opt move between the given paths
+                yield Move(MoveType.TWO_OPT, drone, drone, outerTourIndex, innerTourIndex, lengthDelta)
 
-                    # Insert charging orders back into the drone tour, if not possible continue
-                    if not twoOptSolution.insertChargingOrders(drone, None, twoOptTourLength): continue
+    def getTwoOptPairArrays(self, drone: Drone) -> tuple[np.ndarray, np.ndarray]:
+        # Resolve the tour without recharges and the number of its edges
+        tourOrders = self.getDroneTourView(drone)
+        edgeCount = len(tourOrders) - 1
 
-                    # Get the length of the extended tour and recalculate the length delta
-                    lengthDelta = twoOptSolution.getDroneTourDistance(drone, True) - tourDistance
+        # Check if the tour is short enough to use all pairs of not adjacent edges (upper triangle in the loop order)
+        if len(tourOrders) <= Solution.TWO_OPT_NEIGHBOR_TOUR_LENGTH: return np.triu_indices(edgeCount, 2)
 
-                    # Check the recalculated lengthDelta against the upper boundary
-                    if (lengthDelta >= maximumLengthDelta): continue
+        # Resolve the order position index and the precalculated nearest orders
+        orderPositionDictionary = self.getOrderPositionDictionary()
+        orderNeighborhoodMatrix = self.getOrderNeighborhoodMatrix()
 
-                # All checks done so save the solution
-                twoOptSolutionList.append(twoOptSolution)
+        # Create the position pairs of the orders and their nearest orders in the same tour (the swap connects either both pair orders or the orders after them)
+        positionPairList = [(min(x, y), max(x, y)) for x, order in enumerate(tourOrders) for y in (orderPositionDictionary[neighborOrder][1]
+            for neighborOrder in orderNeighborhoodMatrix.get(order, ()) if orderPositionDictionary.get(neighborOrder, (None,))[0] == drone)]
+        positionPairArray = np.array(positionPairList + [(x - 1, y - 1) for x, y in positionPairList], dtype=np.intp).reshape(-1, 2)
 
-        # Return the two-opt solution list
-        return twoOptSolutionList
+        # Remove the invalid edge pairs (adjacent or out of the tour) and the duplicates (unique sorts the pairs into the loop order)
+        positionPairArray = positionPairArray[(positionPairArray[:, 0] >= 0) & (positionPairArray[:, 1] >= positionPairArray[:, 0] + 2) & (positionPairArray[:, 1] < edgeCount)]
+        pairIndexArray = np.unique(positionPairArray[:, 0] * edgeCount + positionPairArray[:, 1])
 
-    def getRelocateSolutions(self, relocateOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False) -> list[Self]:
-        # Resolve the drone, tour, index and tour distance of the relocate order
-        relocateOrderDrone = self.getDroneByOrder(relocateOrder)
-        relocateTourOrders = self.getDroneTour(relocateOrderDrone, False)
-        relocateOrderIndex = relocateTourOrders.index(relocateOrder)
-        relocateTourDistance = self.getDroneTourDistance(relocateOrderDrone, True)
+        # Count the candidates that are skipped by the nearest orders
+        self.problemInstance.addSkippedCandidateCount((edgeCount - 1) * (edgeCount - 2) // 2 - len(pairIndexArray))
 
-        # Create an empty solution list for the relocates
-        relocateSolutionList = []
+        # Return the outer and inner edge indices of the pairs
+        return pairIndexArray // edgeCount, pairIndexArray % edgeCount
+
+    def iterateRelocateMoves(self, relocateOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, partnerDroneList: list[Drone] = None, granularNeighborCount: int = None) -> Iterator[Move]:
+        # Resolve the drone, tour and index of the relocate order
+        relocateOrderDrone, relocateOrderIndex = self.getOrderPosition(relocateOrder)
+        relocateTourOrders = self.getDroneTourView(relocateOrderDrone)
+        relocateTourIndices = self.getDroneTourIndices(relocateOrderDrone)
 
         # Check if the relocate order is shiftable (not first order)
-        if (relocateOrderIndex == 0): return relocateSolutionList
+        if (relocateOrderIndex == 0): return
 
         # Check if the relocate order is shiftable (not last order)
-        if (relocateOrderIndex == (len(relocateTourOrders) - 1)): return relocateSolutionList
+        if (relocateOrderIndex == (len(relocateTourOrders) - 1)): return
 
-        # Loop through the list of drones
-        for partnerDrone in self.droneList:
-            # Check if the relocate partner is the same drone
-            if (partnerDrone == relocateOrderDrone): continue
+        # Resolve the positions of the nearest orders in the partner tours if the neighborhood is granular
+        neighborPositionDictionary = None if granularNeighborCount is None else self.getGranularNeighborPositions(relocateOrder, granularNeighborCount)
 
-            # Resolve the tour and tour length with recharges
-            partnerTourOrders = self.getDroneTour(partnerDrone, False)
-            partnerTourDistance = self.getDroneTourDistance(partnerDrone, True)
+        # Resolve the matrix indices of the relocate order and its neighbors in the tour
+        relocatePath = (relocateTourIndices[relocateOrderIndex - 1], relocateTourIndices[relocateOrderIndex], relocateTourIndices[relocateOrderIndex + 1])
 
-            # Loop over the tour of the partner drone for relocates
-            for partnerTourIndex in range(0, len(partnerTourOrders) - 1, 1):
-                # Use a dedicated function to calculate the path delta for the relocate shift
-                lengthDelta = self.calculateRelocatePathLengthDelta(
-                    (relocateTourOrders[relocateOrderIndex - 1], relocateTourOrders[relocateOrderIndex], relocateTourOrders[relocateOrderIndex + 1]), 
-                    (partnerTourOrders[partnerTourIndex], partnerTourOrders[partnerTourIndex + 1])
-                )
-
-                # Check the lengthDelta against the upper boundary
-                if (lengthDelta >= maximumLengthDelta): continue
+        # Loop through the list of partner drones (all drones by default)
+        for partnerDrone in (self.droneList if partnerDroneList is None else partnerDroneList):
+            # Check if the relocate partner is the same drone
+            if (partnerDrone == relocateOrderDrone): continue
 
-                # Create the relocate solution by changing the given paths
-                relocateSolution = self.createRelocateSolution(
-                    relocateOrderDrone, partnerDrone, relocateOrder, partnerTourIndex + 1)
-                
-                # Check if the new solution should have reinserted charging orders
-                if insertChargingOrders:
-                    # Insert charging orders back into the drone tours, if not possible continue
-                    if not relocateSolution.insertChargingOrders(relocateOrderDrone): continue
-                    if not relocateSolution.insertChargingOrders(partnerDrone): continue
+            # Resolve the tour without recharges and its matrix indices
+            partnerTourOrders = self.getDroneTourView(partnerDrone)
+            partnerTourIndices = self.getDroneTourIndices(partnerDrone)
 
-                    # Resolve the updated tour distance of the reloacate order and partner tour
-                    updatedRelocateTourDistance = relocateSolution.getDroneTourDistance(relocateOrderDrone, True)
-                    updatedPartnerTourDistance = relocateSolution.getDroneTourDistance(partnerDrone, True)
+            # Resolve the partner tour positions and prune the positions between the orders if the lower bound exceeds the upper boundary (only the depot edges remain)
+            partnerTourIndexRange = range(0, len(partnerTourOrders) - 1, 1)
+            if self.isPartnerTourPruned(self.calculateRelocateLowerBound(relocatePath, partnerDrone, maximumLengthDelta), maximumLengthDelta, max(0, len(partnerTourIndexRange) - 2)):
+                partnerTourIndexRange = sorted({0, len(partnerTourOrders) - 2})
 
-                    # Get the length of the extended tours and recalculate the length delta with the length of the pre relocate tours
-                    lengthDelta = (updatedRelocateTourDistance + updatedPartnerTourDistance - relocateTourDistance - partnerTourDistance)
+            # Resolve the partner tour indices for relocates (only next to the nearest orders if the neighborhood is granular)
+            partnerTourIndexList = self.getGranularPartnerTourIndices(neighborPositionDictionary, partnerDrone, partnerTourIndexRange, (-1, 0))
 
-                    # Check the recalculated lengthDelta against the upper boundary
-                    if (lengthDelta >= maximumLengthDelta): continue
+            # Check if there are enough partner tour indices to calculate the path deltas for the relocate shifts at once with the index array of the partner tour
+            if len(partnerTourIndexList) >= Solution.BATCH_EVALUATION_MINIMUM:
+                partnerTourIndexArray, partnerTourIndices = np.asarray(partnerTourIndexList, dtype=np.intp), self.getDroneTourIndexArray(partnerDrone)
+                partnerLengthDeltas = self.selectBatchLengthDeltas(partnerTourIndexArray, self.calculateRelocateBatchLengthDeltas(relocatePath,
+                    (partnerTourIndices[partnerTourIndexArray], partnerTourIndices[partnerTourIndexArray + 1])), maximumLengthDelta)
 
-                # All checks done so save the solution
-                relocateSolutionList.append(relocateSolution)
+            else:
+                # Use a dedicated function to calculate the path delta for each relocate shift
+                partnerLengthDeltas = [(x, self.calculateRelocateIndexLengthDelta(relocatePath,
+                    (partnerTourIndices[x], partnerTourIndices[x + 1]))) for x in partnerTourIndexList]
 
-        # Return the relocateSolutionList
-        return relocateSolutionList
+            # Loop over the partner tour indices with their lengthDelta
+            for partnerTourIndex, lengthDelta in partnerLengthDeltas:
+                # Check the lengthDelta against the upper boundary
+                if (lengthDelta >= maximumLengthDelta): continue
 
-    def getExchangeSolutions(self, exchangeOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False) -> list[Self]:
-        # Resolve the drone, tour, index and tour distance of the exchange order
-        exchangeOrderDrone = self.getDroneByOrder(exchangeOrder)
-        exchangeTourOrders = self.getDroneTour(exchangeOrderDrone, False)
-        exchangeOrderIndex = exchangeTourOrders.index(exchangeOrder)
-        exchangeTourDistance = self.getDroneTourDistance(exchangeOrderDrone, True)
+                # Yield the relocate move that inserts the order after the partner tour index
+                yield Move(MoveType.RELOCATE, relocateOrderDrone, partnerDrone, relocateOrderIndex, partnerTourIndex + 1, lengthDelta)
 
-        # Create an empty solution list for the exchanges
-        exchangeSolutionList = []
+    def iterateExchangeMoves(self, exchangeOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, partnerDroneList: list[Drone] = None, granularNeighborCount: int = None) -> Iterator[Move]:
+        # Resolve the drone, tour and index of the exchange order
+        exchangeOrderDrone, exchangeOrderIndex = self.getOrderPosition(exchangeOrder)
+        exchangeTourOrders = self.getDroneTourView(exchangeOrderDrone)
+        exchangeTourIndices = self.getDroneTourIndices(exchangeOrderDrone)
 
         # Check if the exchange order is swapable (not first order)
-        if (exchangeOrderIndex == 0): return exchangeSolutionList
+        if (exchangeOrderIndex == 0): return
 
         # Check if the exchange order is swapable (not last order)
-        if (exchangeOrderIndex == (len(exchangeTourOrders) - 1)): return exchangeSolutionList
+        if (exchangeOrderIndex == (len(exchangeTourOrders) - 1)): return
 
-        # Loop through the list of drones
-        for partnerDrone in self.droneList:
-            # Check if the exchange partner is the same drone
-            if (partnerDrone == exchangeOrderDrone): continue
+        # Resolve the positions of the nearest orders in the partner tours if the neighborhood is granular
+        neighborPositionDictionary = None if granularNeighborCount is None else self.getGranularNeighborPositions(exchangeOrder, granularNeighborCount)
 
-            # Resolve the tour and tour length with recharges
-            partnerTourOrders = self.getDroneTour(partnerDrone, False)
-            partnerTourDistance = self.getDroneTourDistance(partnerDrone, True)
+        # Resolve the matrix indices of the exchange order and its neighbors in the tour
+        exchangePath = (exchangeTourIndices[exchangeOrderIndex - 1], exchangeTourIndices[exchangeOrderIndex], exchangeTourIndices[exchangeOrderIndex + 1])
 
-            # Loop over the tour of the partner drone for exchanges
-            for partnerTourIndex in range(1, len(partnerTourOrders) - 1, 1):
-                # Use a dedicated function to calculate the path delta for the exchange swap
-                lengthDelta = self.calculateExchangePathLengthDelta(
-                    (exchangeTourOrders[exchangeOrderIndex - 1], exchangeTourOrders[exchangeOrderIndex], exchangeTourOrders[exchangeOrderIndex + 1]), 
-                    (partnerTourOrders[partnerTourIndex - 1], partnerTourOrders[partnerTourIndex], partnerTourOrders[partnerTourIndex + 1])
-                )
-
-                # Check the lengthDelta against the upper boundary
-                if (lengthDelta >= maximumLengthDelta): continue
+        # Loop through the list of partner drones (all drones by default)
+        for partnerDrone in (self.droneList if partnerDroneList is None else partnerDroneList):
+            # Check if the exchange partner is the same drone
+            if (partnerDrone == exchangeOrderDrone): continue
 
-                # Create the exchange solution by changing the given paths
-                exchangeSolution = self.createExchangeSolution(
-                    exchangeOrderDrone, partnerDrone, exchangeOrderIndex, partnerTourIndex)
-                
-                # Check if the new solution should have reinserted charging orders
-                if insertChargingOrders:
-                    # Insert charging orders back into the drone tours, if not possible continue
-                    if not exchangeSolution.insertChargingOrders(exchangeOrderDrone): continue
-                    if not exchangeSolution.insertChargingOrders(partnerDrone): continue
+            # Resolve the tour without recharges and its matrix indices
+            partnerTourOrders = self.getDroneTourView(partnerDrone)
+            partnerTourIndices = self.getDroneTourIndices(partnerDrone)
 
-                    # Resolve the updated tour distance of the reloacate order and partner tour
-                    updatedExchangeTourDistance = exchangeSolution.getDroneTourDistance(exchangeOrderDrone, True)
-                    updatedPartnerTourDistance = exchangeSolution.getDroneTourDistance(partnerDrone, True)
+            # Resolve the partner tour positions and prune the positions between the orders if the lower bound exceeds the upper boundary (only the orders next to the depots remain)
+            partnerTourIndexRange = range(1, len(partnerTourOrders) - 1, 1)
+            if self.isPartnerTourPruned(self.calculateExchangeLowerBound(exchangePath, partnerDrone, maximumLengthDelta), maximumLengthDelta, max(0, len(partnerTourIndexRange) - 2)):
+                partnerTourIndexRange = sorted({1, len(partnerTourOrders) - 2})
 
-                    # Get the length of the extended tours and recalculate the length delta with the length of the pre exchange tours
-                    lengthDelta = (updatedExchangeTourDistance + updatedPartnerTourDistance - exchangeTourDistance - partnerTourDistance)
+            # Resolve the partner tour indices for exchanges (only next to the nearest orders if the neighborhood is granular)
+            partnerTourIndexList = self.getGranularPartnerTourIndices(neighborPositionDictionary, partnerDrone, partnerTourIndexRange, (-1, 1))
 
-                    # Check the recalculated lengthDelta against the upper boundary
-                    if (lengthDelta >= maximumLengthDelta): continue
+            # Check if there are enough partner tour indices to calculate the path deltas for the exchange swaps at once with the index array of the partner tour
+            if len(partnerTourIndexList) >= Solution.BATCH_EVALUATION_MINIMUM:
+                partnerTourIndexArray, partnerTourIndices = np.asarray(partnerTourIndexList, dtype=np.intp), self.getDroneTourIndexArray(partnerDrone)
+                partnerLengthDeltas = self.selectBatchLengthDeltas(partnerTourIndexArray, self.calculateExchangeBatchLengthDeltas(exchangePath,
+                    (partnerTourIndices[partnerTourIndexArray - 1], partnerTourIndices[partnerTourIndexArray], partnerTourIndices[partnerTourIndexArray + 1])), maximumLengthDelta)
 
-                # All checks done so save the solution
-                exchangeSolutionList.append(exchangeSolution)
+            else:
+                # Use a dedicated function to calculate the path delta for each exchange swap
+                partnerLengthDeltas = [(x, self.calculateExchangeIndexLengthDelta(exchangePath,
+                    (partnerTourIndices[x - 1], partnerTourIndices[x], partnerTourIndices[x + 1]))) for x in partnerTourIndexList]
 
-        # Return the exchangeSolutionList
-        return exchangeSolutionList
+            # Loop over the partner tour indices with their lengthDelta
+            for partnerTourIndex, lengthDelta in partnerLengthDeltas:
+                # Check the lengthDelta against the upper boundary
+                if (lengthDelta >= maximumLengthDelta): continue
 
-    def getCrossSolutions(self, crossOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, insertChargingOrders: bool = False) -> list[Self]:
-        # Resolve the drone, tour, index and tour distance of the cross order
-        crossOrderDrone = self.getDroneByOrder(crossOrder)
-        crossTourOrders = self.getDroneTour(crossOrderDrone, False)
-        crossOrderIndex = crossTourOrders.index(crossOrder)
-        crossTourDistance = self.getDroneTourDistance(crossOrderDrone, True)
+                # Yield the exchange move between the given paths
+                yield Move(MoveType.EXCHANGE, exchangeOrderDrone, partnerDrone, exchangeOrderIndex, partnerTourIndex, lengthDelta)
 
-        # Create an empty solution list for the crosses
-        crossSolutionList = []
+    def iterateCrossMoves(self, crossOrder: Order, maximumLengthDelta: float = FLOAT_POSITIVE_INFINITY, partnerDroneList: list[Drone] = None, granularNeighborCount: int = None) -> Iterator[Move]:
+        # Resolve the drone, tour and index of the cross order
+        crossOrderDrone, crossOrderIndex = self.getOrderPosition(crossOrder)
+        crossTourOrders = self.getDroneTourView(crossOrderDrone)
+        crossTourIndices = self.getDroneTourIndices(crossOrderDrone)
 
         # Check if the cross order is swapable (not first order)
-        if (crossOrderIndex == 0): return crossSolutionList
+        if (crossOrderIndex == 0): return
 
         # Check if the cross order is swapable (not last order)
-        if (crossOrderIndex == (len(crossTourOrders) - 1)): return crossSolutionList
+        if (crossOrderIndex == (len(crossTourOrders) - 1)): return
+
+        # Resolve the positions of the nearest orders in the partner tours if the neighborhood is granular
+        neighborPositionDictionary = None if granularNeighborCount is None else self.getGranularNeighborPositions(crossOrder, granularNeighborCount)
 
-        # Loop through the list of drones
-        for partnerDrone in self.droneList:
+        # Resolve the matrix indices of the cross order and its next order in the tour
+        crossPath = (crossTourIndices[crossOrderIndex], crossTourIndices[crossOrderIndex + 1])
+
+        # Loop through the list of partner drones (all drones by default)
+        for partnerDrone in (self.droneList if partnerDroneList is None else partnerDroneList):
             # Check if the cross partner is the same drone
             if (partnerDrone == crossOrderDrone): continue
 
-            # Resolve the tour and tour length with recharges
-            partnerTourOrders = self.getDroneTour(partnerDrone, False)
-            partnerTourDistance = self.getDroneTourDistance(partnerDrone, True)
-
-            # Loop over the tour of the partner drone for crosses
-            for partnerTourIndex in range(1, len(partnerTourOrders) - 1, 1):
-                # Use a dedicated function to calculate the path delta for the cross swap
-                lengthDelta = self.calculateCrossPathLengthDelta(
-                    (crossTourOrders[crossOrderIndex], crossTourOrders[crossOrderIndex + 1]), 
-                    (partnerTourOrders[partnerTourIndex], partnerTourOrders[partnerTourIndex + 1])
-                )
+            # Resolve the tour without recharges and its matrix indices
+            partnerTourOrders = self.getDroneTourView(partnerDrone)
+            partnerTourIndices = self.getDroneTourIndices(partnerDrone)
 
-                # Check the lengthDelta against the upper boundary
-                if (lengthDelta >= maximumLengthDelta): continue
+            # Resolve the partner tour positions and prune the positions between the orders if the lower bound exceeds the upper boundary (only the depot edge remains)
+            partnerTourIndexRange = range(1, len(partnerTourOrders) - 1, 1)
+            if self.isPartnerTourPruned(self.calculateCrossLowerBound(crossPath, partnerDrone, maximumLengthDelta), maximumLengthDelta, max(0, len(partnerTourIndexRange) - 1)):
+                partnerTourIndexRange = partnerTourIndexRange[-1:]
 
-                # Create the cross solution by changing the given paths
-                crossSolution = self.createCrossSolution(
-                    crossOrderDrone, partnerDrone, crossOrderIndex, partnerTourIndex)
-                
-                # Check if the new solution should have reinserted charging orders
-                if insertChargingOrders:
-                    # Insert charging orders back into the drone tours, if not possible continue
-                    if not crossSolution.insertChargingOrders(crossOrderDrone): continue
-                    if not crossSolution.insertChargingOrders(partnerDrone): continue
+            # Resolve the partner tour indices for crosses (only next to the nearest orders if the neighborhood is granular)
+            partnerTourIndexList = self.getGranularPartnerTourIndices(neighborPositionDictionary, partnerDrone, partnerTourIndexRange, (-1,))
 
-                    # Resolve the updated tour distance of the cross order and partner tour
-                    updatedCrossTourDistance = crossSolution.getDroneTourDistance(crossOrderDrone, True)
-                    updatedPartnerTourDistance = crossSolution.getDroneTourDistance(partnerDrone, True)
+            # Check if there are enough partner tour indices to calculate the path deltas for the cross swaps at once with the index array of the partner tour
+            if len(partnerTourIndexList) >= Solution.BATCH_EVALUATION_MINIMUM:
+                partnerTourIndexArray, partnerTourIndices = np.asarray(partnerTourIndexList, dtype=np.intp), self.getDroneTourIndexArray(partnerDrone)
+                partnerLengthDeltas = self.selectBatchLengthDeltas(partnerTourIndexArray, self.calculateCrossBatchLengthDeltas(crossPath,
+                    (partnerTourIndices[partnerTourIndexArray], partnerTourIndices[partnerTourIndexArray + 1])), maximumLengthDelta)
 
-                    # Get the length of the extended tours and recalculate the length delta with the length of the pre crossed tours
-                    lengthDelta = (updatedCrossTourDistance + updatedPartnerTourDistance - crossTourDistance - partnerTourDistance)
+            else:
+                # Use a dedicated function to calculate the path delta for each cross swap
+                partnerLengthDeltas = [(x, self.calculateCrossIndexLengthDelta(crossPath,
+                    (partnerTourIndices[x], partnerTourIndices[x + 1]))) for x in partnerTourIndexList]
 
-                    # Check the recalculated lengthDelta against the upper boundary
-                    if (lengthDelta >= maximumLengthDelta): continue
-                
-                # All checks done so save the solution
-                crossSolutionList.append(crossSolution)
+            # Loop over the partner tour indices with their lengthDelta
+            for partnerTourIndex, lengthDelta in partnerLengthDeltas:
+                # Check the lengthDelta against the upper boundary
+                if (lengthDelta >= maximumLengthDelta): continue
 
-        # Return the crossSolutionList
-        return crossSolutionList
+                # Yield the cross move between the given paths
+                yield Move(MoveType.CROSS, crossOrderDrone, partnerDrone, crossOrderIndex, partnerTourIndex, lengthDelta)
     
     ################################################################################
     ############################### Two-Opt FUNCTIONS ##############################
     ################################################################################
 
     def calculateTwoOptPathLengthDelta(self, firstPath: tuple[Order, Order], secondPath: tuple[Order, Order]) -> float:
+        # Resolve the matrix indices of the path orders and use the index based function
+        return self.calculateTwoOptIndexLengthDelta(self.getOrderIndices(firstPath), self.getOrderIndices(secondPath))
+
+    def calculateTwoOptIndexLengthDelta(self, firstPath: tuple[int, int], secondPath: tuple[int, int]) -> float:
+        # Resolve the index based distance function of the distance matrix
+        distance = self.distanceMatrix.getDistance
+
         # Use the precalculation to get the path delta for two-opt swap
         lengthDelta = (
-            self.getOrderDistance(firstPath[0], secondPath[0])
-            + self.getOrderDistance(firstPath[1], secondPath[1])
-            - self.getOrderDistance(firstPath[0], firstPath[1])
-            - self.getOrderDistance(secondPath[0], secondPath[1])
+            distance(firstPath[0], secondPath[0])
+            + distance(firstPath[1], secondPath[1])
+            - distance(firstPath[0], firstPath[1])
+            - distance(secondPath[0], secondPath[1])
         )
     
         # Return the rounded result
         return round(lengthDelta, 2)
     
+    def calculateTwoOptBatchLengthDeltas(self, firstPathArrays: tuple[np.ndarray, np.ndarray], secondPathArrays: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        # Resolve the array based distance function of the distance matrix
+        distances = self.distanceMatrix.getDistances
+
+        # Use the same precalculation as the single two-opt swap element wise (same summation order, not rounded)
+        return (
+            distances(firstPathArrays[0], secondPathArrays[0])
+            + distances(firstPathArrays[1], secondPathArrays[1])
+            - distances(firstPathArrays[0], firstPathArrays[1])
+            - distances(secondPathArrays[0], secondPathArrays[1])
+        )
+
     def createTwoOptSolution(self, drone: Drone, firstPathIndex: int, secondPathIndex: int) -> Self:
         # Create a partly deep copy of the solution
         solutionCopy = self.getSolutionCopy()
         
         # Resolve the droneTour from the solution copy
-        droneTour = solutionCopy.getDroneTour(drone, False)
+        droneTour = solutionCopy.getDroneTourView(drone)
 
         # Reconstruct the droneTour by performing the two-opt swap with the pathIndex
         droneTour = droneTour[:(firstPathIndex + 1)] + droneTour[
             secondPathIndex:firstPathIndex:-1] + droneTour[(secondPathIndex + 1):]
 
         # Update the orderList of the drone with the droneTour
-        solutionCopy.solutionMatrix[drone] = droneTour
+        solutionCopy.setDroneTour(drone, droneTour)
 
         # Return the modified solution copy
         return solutionCopy
     
+    ################################################################################
+    ################################ Or-Opt FUNCTIONS ##############################
+    ################################################################################
+
+    def calculateOrOptIndexLengthDelta(self, segmentPath: tuple[int, int, int, int], insertPath: tuple[int, int, int, int]) -> float:
+        # Hint: The segment path is (previous, first, last, next) and the insert path is (previous, first, last, next) of the inserted segment (first and last in the new orientation)
+        # Resolve the index based distance function of the distance matrix
+        distance = self.distanceMatrix.getDistance
+
+        # Use the precalculation to get the path delta for the segment shift (insert the segment between the insert orders and close the gap of the segment)
+        lengthDelta = (
+            distance(insertPath[0], insertPath[1])
+            + distance(insertPath[2], insertPath[3])
+            + distance(segmentPath[0], segmentPath[3])
+            - distance(insertPath[0], insertPath[3])
+            - distance(segmentPath[0], segmentPath[1])
+            - distance(segmentPath[2], segmentPath[3])
+        )
+
+        # Return the rounded result
+        return round(lengthDelta, 2)
+
+    def improveDroneTour(self, drone: Drone, neighborCount: int, maximumSegmentLength: int = 3) -> int:
+        # Hint: Changes the tour of the solution itself (without copying the solution), so the solution must not be shared
+        # Resolve the tour without recharges and its matrix indices as changeable lists
+        droneTour = list(self.getDroneTourView(drone))
+        tourIndices = list(self.getDroneTourIndices(drone))
+
+        # Resolve the precalculated nearest orders
+        orderNeighborhoodMatrix = self.getOrderNeighborhoodMatrix()
+
+        # Resolve the nearest orders of each order in the same tour (the depot orders at both ends stay fixed)
+        tourOrderSet = set(droneTour[1:-1])
+        neighborDictionary = dict((order, [x for x in orderNeighborhoodMatrix.get(order, ()) if x in tourOrderSet][:neighborCount]) for order in droneTour[1:-1])
+
+        # Create the position index of the orders and the queue of the orders that are checked (don't look bits are cleared for all orders)
+        orderPositionDictionary = dict((x, position) for position, x in enumerate(droneTour[1:-1], 1))
+        activeOrderQueue, activeOrderSet = deque(droneTour[1:-1]), set(droneTour[1:-1])
+
+        # Save the number of applied moves
+        moveCount = 0
+
+        # Loop through the active orders until all don't look bits are set
+        while activeOrderQueue:
+            # Resolve the next active order and set its don't look bit
+            order = activeOrderQueue.popleft()
+            activeOrderSet.discard(order)
+
+            # Find the first improving two-opt or or-opt move next to the order and check if there is none
+            changedPositionList = self.findOrderImprovement(droneTour, tourIndices, orderPositionDictionary, order, neighborDictionary[order], maximumSegmentLength)
+            if changedPositionList is None: continue
+
+            # Update the matrix indices and the position index of the changed tour
+            tourIndices[:] = self.getOrderIndices(droneTour)
+            orderPositionDictionary = dict((x, position) for position, x in enumerate(droneTour[1:-1], 1))
+            moveCount += 1
+
+            # Loop through the orders at the ends of the changed edges (and the order itself) to clear their don't look bits
+            for changedOrder in [order] + [droneTour[x] for x in changedPositionList]:
+                # Check if the order is no depot order and not already active
+                if (changedOrder not in orderPositionDictionary) or (changedOrder in activeOrderSet): continue
+
+                # Add the order to the queue of the active orders
+                activeOrderQueue.append(changedOrder)
+                activeOrderSet.add(changedOrder)
+
+        # Replace the drone tour if any move is applied
+        if moveCount > 0: self.setDroneTour(drone, droneTour)
+
+        # Return the number of applied moves
+        return moveCount
+
+    def findOrderImprovement(self, droneTour: list[Order], tourIndices: list[int], orderPositionDictionary: dict[Order, int], order: Order, neighborList: list[Order],
+        maximumSegmentLength: int) -> list[int] | None:
+        # Hint: Applies the first improving move to the given tour list and returns the positions of the orders at the changed edges (None if there is no improving move)
+        # Resolve the position of the order and the last position of the tour
+        orderPosition, lastPosition = orderPositionDictionary[order], len(droneTour) - 1
+
+        # Loop through the nearest orders of the order in the tour for the two-opt moves that connect the order with the nearest order
+        for neighborOrder in neighborList:
+            # Resolve the position of the nearest order
+            neighborPosition = orderPositionDictionary[neighborOrder]
+
+            # Loop through the edge pairs that connect both orders (as first or second orders of the two-opt edges)
+            for firstIndex, secondIndex in ((min(orderPosition, neighborPosition), max(orderPosition, neighborPosition)),
+                (min(orderPosition, neighborPosition) - 1, max(orderPosition, neighborPosition) - 1)):
+                # Check if the edges are valid (not adjacent and within the tour)
+                if (firstIndex < 0) or (secondIndex < firstIndex + 2) or (secondIndex >= lastPosition): continue
+
+                # Use a dedicated function to calculate the path delta for the two-opt and check if it is improving
+                if self.calculateTwoOptIndexLengthDelta((tourIndices[firstIndex], tourIndices[firstIndex + 1]), (tourIndices[secondIndex], tourIndices[secondIndex + 1])) >= 0: continue
+
+                # Reverse the tour between the edges and return the positions of the changed edges
+                droneTour[(firstIndex + 1):(secondIndex + 1)] = droneTour[secondIndex:firstIndex:-1]
+                return [firstIndex, firstIndex + 1, secondIndex, secondIndex + 1]
+
+        # Loop through the segments that start or end with the order for the or-opt moves (up to the maximum segment length)
+        for segmentStart, segmentEnd in dict.fromkeys((orderPosition - x, orderPosition - x + segmentLength - 1) for segmentLength in range(1, maximumSegmentLength + 1, 1)
+            for x in (0, segmentLength - 1)):
+            # Check if the segment is within the orders of the tour (not the depot orders)
+            if (segmentStart < 1) or (segmentEnd > lastPosition - 1): continue
+
+            # Resolve the other end of the segment and the matrix indices around the segment
+            otherPosition = segmentEnd if orderPosition == segmentStart else segmentStart
+            segmentPath = (tourIndices[segmentStart - 1], tourIndices[segmentStart], tourIndices[segmentEnd], tourIndices[segmentEnd + 1])
+
+            # Loop through the nearest orders of the order to insert the segment next to them (the order is connected with the nearest order)
+            for neighborOrder in neighborList:
+                # Resolve the position of the nearest order and check if it is outside of the segment
+                neighborPosition = orderPositionDictionary[neighborOrder]
+                if segmentStart <= neighborPosition <= segmentEnd: continue
+
+                # Check if the segment is inserted after the nearest order (the edge after the nearest order is not next to the segment)
+                if not (segmentStart - 1 <= neighborPosition <= segmentEnd):
+                    # Use a dedicated function to calculate the path delta for the segment shift and check if it is improving
+                    if self.calculateOrOptIndexLengthDelta(segmentPath, (tourIndices[neighborPosition], tourIndices[orderPosition], tourIndices[otherPosition], tourIndices[neighborPosition + 1])) < 0:
+                        # Shift the segment behind the nearest order and return the positions of the changed edges
+                        return self.shiftTourSegment(droneTour, segmentStart, segmentEnd, neighborPosition + 1, orderPosition != segmentStart)
+
+                # Check if the segment is inserted before the nearest order (the edge before the nearest order is not next to the segment)
+                if not (segmentStart <= neighborPosition <= segmentEnd + 1):
+                    # Use a dedicated function to calculate the path delta for the segment shift and check if it is improving
+                    if self.calculateOrOptIndexLengthDelta(segmentPath, (tourIndices[neighborPosition - 1], tourIndices[otherPosition], tourIndices[orderPosition], tourIndices[neighborPosition])) < 0:
+                        # Shift the segment in front of the nearest order and return the positions of the changed edges
+                        return self.shiftTourSegment(droneTour, segmentStart, segmentEnd, neighborPosition, orderPosition == segmentStart)
+
+        # There is no improving move next to the order
+        return None
+
+    def shiftTourSegment(self, droneTour: list[Order], segmentStart: int, segmentEnd: int, insertPosition: int, reverseSegment: bool) -> list[int]:
+        # Cut the segment out of the tour (reversed if requested)
+        segment = droneTour[segmentStart:(segmentEnd + 1)]
+        if reverseSegment: segment.reverse()
+        del droneTour[segmentStart:(segmentEnd + 1)]
+
+        # Shift the insert position if it is behind the removed segment and insert the segment
+        if insertPosition > segmentEnd: insertPosition -= len(segment)
+        droneTour[insertPosition:insertPosition] = segment
+
+        # Return the positions of the orders at the changed edges (around the gap and around the inserted segment)
+        return [segmentStart - 1 if segmentStart <= insertPosition else segmentStart + len(segment) - 1, segmentStart if segmentStart <= insertPosition else segmentStart + len(segment),
+            insertPosition - 1, insertPosition, insertPosition + len(segment) - 1, insertPosition + len(segment)]
+
     ################################################################################
     ############################### Relocate FUNCTIONS #############################
     ################################################################################
 
     def calculateRelocatePathLengthDelta(self, firstPath: tuple[Order, Order, Order], secondPath: tuple[Order, Order]) -> float:
+        # Resolve the matrix indices of the path orders and use the index based function
+        return self.calculateRelocateIndexLengthDelta(self.getOrderIndices(firstPath), self.getOrderIndices(secondPath))
+
+    def calculateRelocateIndexLengthDelta(self, firstPath: tuple[int, int, int], secondPath: tuple[int, int]) -> float:
+        # Resolve the index based distance function of the distance matrix
+        distance = self.distanceMatrix.getDistance
+
         # Use the precalculation to get the path delta for relocate shift
         lengthDelta = (
-            self.getOrderDistance(secondPath[0], firstPath[1])
-            + self.getOrderDistance(firstPath[1], secondPath[1])
-            + self.getOrderDistance(firstPath[0], firstPath[2])
-            - self.getOrderDistance(firstPath[0], firstPath[1])
-            - self.getOrderDistance(firstPath[1], firstPath[2])
-            - self.getOrderDistance(secondPath[0], secondPath[1])
+            distance(secondPath[0], firstPath[1])
+            + distance(firstPath[1], secondPath[1])
+            + distance(firstPath[0], firstPath[2])
+            - distance(firstPath[0], firstPath[1])
+            - distance(firstPath[1], firstPath[2])
+            - distance(secondPath[0], secondPath[1])
         )
     
         # Return the rounded result
         return round(lengthDelta, 2)
 
+    def calculateRelocateBatchLengthDeltas(self, firstPath: tuple[int, int, int], secondPathArrays: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        # Resolve the array based distance function of the distance matrix
+        distances = self.distanceMatrix.getDistances
+
+        # Use the same precalculation as the single relocate shift element wise (same summation order, not rounded)
+        return (
+            distances(secondPathArrays[0], firstPath[1])
+            + distances(firstPath[1], secondPathArrays[1])
+            + self.distanceMatrix.getDistance(firstPath[0], firstPath[2])
+            - self.distanceMatrix.getDistance(firstPath[0], firstPath[1])
+            - self.distanceMatrix.getDistance(firstPath[1], firstPath[2])
+            - distances(secondPathArrays[0], secondPathArrays[1])
+        )
+
     def createRelocateSolution(self, sourceDrone: Drone, destinationDrone: Drone, relocateOrder: Order, destinationTourIndex: int) -> Self:
         # Create a partly deep copy of the solution
         solutionCopy = self.getSolutionCopy()
@@ -430,8 +1447,8 @@ class Solution():
         destinationDroneTour.insert(destinationTourIndex, relocateOrder)
 
         # Update the orderList of the source and destination drone
-        solutionCopy.solutionMatrix[sourceDrone] = sourceDroneTour
-        solutionCopy.solutionMatrix[destinationDrone] = destinationDroneTour
+        solutionCopy.setDroneTour(sourceDrone, sourceDroneTour)
+        solutionCopy.setDroneTour(destinationDrone, destinationDroneTour)
 
         # Return the modified solution copy
         return solutionCopy
@@ -441,21 +1458,44 @@ class Solution():
     ################################################################################
 
     def calculateExchangePathLengthDelta(self, firstPath: tuple[Order, Order, Order], secondPath: tuple[Order, Order, Order]) -> float:
+        # Resolve the matrix indices of the path orders and use the index based function
+        return self.calculateExchangeIndexLengthDelta(self.getOrderIndices(firstPath), self.getOrderIndices(secondPath))
+
+    def calculateExchangeIndexLengthDelta(self, firstPath: tuple[int, int, int], secondPath: tuple[int, int, int]) -> float:
+        # Resolve the index based distance function of the distance matrix
+        distance = self.distanceMatrix.getDistance
+
         # Use the precalculation to get the path delta for exchange swap
         lengthDelta = (
-            self.getOrderDistance(firstPath[0], secondPath[1])
-            + self.getOrderDistance(secondPath[1], firstPath[2])
-            + self.getOrderDistance(secondPath[0], firstPath[1])
-            + self.getOrderDistance(firstPath[1], secondPath[2])
-            - self.getOrderDistance(firstPath[0], firstPath[1])
-            - self.getOrderDistance(firstPath[1], firstPath[2])
-            - self.getOrderDistance(secondPath[0], secondPath[1])
-            - self.getOrderDistance(secondPath[1], secondPath[2])
+            distance(firstPath[0], secondPath[1])
+            + distance(secondPath[1], firstPath[2])
+            + distance(secondPath[0], firstPath[1])
+            + distance(firstPath[1], secondPath[2])
+            - distance(firstPath[0], firstPath[1])
+            - distance(firstPath[1], firstPath[2])
+            - distance(secondPath[0], secondPath[1])
+            - distance(secondPath[1], secondPath[2])
         )
     
         # Return the rounded result
         return round(lengthDelta, 2)
     
+    def calculateExchangeBatchLengthDeltas(self, firstPath: tuple[int, int, int], secondPathArrays: tuple[np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+        # Resolve the array based distance function of the distance matrix
+        distances = self.distanceMatrix.getDistances
+
+        # Use the same precalculation as the single exchange swap element wise (same summation order, not rounded)
+        return (
+            distances(firstPath[0], secondPathArrays[1])
+            + distances(secondPathArrays[1], firstPath[2])
+            + distances(secondPathArrays[0], firstPath[1])
+            + distances(firstPath[1], secondPathArrays[2])
+            - self.distanceMatrix.getDistance(firstPath[0], firstPath[1])
+            - self.distanceMatrix.getDistance(firstPath[1], firstPath[2])
+            - distances(secondPathArrays[0], secondPathArrays[1])
+            - distances(secondPathArrays[1], secondPathArrays[2])
+        )
+
     def createExchangeSolution(self, sourceDrone: Drone, destinationDrone: Drone, exchangeOrderIndex: int, destinationTourIndex: int) -> Self:
         # Create a partly deep copy of the solution
         solutionCopy = self.getSolutionCopy()
@@ -473,8 +1513,8 @@ class Solution():
         destinationDroneTour.insert(destinationTourIndex, exchangeOrder)
 
         # Update the orderList of the source and destination drone
-        solutionCopy.solutionMatrix[sourceDrone] = sourceDroneTour
-        solutionCopy.solutionMatrix[destinationDrone] = destinationDroneTour
+        solutionCopy.setDroneTour(sourceDrone, sourceDroneTour)
+        solutionCopy.setDroneTour(destinationDrone, destinationDroneTour)
 
         # Return the modified solution copy
         return solutionCopy
@@ -484,32 +1524,51 @@ class Solution():
     ################################################################################
 
     def calculateCrossPathLengthDelta(self, firstPath: tuple[Order, Order], secondPath: tuple[Order, Order]) -> float:
+        # Resolve the matrix indices of the path orders and use the index based function
+        return self.calculateCrossIndexLengthDelta(self.getOrderIndices(firstPath), self.getOrderIndices(secondPath))
+
+    def calculateCrossIndexLengthDelta(self, firstPath: tuple[int, int], secondPath: tuple[int, int]) -> float:
+        # Resolve the index based distance function of the distance matrix
+        distance = self.distanceMatrix.getDistance
+
         # Use the precalculation to get the path delta for exchange swap
         lengthDelta = (
-            self.getOrderDistance(firstPath[0], secondPath[1])
-            + self.getOrderDistance(secondPath[0], firstPath[1])
-            - self.getOrderDistance(firstPath[0], firstPath[1])
-            - self.getOrderDistance(secondPath[0], secondPath[1])
+            distance(firstPath[0], secondPath[1])
+            + distance(secondPath[0], firstPath[1])
+            - distance(firstPath[0], firstPath[1])
+            - distance(secondPath[0], secondPath[1])
         )
     
         # Return the rounded result
         return round(lengthDelta, 2)
     
+    def calculateCrossBatchLengthDeltas(self, firstPath: tuple[int, int], secondPathArrays: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        # Resolve the array based distance function of the distance matrix
+        distances = self.distanceMatrix.getDistances
+
+        # Use the same precalculation as the single cross swap element wise (same summation order, not rounded)
+        return (
+            distances(firstPath[0], secondPathArrays[1])
+            + distances(secondPathArrays[0], firstPath[1])
+            - self.distanceMatrix.getDistance(firstPath[0], firstPath[1])
+            - distances(secondPathArrays[0], secondPathArrays[1])
+        )
+
     def createCrossSolution(self, sourceDrone: Drone, destinationDrone: Drone, crossOrderIndex: int, destinationTourIndex: int) -> Self:
         # Create a partly deep copy of the solution
         solutionCopy = self.getSolutionCopy()
 
         # Resolve the source and destination tour from the solution matrix
-        sourceDroneTour = solutionCopy.getDroneTour(sourceDrone, False)
-        destinationDroneTour = solutionCopy.getDroneTour(destinationDrone, False)
+        sourceDroneTour = solutionCopy.getDroneTourView(sourceDrone)
+        destinationDroneTour = solutionCopy.getDroneTourView(destinationDrone)
 
         # Create the crossover tour by slicing the drone tours after the order indexes and adding them back together
         sourceDroneCrossoverTour = sourceDroneTour[:(crossOrderIndex + 1)] + destinationDroneTour[(destinationTourIndex + 1):]
         destinationDroneCrossoverTour = destinationDroneTour[:(destinationTourIndex + 1)] + sourceDroneTour[(crossOrderIndex + 1):]
 
         # Set the crossover tours as the new solution tour for the drones
-        solutionCopy.solutionMatrix[sourceDrone] = sourceDroneCrossoverTour
-        solutionCopy.solutionMatrix[destinationDrone] = destinationDroneCrossoverTour
+        solutionCopy.setDroneTour(sourceDrone, sourceDroneCrossoverTour)
+        solutionCopy.setDroneTour(destinationDrone, destinationDroneCrossoverTour)
 
         # Return the modified solution copy
         return solutionCopy
@@ -531,100 +1590,420 @@ class Solution():
         # Not recharge if drone tour shorter then drone range
         if droneTourLength <= droneDistance: return True
 
-        # Save the insert positions
-        chargeOrderIndexList = []
+        # Calculate the charging stops with the shortest tour time, if not possible the insert failed
+        chargingStops = self.calculateChargingStops(self.getOrderIndices(droneTour), droneDistance, Solution.GetChargingStopDistance(drone))
+        if chargingStops is None: return False
 
-        # Save the remaining tour range
-        remainingTourRange = droneDistance
-
-        # Loop over the drone tour to insert charging orders
-        for droneTourIndex in range(0, len(droneTour) - 1, 1):
-            # Get the current trip length
-            tripLength = self.getOrderDistance(
-                droneTour[droneTourIndex], 
-                droneTour[droneTourIndex + 1]
-            )
-
-            # Check if the drone has not enought range after the current trip to reach a charging station with the remaning power
-            if not self.isChargingStationInRange(droneTour[droneTourIndex + 1], remainingTourRange - tripLength):
-                
-                # Check if any charging station is in range to split the current trip with a recharge in between the orders
-                if not self.isChargingStationInRange(droneTour[droneTourIndex], remainingTourRange): return False
-
-                # Resolve the closest charging station to the current order
-                nextChargingStation = self.getClosestChargingStation(droneTour[droneTourIndex])
-                
-                # Insert a position of the charging order in the list
-                chargeOrderIndexList.insert(0, (droneTourIndex + 1, Order(nextChargingStation, 0, 900)))
-
-                # Reset the remaining tour range
-                remainingTourRange = droneDistance
-
-                # Recalculate the trip length
-                tripLength = self.getOrderBuildingDistance(
-                    droneTour[droneTourIndex + 1],
-                    nextChargingStation
-                )
-
-            # Remove the trip length from the remaining tour range
-            remainingTourRange -= tripLength
-
-        # Loop through the charge order index list to insert them
-        for chargeOrderTuple in chargeOrderIndexList:
-            # Inset the charge order at the given index (back to front)
-            droneTour.insert(chargeOrderTuple[0], chargeOrderTuple[1])
+        # Loop through the charging stops to insert them (back to front)
+        for droneTourIndex, chargingStation in reversed(chargingStops[1]):
+            # Inset the charge order at the given index
+            droneTour.insert(droneTourIndex, Order(chargingStation, 0, ProblemInstance.CHARGING_ORDER_DWELL_TIME))
 
         # Replace the drone tour in the solution matrix
-        self.solutionMatrix[drone] = droneTour
+        self.setDroneTour(drone, droneTour)
 
         # Charge order insert worked
         return True
 
-    def getSolutionCopy(self, includeChargingOrders: bool = True) -> Self:
-        # Use the built-in function to copy the solution
-        solutionCopy = copy(self)
+    def calculateChargingStops(self, tourIndices: list[int], droneDistance: float, stopDistance: float = 0.0) -> tuple[float, list[tuple[int, ChargingStation]]] | None:
+        # Hint: The drone leaves the start and every charging station with the full range, between two positions it stops at one charging station or a chain of charging stations
+        # Hint: Every charging stop costs the stop distance on top of its detour (the distance flown in the dwell time), the returned distance is without the stop distances
+        # Resolve the index based distance function, the charging station candidate function, the station hops and the prefix distances of the tour
+        distance = self.distanceMatrix.getDistance
+        chargingStationCandidates = self.chargingStationTable.getChargingStationCandidates
+        stationCount = len(self.chargingStationTable.getChargingStationList())
+        stationHops = self.chargingStationTable.getStationHops(droneDistance, stopDistance)
+        distancePrefixList = list(accumulate(map(distance, tourIndices[:-1], tourIndices[1:]), initial=0.0))
 
-        # Create a shallow copy of the solution matrix with dict function
-        solutionCopy.solutionMatrix = dict(solutionCopy.solutionMatrix)
-        
-        # Loop over the shallow copy of the solution matrix
-        for drone, orderList in solutionCopy.solutionMatrix.items():
-            # Create a shallow copy and filter the charging orders from the list if necesarry
-            solutionCopy.solutionMatrix[drone] = list(orderList if includeChargingOrders else
-                [order for order in orderList if order not in self.chargingStationList])
+        # Resolve the last tour position (the depot order at the end of the tour)
+        lastPosition = len(tourIndices) - 1
+
+        # Not recharge if drone tour shorter then drone range
+        if distancePrefixList[lastPosition] <= droneDistance: return (distancePrefixList[lastPosition], [])
+
+        # Create the table of the best charging stops after each position (station index to the cost up to the station, the station, the previous stop and the first station of the chain)
+        stopTable = [dict() for _ in range(lastPosition)]
+
+        # Hint: A departure reaches a later position with the flight distance offset + prefix distance and the tour cost offset + prefix distance
+        # Create the pareto front of the departures (flight distance offsets ascending, tour cost offsets descending and the departure stops)
+        flightOffsetList, distanceOffsetList, departureKeyList = [0.0], [0.0], [None]
+
+        # Loop through the tour positions to relax the charging stops after them (the departures of a position are final after the previous position)
+        for position in range(0, lastPosition + 1, 1):
+            # Loop through the charging stops of the previous position to add their departures to the pareto front
+            for stationIndex, stop in (stopTable[position - 1].items() if position > 0 else []):
+                # Calculate the offsets of the departure and check if a departure with smaller offsets dominates it
+                flightOffset = distance(stationIndex, tourIndices[position]) - distancePrefixList[position]
+                distanceOffset = stop[0] + flightOffset
+                frontIndex = bisect_right(flightOffsetList, flightOffset)
+                if frontIndex > 0 and distanceOffsetList[frontIndex - 1] <= distanceOffset: continue
+
+                # Remove the departures dominated by the departure and insert it into the pareto front
+                frontIndex, frontEndIndex = bisect_left(flightOffsetList, flightOffset), frontIndex
+                while frontEndIndex < len(flightOffsetList) and distanceOffsetList[frontEndIndex] >= distanceOffset: frontEndIndex += 1
+                flightOffsetList[frontIndex:frontEndIndex], distanceOffsetList[frontIndex:frontEndIndex], departureKeyList[frontIndex:frontEndIndex] = [flightOffset], [distanceOffset], [(position - 1, stationIndex)]
+
+            # Remove the departures that don't reach the position, they don't reach any later position either (the prefix distances only grow)
+            frontIndex = bisect_right(flightOffsetList, droneDistance - distancePrefixList[position])
+            del flightOffsetList[frontIndex:], distanceOffsetList[frontIndex:], departureKeyList[frontIndex:]
+
+            # Check if no departure reaches the position or the position is the tour end (the shortest departure is the last of the pareto front)
+            if (frontIndex == 0) or (position == lastPosition): break
+
+            # Loop through all charging stations in range of the position to relax the charging stops
+            for chargingStation, stationIndex, stationDistance in chargingStationCandidates(tourIndices[position], droneDistance, stationCount):
+                # Find the shortest departure that reaches the charging station (the last departure of the pareto front in range)
+                frontIndex = bisect_right(flightOffsetList, droneDistance - distancePrefixList[position] - stationDistance)
+                if frontIndex == 0: continue
+
+                # Save the charging stop with the cost up to the charging station
+                stopTable[position][stationIndex] = (distanceOffsetList[frontIndex - 1] + distancePrefixList[position] + stationDistance + stopDistance, chargingStation, departureKeyList[frontIndex - 1], None)
+
+            # Loop through the direct charging stops of the position to continue them over the chains of charging stations in range of each other
+            for stationIndex, stop in list(stopTable[position].items()):
+                # Loop through the charging stations reachable from the charging station
+                for hopIndex, hopStation, hopCost in stationHops[stationIndex]:
+                    # Save the chain if it reaches the charging station cheaper
+                    hopStop = stopTable[position].get(hopIndex)
+                    if hopStop is None or stop[0] + hopCost < hopStop[0]: stopTable[position][hopIndex] = (stop[0] + hopCost, hopStation, stop[2], stationIndex)
+
+        # Check if there is no departure that reaches the tour end
+        if (frontIndex == 0) or (position < lastPosition): return None
+
+        # Follow the previous stops back from the last charging stop to collect the insert positions of the charging stations
+        chargingStopList, stopKey = [], departureKeyList[frontIndex - 1]
+        while stopKey is not None:
+            # Resolve the charging stop and the charging stations of its chain
+            stopPosition, stationIndex = stopKey
+            _, chargingStation, stopKey, chainIndex = stopTable[stopPosition][stationIndex]
+            chainStationList = [chargingStation] if chainIndex is None else self.chargingStationTable.getStationHopPath(droneDistance, stopDistance, chainIndex, stationIndex)
+
+            # Save the insert positions of the charging stations (after the stop position, back to front)
+            chargingStopList.extend((stopPosition + 1, x) for x in reversed(chainStationList))
+
+        # Return the tour distance with the charging detours (without the stop distances) and the charging stops ordered by position
+        return (distanceOffsetList[frontIndex - 1] + distancePrefixList[lastPosition] - stopDistance * len(chargingStopList), chargingStopList[::-1])
+
+    def getSolutionCopy(self, includeChargingOrders: bool = True) -> Self:
+        # Create an empty solution without calling the constructor
+        solutionCopy = Solution.__new__(Solution)
+
+        # Share the references of the problem instance data with the copy
+        solutionCopy.problemInstance = self.problemInstance
+        solutionCopy.droneList = self.droneList
+        solutionCopy.chargingStationList = self.chargingStationList
+        solutionCopy.orderList = self.orderList
+        solutionCopy.distanceMatrix = self.distanceMatrix
+        solutionCopy.orderIndexDictionary = self.orderIndexDictionary
+        solutionCopy.chargingStationTable = self.chargingStationTable
+
+        # Create a shallow copy of the solution matrix with a shallow copy of each drone tour
+        solutionCopy.solutionMatrix = dict((drone, list(orderList if includeChargingOrders else
+            [order for order in orderList if order not in self.chargingStationList])) for drone, orderList in self.solutionMatrix.items())
+
+        # Share the cached tour metrics, time score and order position index with the copy if the tours are copied unchanged
+        solutionCopy.tourMetricDictionary = self.tourMetricDictionary if includeChargingOrders else dict()
+        solutionCopy.timeScore = self.timeScore if includeChargingOrders else None
+        solutionCopy.orderPositionDictionary = self.orderPositionDictionary if includeChargingOrders else None
+        solutionCopy.tourTimeTable = self.tourTimeTable if includeChargingOrders else None
+        solutionCopy.fingerprint = self.fingerprint if includeChargingOrders else None
+
+        # Share the caches of the drone tours without charging orders with the copy (the tours without charging orders are the same either way)
+        solutionCopy.tourViewDictionary = self.tourViewDictionary
+        solutionCopy.tourPrefixDictionary = self.tourPrefixDictionary
+        solutionCopy.tourIndexDictionary = self.tourIndexDictionary
+        solutionCopy.tourIndexArrayDictionary = self.tourIndexArrayDictionary
+        solutionCopy.tourSummaryDictionary = self.tourSummaryDictionary
+        solutionCopy.chargingProfileDictionary = self.chargingProfileDictionary
+        solutionCopy.chargingTourTimeDictionary = self.chargingTourTimeDictionary
+
+        # Mark the per drone caches of both solutions as shared (copied before the first change of a drone tour)
+        self.sharedCacheFlag = solutionCopy.sharedCacheFlag = True
 
         # Return the solution copy
         return solutionCopy
 
+    def getCompactSolution(self) -> CompactSolution:
+        # Encode the drone tours into the order code buffers of a compact solution
+        return CompactSolution.FromSolution(self)
+
+    def getBuildingIndex(self, building: Building) -> int:
+        # Use the precalculated distanceMatrix to get the stable matrix index of the building
+        return self.distanceMatrix.getBuildingIndex(building)
+
+    def getOrderIndex(self, order: Order) -> int:
+        # Use the precalculated orderIndexDictionary to get the stable matrix index of the order
+        return self.orderIndexDictionary[order]
+
+    def getOrderIndices(self, orderList: list[Order]) -> list[int]:
+        # Use the built-in map function with the orderIndexDictionary to convert the orders into their matrix indices
+        return list(map(self.orderIndexDictionary.__getitem__, orderList))
+
     def getBuildingDistance(self, sourceBuilding: Building, destinationBuilding: Building) -> float:
         # Use the precalculated distanceMatrix to get the distance between the buildings
-        return self.distanceMatrix[sourceBuilding][destinationBuilding]
+        return self.distanceMatrix.getDistance(self.getBuildingIndex(sourceBuilding), self.getBuildingIndex(destinationBuilding))
 
     def getOrderDistance(self, sourceOrder: Order, destinationOrder: Order) -> float:
         # Use the precalculated distanceMatrix to get the distance between the orders
-        return self.distanceMatrix[sourceOrder.getDestination()][destinationOrder.getDestination()]
+        return self.distanceMatrix.getDistance(self.getOrderIndex(sourceOrder), self.getOrderIndex(destinationOrder))
 
     def getOrderBuildingDistance(self, sourceOrder: Order, destinationBuilding: Building) -> float:
         # Use the precalculated distanceMatrix to get the distance between the order and building
-        return self.distanceMatrix[sourceOrder.getDestination()][destinationBuilding]
+        return self.distanceMatrix.getDistance(self.getOrderIndex(sourceOrder), self.getBuildingIndex(destinationBuilding))
     
-    def getClosestBuildings(self, sourceBuilding: Building) -> list[Building]:
-        # Use the precalculated distanceMatrix to get the presorted keys building list
-        return list(self.distanceMatrix[sourceBuilding].keys())
+    def getClosestBuildings(self, sourceBuilding: Building, buildingCount: int = None) -> list[Building]:
+        # Check if the buildingCount is set or fallback to all buildings
+        if buildingCount is None: buildingCount = len(self.distanceMatrix)
+
+        # Use the spatial index to get the truncated list of the nearest buildings (partial selection instead of a full sort)
+        _, nearestIndices = self.problemInstance.getSpatialIndex().queryNearestIndices([sourceBuilding], buildingCount)
+
+        # Resolve the nearest buildings and rank them by the exact distance of the distanceMatrix
+        return ProblemInstance.RankByDistance(self.distanceMatrix, sourceBuilding, [self.distanceMatrix.getBuildingList()[index] for index in nearestIndices[0]])
 
     def getDroneByOrder(self, order: Order) -> Drone:
-        # Use the built-in function to get the drone that has the given order in its orderList
+        # Use the order position index to get the drone that has the given order in its tour
+        orderPosition = self.getOrderPositionDictionary().get(order)
+        if orderPosition is not None: return orderPosition[0]
+
+        # Fallback to the built-in function for orders without a position (charging orders)
         return next((drone for drone, orderList in self.solutionMatrix.items() if order in orderList), None)
 
+    def getOrderPosition(self, order: Order) -> tuple[Drone, int]:
+        # Use the order position index to get the drone and the position of the order in the tour without charging orders
+        return self.getOrderPositionDictionary()[order]
+
+    def getOrderPositionDictionary(self) -> dict[Order, tuple[Drone, int]]:
+        # Check if the order position index is already created for the current drone tours
+        if self.orderPositionDictionary is not None: return self.orderPositionDictionary
+
+        # Create an empty order position index
+        orderPositionDictionary = dict()
+
+        # Loop through the drone tours backwards so the first drone and position of shared orders (depot orders) remains in the index
+        for drone in reversed(self.solutionMatrix):
+            # Resolve the drone tour without charging orders
+            droneTour = self.getDroneTourView(drone)
+
+            # Save the drone and position of each order in the tour (backwards for the first position)
+            orderPositionDictionary.update((droneTour[position], (drone, position)) for position in range(len(droneTour) - 1, -1, -1))
+
+        # Cache the order position index until the next tour change
+        self.orderPositionDictionary = orderPositionDictionary
+
+        # Return the order position index
+        return orderPositionDictionary
+
     def getDroneTour(self, drone: Drone, includeChargingOrders: bool = True) -> list[Order]:
         # Check if the drone tour list should include the charging orders (default)
         if includeChargingOrders: return self.solutionMatrix[drone]
 
+        # Create a shallow copy of the cached drone tour without charging orders (the copy can be changed by the caller)
+        return list(self.getDroneTourView(drone))
+
+    def getDroneTourView(self, drone: Drone) -> list[Order]:
+        # Hint: The returned list is the shared cache and must not be changed
+        # Check if the drone tour without charging orders is already cached
+        droneTourView = self.tourViewDictionary.get(drone)
+        if droneTourView is not None: return droneTourView
+
         # Use the built in filter function to check if the order destination is no charging station
-        return [droneOrder for droneOrder in self.solutionMatrix[drone] 
-                if droneOrder.getDestination() not in self.chargingStationList]
+        droneTourView = self.tourViewDictionary[drone] = [droneOrder for droneOrder in self.solutionMatrix[drone] 
+            if droneOrder.getDestination() not in self.chargingStationList]
+
+        # Return the cached drone tour without charging orders
+        return droneTourView
+
+    def getDroneTourIndices(self, drone: Drone) -> list[int]:
+        # Hint: The returned list is the shared cache and must not be changed
+        # Check if the matrix indices of the drone tour without charging orders are already cached
+        droneTourIndices = self.tourIndexDictionary.get(drone)
+        if droneTourIndices is not None: return droneTourIndices
+
+        # Resolve and cache the matrix indices of the drone tour without charging orders
+        droneTourIndices = self.tourIndexDictionary[drone] = self.getOrderIndices(self.getDroneTourView(drone))
+
+        # Return the cached matrix indices
+        return droneTourIndices
     
+    def getDroneTourIndexArray(self, drone: Drone) -> np.ndarray:
+        # Hint: The returned array is the shared cache and must not be changed
+        # Check if the matrix index array of the drone tour without charging orders is already cached
+        droneTourIndexArray = self.tourIndexArrayDictionary.get(drone)
+        if droneTourIndexArray is not None: return droneTourIndexArray
+
+        # Convert and cache the matrix indices of the drone tour without charging orders
+        droneTourIndexArray = self.tourIndexArrayDictionary[drone] = np.array(self.getDroneTourIndices(drone), dtype=np.intp)
+
+        # Return the cached matrix index array
+        return droneTourIndexArray
+
+    def getDroneTourSummary(self, drone: Drone) -> tuple[int, float, float] | None:
+        # Check if the summary of the drone tour is already cached (none for tours without orders between the depots)
+        if drone in self.tourSummaryDictionary: return self.tourSummaryDictionary[drone]
+
+        # Resolve the orders and matrix indices of the tour between the start and return depot orders
+        droneTour = self.getDroneTourView(drone)[1:-1]
+        tourIndices = self.getDroneTourIndices(drone)[1:-1]
+
+        # Check if the tour has no orders between the depots to cache no summary
+        if not droneTour:
+            self.tourSummaryDictionary[drone] = None
+            return None
+
+        # Use the order closest to the coordinate centroid of the tour as its center
+        coordinateArray = Element.GetCoordinateArray([droneOrder.getDestination() for droneOrder in droneTour])
+        centerIndex = tourIndices[int(np.argmin(np.sum(np.square(coordinateArray - coordinateArray.mean(axis=0)), axis=1)))]
+
+        # Resolve the radius around the center that covers all orders of the tour
+        radius = float(np.max(self.distanceMatrix.getDistances(np.full(len(tourIndices), centerIndex), np.array(tourIndices, dtype=np.intp))))
+
+        # Resolve the longest edge between the orders of the tour (zero for a single order)
+        longestEdgeLength = max(map(self.distanceMatrix.getDistance, tourIndices[:-1], tourIndices[1:]), default=0.0)
+
+        # Cache and return the center index, radius and longest edge of the tour
+        tourSummary = self.tourSummaryDictionary[drone] = (centerIndex, radius, longestEdgeLength)
+        return tourSummary
+
+    def getDroneChargingProfile(self, drone: Drone) -> ChargingProfile:
+        # Check if the charging profile of the drone tour is already cached
+        chargingProfile = self.chargingProfileDictionary.get(drone)
+        if chargingProfile is not None: return chargingProfile
+
+        # Create the charging profile with the prefix distances and the closest charging station distances of the drone tour without charging orders
+        chargingProfile = self.chargingProfileDictionary[drone] = ChargingProfile(self.getDroneTourPrefixes(drone)[0],
+            list(map(self.chargingStationTable.getClosestChargingStationDistance, self.getDroneTourIndices(drone))))
+
+        # Return the cached charging profile
+        return chargingProfile
+
+    def getDroneChargingTourTime(self, drone: Drone) -> float:
+        # Check if the charging tour time of the drone is already cached
+        chargingTourTime = self.chargingTourTimeDictionary.get(drone)
+        if chargingTourTime is not None: return chargingTourTime
+
+        # Calculate the optimal charging stops of the drone tour without charging orders
+        chargingStops = self.calculateChargingStops(self.getDroneTourIndices(drone), drone.getRemainingFlightDistance(), Solution.GetChargingStopDistance(drone))
+
+        # Calculate the tour time with the charging detours and the dwell times of the charging stops (infinite if there are no possible charging stops)
+        chargingTourTime = self.chargingTourTimeDictionary[drone] = (Solution.FLOAT_POSITIVE_INFINITY if chargingStops is None else
+            drone.calculateFlightTime(chargingStops[0]) + self.getDroneTourPrefixes(drone)[1][-1] + len(chargingStops[1]) * ProblemInstance.CHARGING_ORDER_DWELL_TIME)
+
+        # Return the cached charging tour time
+        return chargingTourTime
+
+    def getDroneTourPrefixes(self, drone: Drone) -> tuple[list[float], list[int]]:
+        # Check if the prefix distances and dwell times of the drone tour are already cached
+        tourPrefixes = self.tourPrefixDictionary.get(drone)
+        if tourPrefixes is not None: return tourPrefixes
+
+        # Resolve the drone tour without charging orders and its matrix indices
+        droneTour = self.getDroneTourView(drone)
+        tourIndices = self.getDroneTourIndices(drone)
+
+        # Accumulate the distance up to each order (one per order) and the dwell time before each order (one more for the whole tour)
+        tourPrefixes = self.tourPrefixDictionary[drone] = (list(accumulate(map(self.distanceMatrix.getDistance, tourIndices[:-1], tourIndices[1:]), initial=0.0)),
+            list(accumulate((droneOrder.getDwellTime() for droneOrder in droneTour), initial=0)))
+
+        # Return the cached prefix distances and dwell times
+        return tourPrefixes
+
+    def getTourTimeTable(self) -> TourTimeTable:
+        # Check if the tour time table is already created for the current drone tours
+        if self.tourTimeTable is not None: return self.tourTimeTable
+
+        # Create the tour time table with the cached tour times of all drones
+        self.tourTimeTable = TourTimeTable(self.droneList, [self.getDroneTourTime(drone, True) for drone in self.droneList])
+
+        # Return the cached tour time table
+        return self.tourTimeTable
+
+    def getFingerprint(self) -> int:
+        # Check if the fingerprint is already calculated for the current drone tours
+        if self.fingerprint is not None: return self.fingerprint
+
+        # Resolve the zobrist table and the order code function of the problem instance
+        zobristTable, orderCode = self.problemInstance.getZobristTable(), self.problemInstance.getOrderCode
+
+        # Initialize the fingerprint
+        self.fingerprint = 0
+
+        # Loop through the drones to combine the keys of their tours without charging orders
+        for drone in self.droneList:
+            self.fingerprint ^= zobristTable.getTourKey(drone, list(map(orderCode, self.getDroneTourView(drone))))
+
+        # Return the cached fingerprint
+        return self.fingerprint
+
+    def setDroneTour(self, drone: Drone, droneTour: list[Order]):
+        # Replace the drone tour in the solution matrix
+        self.solutionMatrix[drone] = droneTour
+
+        # Invalidate the cached metrics and views of the changed drone tour only
+        self.invalidateDroneTours(drone)
+
+    def invalidateDroneTours(self, drone: Drone = None):
+        # Check if the drone is set to remove only its cached tour metrics and view or clear the caches of all drones
+        if drone is not None:
+            # Check if the caches are shared with a copy and copy them before the change (copy-on-write)
+            if self.sharedCacheFlag: self.createDroneTourCaches(True)
+
+            # Remove the cached tour metrics and views of the drone
+            self.tourMetricDictionary.pop(drone, None)
+            self.tourViewDictionary.pop(drone, None)
+            self.tourPrefixDictionary.pop(drone, None)
+            self.tourIndexDictionary.pop(drone, None)
+            self.tourIndexArrayDictionary.pop(drone, None)
+            self.tourSummaryDictionary.pop(drone, None)
+            self.chargingProfileDictionary.pop(drone, None)
+            self.chargingTourTimeDictionary.pop(drone, None)
+
+        # Replace the caches of all drones with empty ones (a shared cache stays unchanged for the copy)
+        else: self.createDroneTourCaches(False)
+
+        # Invalidate the cached time score, tour time table, order position index and fingerprint as they depend on all drone tours
+        self.timeScore = None
+        self.tourTimeTable = None
+        self.orderPositionDictionary = None
+        self.fingerprint = None
+
+    def createDroneTourCaches(self, copyCaches: bool):
+        # Create the per drone caches as copies of the current caches or empty ones
+        self.tourMetricDictionary = dict(self.tourMetricDictionary) if copyCaches else dict()
+        self.tourViewDictionary = dict(self.tourViewDictionary) if copyCaches else dict()
+        self.tourPrefixDictionary = dict(self.tourPrefixDictionary) if copyCaches else dict()
+        self.tourIndexDictionary = dict(self.tourIndexDictionary) if copyCaches else dict()
+        self.tourIndexArrayDictionary = dict(self.tourIndexArrayDictionary) if copyCaches else dict()
+        self.tourSummaryDictionary = dict(self.tourSummaryDictionary) if copyCaches else dict()
+        self.chargingProfileDictionary = dict(self.chargingProfileDictionary) if copyCaches else dict()
+        self.chargingTourTimeDictionary = dict(self.chargingTourTimeDictionary) if copyCaches else dict()
+
+        # Set the new caches as owned by the solution
+        self.sharedCacheFlag = False
+
+    def getDroneTourMetrics(self, drone: Drone) -> tuple[float, int, float]:
+        # Check if the tour metrics of the drone are already cached
+        tourMetrics = self.tourMetricDictionary.get(drone)
+        if tourMetrics is not None: return tourMetrics
+
+        # Calculate and cache the tour metrics of the drone tour with the charging orders
+        tourMetrics = self.tourMetricDictionary[drone] = self.calculateTourMetrics(drone, self.solutionMatrix[drone])
+
+        # Return the tour metrics
+        return tourMetrics
+
+    def calculateTourMetrics(self, drone: Drone, droneTour: list[Order]) -> tuple[float, int, float]:
+        # Calculate the tour distance and the tour dwell time (sum)
+        tourDistance = self.getTourDistance(droneTour)
+        tourDwellTime = sum(droneOrder.getDwellTime() for droneOrder in droneTour)
+
+        # Return the tour distance, dwell time and the tour time (flight + dwell time) of the drone
+        return (tourDistance, tourDwellTime, drone.calculateFlightTime(tourDistance) + tourDwellTime)
+
     def getDroneTourDistance(self, drone: Drone, includeChargingOrders: bool = True) -> float:
+        # Check if the drone tour includes the charging orders to use the cached tour metrics
+        if includeChargingOrders: return self.getDroneTourMetrics(drone)[0]
+
         # Use the getDroneTour and getTourDistance function to get the drone tour distance
         return self.getTourDistance(self.getDroneTour(drone, includeChargingOrders))
     
@@ -633,94 +2012,73 @@ class Solution():
         return drone.calculateFlightTime(self.getDroneTourDistance(drone, includeChargingOrders))
     
     def getDroneTourDwellTime(self, drone: Drone, includeChargingOrders: bool = True) -> int:
+        # Check if the drone tour includes the charging orders to use the cached tour metrics
+        if includeChargingOrders: return self.getDroneTourMetrics(drone)[1]
+
         # Use the getDroneTour and getDwellTime function to get the drone tour dwell time (sum)
         return sum(droneOrder.getDwellTime() for droneOrder in self.getDroneTour(drone, includeChargingOrders))
     
     def getDroneTourTime(self, drone: Drone, includeChargingOrders: bool = True) -> float:
+        # Check if the drone tour includes the charging orders to use the cached tour metrics
+        if includeChargingOrders: return self.getDroneTourMetrics(drone)[2]
+
         # Use the getDroneTourFlightTime and getDroneTourDwellTime function to get the drone tour time (flight + dwell time)
         return self.getDroneTourFlightTime(drone, includeChargingOrders) + self.getDroneTourDwellTime(drone, includeChargingOrders)
 
     def getTourDistance(self, tour: list[Order]) -> float:
-        # Initialize the tour distance
-        tourDistance = 0
+        # Resolve the matrix indices of the tour orders
+        tourIndices = self.getOrderIndices(tour)
 
-        # Loop over the tour in stepped pairs
-        for index in range(0, len(tour) - 1, 1):
-            # Calculate and add the distance between the current and next order
-            tourDistance += self.getOrderDistance(tour[index], tour[index + 1])
-
-        # Return the summed up destinations
-        return tourDistance
-    
-
-    # TODO: Idea - Cache the closest charging station to each order for O(1) instead of O(n) lookup
+        # Sum up the distances between the current and next order of the tour in stepped pairs
+        return sum(map(self.distanceMatrix.getDistance, tourIndices[:-1], tourIndices[1:]))
     
     ################################################################################
     ####################### CHARGING STATION SUPPORT FUNCTIONS #####################
     ################################################################################
 
     def isChargingStationInRange(self, order: Order, range: float) -> bool:
-        # Use the built-in filter function to check if a charging station is in range of the current order
-        return next((True for x in self.chargingStationList if self.getOrderBuildingDistance(order, x) <= range), False)
+        # Compare the precalculated distance of the closest charging station with the range of the current order
+        return self.chargingStationTable.isChargingStationInRange(self.orderIndexDictionary[order], range)
     
     def getChargingStationsInRange(self, order: Order, range: float) -> list[ChargingStation]:
-        # Use the built-in filter function to get all charging stations that are in range
-        return [x for x in self.chargingStationList if self.getOrderBuildingDistance(order, x) <= range]
+        # Use a binary search on the precalculated distance sorted charging stations to get all charging stations that are in range
+        return self.chargingStationTable.getChargingStationsInRange(self.orderIndexDictionary[order], range)
     
     def getClosestChargingStation(self, order: Order) -> ChargingStation:
-        # Use the built-in min function to return the closest charging station from the list
-        return min(self.chargingStationList, key=lambda x: self.getOrderBuildingDistance(order, x))
-        
+        # Return the precalculated closest charging station of the order
+        return self.chargingStationTable.getClosestChargingStation(self.orderIndexDictionary[order])
+
+    def getClosestChargingStationDistance(self, order: Order) -> float:
+        # Return the precalculated distance of the closest charging station of the order
+        return self.chargingStationTable.getClosestChargingStationDistance(self.orderIndexDictionary[order])
+
     ################################################################################
-    ############################### SUPPORT FUNCTIONS ##############################
+    ############################### STATIC FUNCTIONS ###############################
     ################################################################################
 
     @staticmethod
-    def CalculateDistanceMatrix(buildingList: list[Building]) -> dict[Building, dict[Building, float]]:
-        # Use built-in python functions to convert the the buildingList into a 2D dictionary with the Building as the keys and distance as the value
-        distanceMatrix = dict([(outerBuilding, dict([(innerBuilding, 0) for innerBuilding in buildingList])) for outerBuilding in buildingList])
-
-        # Loop through the complete building list once
-        for outerIndex in range(0, len(buildingList), 1):
-            # Resolve the outerBuilding from the buildingList
-            outerBuilding = buildingList[outerIndex]
-
-            # Loop through all building after the outer index in the list
-            for innerIndex in range(outerIndex + 1, len(buildingList), 1):
-                # Resolve the innerBuilding from the buildingList
-                innerBuilding = buildingList[innerIndex]
-
-                # Calculate the distance between the buildings for the matrix
-                calculatedDistance = innerBuilding.getDistanceTo(outerBuilding)
-
-                # Set the calculated distance for both buillding combinations
-                distanceMatrix[innerBuilding][outerBuilding] = calculatedDistance
-                distanceMatrix[outerBuilding][innerBuilding] = calculatedDistance
-
-        # Loop through the complete building list to sort the inner dict by distance
-        for building in buildingList:
-            # Since python 3.7 dicts preserve the insertion order so we can use this to save the buildings sorted by distance
-            distanceMatrix[building] = dict(sorted(distanceMatrix[building].items(), key=lambda x: x[1]))
-
-        # Return the distance matrix
-        return distanceMatrix
-    
+    def CalculateTimeScore(droneTourTimeList: list[float]) -> float:
+        # Use the sum, count, max and min of the drone tour times to calculate the rounded score
+        return round(Solution.CalculateRawTimeScore(sum(droneTourTimeList), len(droneTourTimeList), max(droneTourTimeList), min(droneTourTimeList)), 2)
+
     @staticmethod
-    def CalculateOrderNeighborhoodMatrix(orderList: list[Order], distanceMatrix: dict[Building, dict[Building, float]]) -> dict[Order, list[Order]]:
-        # Create a dictionary to look up the corresponding order for each building in a constant time
-        buildingOrderDictionary = dict(map(lambda order: (order.getDestination(), order), orderList))
+    def CalculateRawTimeScore(droneTourTimeSum: float, droneTourCount: int, maxDroneTourTime: float, minDroneTourTime: float) -> float:
+        # Calculate the average drone tour time as a factor for the score calculation 
+        avgDroneTourTime = (droneTourTimeSum / droneTourCount)
+        
+        # Sum up the drone tour time and scale the score by the difference between the min/max and avg drone tour time
+        return droneTourTimeSum * (1 + ((maxDroneTourTime - minDroneTourTime) / avgDroneTourTime) / 2)
 
-        # Create an empty dictionary for the order neighborhood
-        orderNeighborhoodMatrix = dict()
+    @staticmethod
+    def GetChargingStopDistance(drone: Drone) -> float:
+        # Convert the dwell time of a charging stop into the distance the drone flies in the same time
+        return drone.getMaximumSpeed() * ProblemInstance.CHARGING_ORDER_DWELL_TIME
 
-        # Loop through the order list once
-        for order in orderList:
-            # Resolve the neighborhood building list from the distance matrix by the order destination
-            neighborhoodBuildingList = list(distanceMatrix[order.getDestination()].keys())
+    @staticmethod
+    def IsCloseToRoundingBoundary(value: float, digits: int) -> bool:
+        # Scale the value to the rounded digits and resolve the distance of its fraction to the half way rounding boundary
+        scaledValue = value * (10 ** digits)
+        boundaryDistance = abs(abs(scaledValue - int(scaledValue)) - 0.5)
 
-            # Use the built-in list conversion to check all neighborhood buildings and convert them back to orders
-            orderNeighborhoodMatrix[order] = [buildingOrderDictionary[neighborBuilding] for 
-                neighborBuilding in neighborhoodBuildingList if neighborBuilding in buildingOrderDictionary]
-        
-        # Return the order neighborhood matrix
-        return orderNeighborhoodMatrix
\ No newline at end of file
+        # Check if the distance is within the relative tolerance of the floating point error
+        return boundaryDistance <= Solution.TIME_SCORE_ROUNDING_TOLERANCE * max(1.0, abs(scaledValue))
@@ -2,7 +2,11 @@ import math
 import random
 import time
 
-from collections import deque
+from typing import Callable, Iterator
+from itertools import islice
+from collections import OrderedDict
+
+import numpy as np
 
 from simulation.Drone import Drone
 from simulation.Order import Order
@@ -11,16 +15,44 @@ from model.Depot import Depot
 from model.Building import Building
 from model.ChargingStation import ChargingStation
 
+from osm.Element import Element
+from osm.DistanceModel import DistanceModel
+
 from .ExitCode import ExitCode
+from .Move import Move
 from .Solution import Solution
+from .NeighborhoodOrder import NeighborhoodOrder
+from .AcceptanceStrategy import AcceptanceStrategy
+from .ConstructionStrategy import ConstructionStrategy
+from .ProblemInstance import ProblemInstance
+from .DistanceMatrixCache import DistanceMatrixCache
 
 class Solver():
     # Define constants for the solver class
     FLOAT_POSITIVE_INFINITY = float('+inf')
     FLOAT_NEGATIVE_INFINITY = float('-inf')
 
+    # Define the default number of sampled moves for the best of sample acceptance
+    DEFAULT_SAMPLE_SIZE = 32
+
+    # Define the default number of nearest orders in the same tour that are checked by the intra route improvement of the local search
+    DEFAULT_INTRA_ROUTE_NEIGHBOR_COUNT = 10
+
+    # Define the default number of fingerprints the long term memory of the tabu search keeps (least recently seen ones are dropped first)
+    DEFAULT_LONG_TERM_MEMORY_SIZE = 65536
+
+    # Define the default number of added orders per order after which the initial solution search is stopped
+    INITIAL_SOLUTION_NODE_BUDGET_FACTOR = 100
+
+    # Define the default number of routes per drone the savings construction merges the orders into (the routes are packed onto the drones afterwards)
+    SAVINGS_ROUTES_PER_DRONE = 4
+
+    # Define the default number of best drone tours the regret of an order is summed up over in the regret construction
+    DEFAULT_REGRET_COUNT = 3
+
     # Constructor the solver with given arguemnts
-    def __init__(self, droneList: list[Drone], depot: Depot, chargingStationList: list[ChargingStation], orderList: list[Order]):
+    def __init__(self, droneList: list[Drone], depot: Depot, chargingStationList: list[ChargingStation], orderList: list[Order], distanceModel: DistanceModel = DistanceModel.WGS84, distanceCache: DistanceMatrixCache = None, neighborhoodSize: int = ProblemInstance.DEFAULT_NEIGHBORHOOD_SIZE,
+        distanceMemoryBudget: int = ProblemInstance.DEFAULT_DISTANCE_MEMORY_BUDGET):
         # Save the list of drones
         self.droneList = droneList
 
@@ -33,6 +65,21 @@ class Solver():
         # Save the list of orders
         self.orderList = orderList
 
+        # Save the distance model for the solution distance matrix
+        self.distanceModel = distanceModel
+
+        # Save the optional persistent cache for the solution distance matrix
+        self.distanceCache = distanceCache
+
+        # Save the number of nearest orders kept per order in the solution neighborhood matrix
+        self.neighborhoodSize = neighborhoodSize
+
+        # Save the memory budget of the solution distances before switching to the sparse distance matrix
+        self.distanceMemoryBudget = distanceMemoryBudget
+
+        # Set the shared problem instance of the solutions (created with the first solution)
+        self.problemInstance = None
+
     ################################################################################
     ############################### GETTER FUNCTIONS ###############################
     ################################################################################
@@ -53,6 +100,30 @@ class Solver():
         # Return the districtList
         return self.orderList
 
+    def getDistanceModel(self) -> DistanceModel:
+        # Return the distanceModel
+        return self.distanceModel
+
+    def getDistanceCache(self) -> DistanceMatrixCache:
+        # Return the distanceCache
+        return self.distanceCache
+
+    def getNeighborhoodSize(self) -> int:
+        # Return the neighborhoodSize
+        return self.neighborhoodSize
+
+    def getDistanceMemoryBudget(self) -> int:
+        # Return the distanceMemoryBudget
+        return self.distanceMemoryBudget
+
+    def getProblemInstance(self) -> ProblemInstance:
+        # Check if the problem instance is not created yet and create it once for all solutions
+        if self.problemInstance is None:
+            self.problemInstance = ProblemInstance(self.droneList, self.depot, self.chargingStationList, self.orderList, self.distanceModel, self.distanceCache, self.neighborhoodSize, self.distanceMemoryBudget)
+
+        # Return the problemInstance
+        return self.problemInstance
+
     ################################################################################
     ############################### SOLVER FUNCTIONS ###############################
     ################################################################################
@@ -63,12 +134,24 @@ class Solver():
     def getNextOrder(self, drone: Drone) -> Order:
         return None
     
-    def getInitialSolution(self, allowRecharge: bool = True) -> Solution|None:
+    def getInitialSolution(self, allowRecharge: bool = True, nodeBudget: int = None, constructionStrategy: ConstructionStrategy = ConstructionStrategy.BACKTRACKING) -> Solution|None:
         # Create solution with the given parameters from the solver class to hold the final solution
-        solution = Solution(self.droneList, self.depot, self.chargingStationList, self.orderList)
+        solution = Solution(self.getProblemInstance())
+
+        # Check if the solution is constructed with the savings heuristic and save the error code
+        if constructionStrategy == ConstructionStrategy.SAVINGS: errorCode = Solver.GenerateSavingsSolution(self.droneList, self.orderList, solution, allowRecharge)
+
+        # Check if the solution is constructed with the sweep heuristic and save the error code
+        elif constructionStrategy == ConstructionStrategy.SWEEP: errorCode = Solver.GenerateSweepSolution(self.droneList, self.orderList, solution, allowRecharge)
+
+        # Check if the solution is constructed with the regret insertion and save the error code
+        elif constructionStrategy == ConstructionStrategy.REGRET: errorCode = Solver.GenerateRegretSolution(self.droneList, self.orderList, solution, allowRecharge)
 
         # Call the internal generateInitialSolution function with the solution and save the error code
-        errorCode = Solver.GenerateInitialSolution(self.droneList, self.orderList, solution, allowRecharge)
+        else: errorCode = Solver.GenerateInitialSolution(self.droneList, self.orderList, solution, allowRecharge, nodeBudget)
+
+        # Invalidate the cached tour data of the solution as its drone tours were changed in place
+        solution.invalidateDroneTours()
 
         # Check the error code for no success and overwrite the solution
         if (errorCode != ExitCode.SUCCESS): solution = None
@@ -83,7 +166,8 @@ class Solver():
     ########################## IMPROVEMENT METHOD FUNCTIONS ########################
     ################################################################################
 
-    def performLocalSearch(self, currentSolution: Solution) -> Solution:
+    def performLocalSearch(self, currentSolution: Solution, acceptanceStrategy: AcceptanceStrategy = AcceptanceStrategy.BEST_IMPROVEMENT, sampleSize: int = DEFAULT_SAMPLE_SIZE,
+        intraRouteNeighborCount: int = DEFAULT_INTRA_ROUTE_NEIGHBOR_COUNT) -> Solution:
         # Get a copy of the current solution with out charging orders
         currentSolution = currentSolution.getSolutionCopy(False)
 
@@ -94,17 +178,17 @@ class Solver():
         for drone in bestSolution.getDroneList():
             # Run the algorithm until the termination criteria are fulfilled
             while True:
-                # Get the two opt neighborhood solutions list for the current drone (without charging orders)
-                neighborhoodSolutionList = currentSolution.getTwoOptSolutions(drone, 0, False)
+                # Improve the drone tour with the two-opt and or-opt moves next to the nearest orders (only the orders at changed edges are checked again)
+                if intraRouteNeighborCount is not None: currentSolution.improveDroneTour(drone, intraRouteNeighborCount)
 
-                # Select the best neighborhood solution from the current solutions neighborhood list (with a default fallback)
-                currentSolution = min(neighborhoodSolutionList, key=lambda x: x.getDroneTourDistance(drone), default=currentSolution)
+                # Select an improving two opt move of all edge pairs for the current drone (without charging orders) while the moves are generated lazily
+                neighborhoodMove = Solver.SelectMove(currentSolution.iterateTwoOptMoves(drone, 0), Move.getLengthDelta, 0, acceptanceStrategy, sampleSize)
 
-                # Check if the current solution has worse distance score the the best solution 
-                if (currentSolution.getDroneTourDistance(drone) >= bestSolution.getDroneTourDistance(drone)): break
+                # Check if there is no improving move left for the drone tour
+                if neighborhoodMove is None: break
 
-                # Replace the best solution with the current solution
-                bestSolution = currentSolution
+                # Apply the selected move directly to the current solution (it is a private copy)
+                currentSolution.applyMoveInPlace(neighborhoodMove)
 
             # Try tp reinsert the charging orders into the drone tour
             if not bestSolution.insertChargingOrders(drone):
@@ -114,12 +198,12 @@ class Solver():
         # Return the best solution
         return bestSolution
 
-    def performRandomWalk(self, currentSolution: Solution, maxIterationsOverall: int, maxIterationsWithoutImprovement: int) -> Solution:
-        # Get a copy of the current solution with out charging orders
+    def performRandomWalk(self, currentSolution: Solution, maxIterationsOverall: int, maxIterationsWithoutImprovement: int, granularNeighborCount: int = None) -> Solution:
+        # Get a copy of the current solution with out charging orders (changed in place by the moves)
         currentSolution = currentSolution.getSolutionCopy(False)
 
-        # Set the current solution as the best solution
-        bestSolution = currentSolution
+        # Set a compact copy of the current solution as the best solution
+        bestSolution = currentSolution.getCompactSolution()
         
         # Initialize the RandomWalk algorithm parameters
         iterationsWithoutImprovement = 0
@@ -137,19 +221,25 @@ class Solver():
             # Check if the number of iterations withouth improvements exceedes the limit
             if iterationsWithoutImprovement > maxIterationsWithoutImprovement: break
 
-            # Randomly select a neighborhood solution from the current solutions neighborhood list
-            neighborhoodSolution = random.choice(currentSolution.getNeighborhoodSolutions())
+            # Randomly sample a neighborhood move from the current solutions neighborhood (without generating the neighborhood)
+            neighborhoodMove = currentSolution.sampleNeighborhoodMove(Solver.FLOAT_POSITIVE_INFINITY, granularNeighborCount)
 
-            # Check if the neighborhood solution has better time score the the best solution 
-            if (neighborhoodSolution.getTimeScore() < bestSolution.getTimeScore()):
-                # Replace the best solution with the neighborhood solution
-                bestSolution = neighborhoodSolution
+            # Check if the current solution has no neighborhood move at all
+            if neighborhoodMove is None: break
+
+            # Apply the neighborhood move to the current solution
+            currentSolution.applyMoveInPlace(neighborhoodMove)
+
+            # Check if the current solution has better time score the the best solution 
+            if (currentSolution.getTimeScore() < bestSolution.getTimeScore()):
+                # Replace the best solution with a compact copy of the current solution
+                bestSolution = currentSolution.getCompactSolution()
 
                 # Reset the iterationsWithoutImprovement counter
                 iterationsWithoutImprovement = 0
 
-            # Replace the current solution with the neighborhood solution
-            currentSolution = neighborhoodSolution
+        # Decode the compact best solution with the depot orders of the current solution to reinsert the charging orders
+        bestSolution = bestSolution.getSolution(currentSolution)
 
         # Loop over the drones to reinsert the charging orders
         for drone in bestSolution.getDroneList():
@@ -161,7 +251,8 @@ class Solver():
         # Return the best solution
         return bestSolution
     
-    def performThresholdAccepting(self, currentSolution: Solution, alphaFactor: float = 0.75, sizeFactor: int = 2, minimumThreshold: float = 15, initialThreshold: float = 3600) -> Solution:
+    def performThresholdAccepting(self, currentSolution: Solution, alphaFactor: float = 0.75, sizeFactor: int = 2, minimumThreshold: float = 15, initialThreshold: float = 3600,
+        acceptanceStrategy: AcceptanceStrategy = AcceptanceStrategy.BEST_IMPROVEMENT, neighborhoodOrder: NeighborhoodOrder = NeighborhoodOrder.SEQUENTIAL, sampleSize: int = DEFAULT_SAMPLE_SIZE, granularNeighborCount: int = None) -> Solution:
         # Get a copy of the current solution with out charging orders
         currentSolution = currentSolution.getSolutionCopy(False)
 
@@ -178,21 +269,35 @@ class Solver():
             # Increase the algorithm counter
             currentIteration += 1
 
-            # Select the best neighborhood solution from the current solutions neighborhood list
-            neighborhoodSolution = min(currentSolution.getNeighborhoodSolutions(), key=lambda x: x.getTimeScore())
+            # Select a neighborhood move from the lazily generated neighborhood of the current solution by evaluating the moves in place
+            neighborhoodMove = Solver.SelectMove(currentSolution.iterateNeighborhoodMoves(Solver.FLOAT_POSITIVE_INFINITY, neighborhoodOrder, granularNeighborCount),
+                currentSolution.evaluateMove, currentSolution.getTimeScore(), acceptanceStrategy, sampleSize)
+
+            # Check if the current solution has no neighborhood move at all
+            if neighborhoodMove is None: break
+
+            # Resolve the time score of the selected move
+            neighborhoodTimeScore = neighborhoodMove.getTimeScore()
+
+            # Check if the neighborhood move improves the best solution or is accepted by the threshold
+            isBestSolution = neighborhoodTimeScore < bestSolution.getTimeScore()
+            isAcceptedSolution = (neighborhoodTimeScore - currentSolution.getTimeScore()) < threshold
+
+            # Apply the neighborhood move only once if the neighborhood solution is needed
+            if isBestSolution or isAcceptedSolution: neighborhoodSolution = currentSolution.applyMove(neighborhoodMove)
             
             # Check if the neighborhood solution has better time score the the best solution 
-            if (neighborhoodSolution.getTimeScore() < bestSolution.getTimeScore()):
+            if isBestSolution:
                 # Replace the best solution with the neighborhood solution
                 bestSolution = neighborhoodSolution
             
             # Check if the delta between neighborhood and current solution time score is lower then the threshold
-            if (neighborhoodSolution.getTimeScore() - currentSolution.getTimeScore()) < threshold:
+            if isAcceptedSolution:
                 # Replace the current solution with the neighborhood solution
                 currentSolution = neighborhoodSolution
 
             # Check if the threshold exceeds the limit and the neighborhood solution is worse then the current solution
-            if threshold < minimumThreshold and currentSolution.getTimeScore() <= neighborhoodSolution.getTimeScore(): break
+            if threshold < minimumThreshold and currentSolution.getTimeScore() <= neighborhoodTimeScore: break
 
             # Check if the number of iterations exceeds the limit
             if currentIteration > maxIterations:
@@ -212,12 +317,13 @@ class Solver():
         # Return the best solution
         return bestSolution
 
-    def performSimulatedAnnealing(self, currentSolution: Solution, alphaFactor: float = 0.95, betaFactor: float = 1.15, sizeFactor: int = 16, initialAcceptanceRate: float = 30.0, frozenAcceptanceFraction: float = 0.1, frozenParameter: int = 5) -> Solution:
-        # Get a copy of the current solution with out charging orders
+    def performSimulatedAnnealing(self, currentSolution: Solution, alphaFactor: float = 0.95, betaFactor: float = 1.15, sizeFactor: int = 16, initialAcceptanceRate: float = 30.0, frozenAcceptanceFraction: float = 0.1, frozenParameter: int = 5,
+        granularNeighborCount: int = None) -> Solution:
+        # Get a copy of the current solution with out charging orders (changed in place by the moves)
         currentSolution = currentSolution.getSolutionCopy(False)
 
-        # Set the current solution as the best solution
-        bestSolution = currentSolution
+        # Set a compact copy of the current solution as the best solution
+        bestSolution = currentSolution.getCompactSolution()
 
         # Initialize the SimulatedAnnealing algorithm parameters
         maxIterations = sizeFactor * len(currentSolution.getOrderList())
@@ -232,22 +338,31 @@ class Solver():
             # Check if the temperature exceeds the frozenAcceptanceFraction and the current iteration the frozenParameter
             if temperature < frozenAcceptanceFraction and currentIteration > frozenParameter: break
 
-            # Randomly select a neighborhood solution from the current solutions neighborhood list
-            neighborhoodSolution = random.choice(currentSolution.getNeighborhoodSolutions())
+            # Randomly sample a neighborhood move from the current solutions neighborhood (without generating the neighborhood)
+            neighborhoodMove = currentSolution.sampleNeighborhoodMove(Solver.FLOAT_POSITIVE_INFINITY, granularNeighborCount)
 
-            # Check if the neighborhood solution has better time score the the best solution 
-            if (neighborhoodSolution.getTimeScore() < bestSolution.getTimeScore()):
-                # Replace the best solution with the neighborhood solution
-                bestSolution = neighborhoodSolution
+            # Check if the current solution has no neighborhood move at all
+            if neighborhoodMove is None: break
 
-            # Check if the neighborhood solution has better time score the the current solution 
-            if (neighborhoodSolution.getTimeScore() < currentSolution.getTimeScore()):
-                # Replace the current solution with the neighborhood solution
-                currentSolution = neighborhoodSolution
-            
-            # Check if the acceptance probability is greater then a random uniform number
-            elif random.uniform(0, 1) < math.exp((currentSolution.getTimeScore() - neighborhoodSolution.getTimeScore()) / temperature):
-                currentSolution = neighborhoodSolution
+            # Evaluate the sampled move in place
+            neighborhoodTimeScore = currentSolution.evaluateMove(neighborhoodMove)
+
+            # Check if the neighborhood move improves the best solution
+            isBestSolution = neighborhoodTimeScore < bestSolution.getTimeScore()
+
+            # Check if the neighborhood move improves the current solution or the acceptance probability is greater then a random uniform number
+            isAcceptedSolution = (neighborhoodTimeScore < currentSolution.getTimeScore()) or (
+                random.uniform(0, 1) < math.exp((currentSolution.getTimeScore() - neighborhoodTimeScore) / temperature))
+
+            # Check if the neighborhood move is accepted (a move that improves the best solution always improves the current solution)
+            if isAcceptedSolution:
+                # Apply the neighborhood move to the current solution
+                currentSolution.applyMoveInPlace(neighborhoodMove)
+
+                # Check if the current solution has better time score the the best solution 
+                if isBestSolution:
+                    # Replace the best solution with a compact copy of the current solution
+                    bestSolution = currentSolution.getCompactSolution()
 
             # Check if the number of iterations exceeds the limit
             if currentIteration > maxIterations:
@@ -257,6 +372,9 @@ class Solver():
                 # Recalculate the temperature
                 temperature *= alphaFactor
         
+        # Decode the compact best solution with the depot orders of the current solution to reinsert the charging orders
+        bestSolution = bestSolution.getSolution(currentSolution)
+
         # Loop over the drones to reinsert the charging orders
         for drone in bestSolution.getDroneList():
             # Try tp reinsert the charging orders into the drone tour
@@ -267,16 +385,36 @@ class Solver():
         # Return the best solution
         return bestSolution
     
-    def performReactiveTabuSearch(self, currentSolution: Solution, initialTabuListLength: int = 10, minTabuListLength: int = 5, maxTabuListLength: int = 5000, deltaOne: float = 1.2, deltaTwo: float = 2, maxIterationsOverall: int = 5000, maxIterationsWithoutImprovement: int = 5000, iterationsForListShortening: int = 10) -> Solution:
-        # Get a copy of the current solution with out charging orders
+    def performReactiveTabuSearch(self, currentSolution: Solution, initialTabuListLength: int = 10, minTabuListLength: int = 5, maxTabuListLength: int = 5000, deltaOne: float = 1.2, deltaTwo: float = 2, maxIterationsOverall: int = 5000, maxIterationsWithoutImprovement: int = 5000, iterationsForListShortening: int = 10,
+        granularNeighborCount: int = None, longTermMemorySize: int = DEFAULT_LONG_TERM_MEMORY_SIZE, timeLimit: float = None) -> Solution:
+        # Run the reactive tabu search on the relocate and exchange moves
+        return self.runReactiveTabuSearch(currentSolution, False, False, initialTabuListLength, minTabuListLength, maxTabuListLength, deltaOne, deltaTwo,
+            maxIterationsOverall, maxIterationsWithoutImprovement, iterationsForListShortening, granularNeighborCount, longTermMemorySize, timeLimit)
+
+    def performFullReactivTabuSearch(self, currentSolution: Solution, initialTabuListLength: int = 10, minTabuListLength: int = 5, maxTabuListLength: int = 5000, deltaOne: float = 1.2, deltaTwo: float = 2, maxIterationsOverall: int = 5000, maxIterationsWithoutImprovement: int = 5000, iterationsForListShortening: int = 10,
+        granularNeighborCount: int = None, longTermMemorySize: int = DEFAULT_LONG_TERM_MEMORY_SIZE, timeLimit: float = None) -> Solution:
+        # Run the reactive tabu search on the relocate, exchange and cross moves that keep a possible charging order insert
+        return self.runReactiveTabuSearch(currentSolution, True, True, initialTabuListLength, minTabuListLength, maxTabuListLength, deltaOne, deltaTwo,
+            maxIterationsOverall, maxIterationsWithoutImprovement, iterationsForListShortening, granularNeighborCount, longTermMemorySize, timeLimit)
+
+    def runReactiveTabuSearch(self, currentSolution: Solution, extendedNeighborhood: bool, chargingAware: bool, initialTabuListLength: int, minTabuListLength: int, maxTabuListLength: int, deltaOne: float, deltaTwo: float,
+        maxIterationsOverall: int, maxIterationsWithoutImprovement: int, iterationsForListShortening: int, granularNeighborCount: int = None, longTermMemorySize: int = DEFAULT_LONG_TERM_MEMORY_SIZE, timeLimit: float = None) -> Solution:
+        # Hint: The tabu list length is the tabu tenure of the attributes, an order may not return to a drone it left for that many iterations
+        # Get a copy of the current solution with out charging orders (changed in place by the moves)
         currentSolution = currentSolution.getSolutionCopy(False)
         
-        # Set the current solution as the best solution
-        bestSolution = currentSolution
+        # Set a compact copy of the current solution as the best solution
+        bestSolution = currentSolution.getCompactSolution()
+
+        # Resolve the time score function of the solutions (with the charging detours and the dwell times of the charging stops if the charging orders are considered)
+        solutionTimeScore = Solution.getChargingTimeScore if chargingAware else Solution.getTimeScore
+        bestTimeScore = solutionTimeScore(currentSolution)
 
         # Initialize the ReactiveTabuSearch algorithm parameters
-        tabuList = deque([currentSolution], initialTabuListLength)
-        longTermMemory = set([currentSolution])
+        startTime = time.time()
+        tabuTenure = initialTabuListLength
+        tabuDictionary = dict()
+        longTermMemory = OrderedDict([(currentSolution.getFingerprint(), None)])
         iterationsWithoutRepetition = 0
         iterationsWithoutImprovement = 0
         currentIteration = 0
@@ -292,110 +430,117 @@ class Solver():
 
             # Check if the number of iterations withouth improvements exceedes the limit
             if iterationsWithoutImprovement > maxIterationsWithoutImprovement: break
-            
-            # Resolve all neighborhood solutions of the current solution
-            neighborhoodSolutionList = currentSolution.getNeighborhoodSolutions(250, False)
 
-            # Inizialize the NeighborhoodSearch parameters
-            bestNotAllowedNeighborhoodSolution = None
-            bestAllowedNeighborhoodSolution = None
-            foundAlreadySeenSolution = 0
+            # Check if the time limit is set and exceeded
+            if (timeLimit is not None) and (time.time() - startTime > timeLimit): break
             
-            # Loop over the neighborhoodSolutionList to check each entry
-            for neighborhoodSolution in neighborhoodSolutionList:
-                # Create a TabuKey for the neighborhoodSolution
-                neighborhoodSolutionKey = TabuKey(neighborhoodSolution)
-
-                # Check neighborhoodSolutionKey against the longTermMemory
-                if neighborhoodSolutionKey in longTermMemory:
-                    # Increase the foundAlreadySeenSolution
-                    foundAlreadySeenSolution += 1
-
-                # Check if the neighborhoodSolution is not blocked
-                if neighborhoodSolutionKey not in tabuList:
-                    # Check if the bestAllowedNeighborhoodSolution is set
-                    if bestAllowedNeighborhoodSolution is not None:
-                        # Check the score of the neighborhoodSolution against the bestAllowedNeighborhoodSolution
-                        if neighborhoodSolution.getTimeScore() < bestAllowedNeighborhoodSolution.getTimeScore():
-                            # Set the neighborhoodSolution as the bestAllowedNeighborhoodSolution
-                            bestAllowedNeighborhoodSolution = neighborhoodSolution
-
-                    # Set the neighborhoodSolution as the bestAllowedNeighborhoodSolution
-                    else: bestAllowedNeighborhoodSolution = neighborhoodSolution
-
-                # Check if the bestNotAllowedNeighborhoodSolution is set
-                elif bestNotAllowedNeighborhoodSolution is not None:
-                    # Check the score of the neighborhoodSolution against the bestNotAllowedNeighborhoodSolution
-                    if neighborhoodSolution.getTimeScore() < bestNotAllowedNeighborhoodSolution.getTimeScore():
-                        # Set the neighborhoodSolution as the bestNotAllowedNeighborhoodSolution
-                        bestNotAllowedNeighborhoodSolution = neighborhoodSolution
-                
-                # Set the neighborhoodSolution as the bestNotAllowedNeighborhoodSolution
-                else: bestNotAllowedNeighborhoodSolution = neighborhoodSolution
+            # Resolve all neighborhood moves of the current solution (with the cross moves if the neighborhood is extended and only next to the nearest orders if the neighborhood is granular)
+            neighborhoodMoveIterator = (currentSolution.iterateExtendedNeighborhoodMoves if extendedNeighborhood else currentSolution.iterateNeighborhoodMoves)(250, NeighborhoodOrder.SEQUENTIAL, granularNeighborCount)
 
-            # Get the best neighborhood solution that is allowed, otherwise the best not allowed one
-            currentSolution = bestAllowedNeighborhoodSolution or bestNotAllowedNeighborhoodSolution
+            # Check if the charging orders are considered to score the moves with the charging stops of the changed tours
+            if chargingAware:
+                # Hint: The greedy charging stops are an upper bound of the optimal ones, the optimal charging stops are only calculated if the greedy ones are not possible
+                # Create the list of the moves with their charging aware time scores
+                scoredMoveList = []
 
-            # Blocke Best Moves
-            currentSolutionTabuKey = TabuKey(currentSolution)
+                # Loop through the neighborhood moves to score them with the charging stops of the changed tours
+                for neighborhoodMove in neighborhoodMoveIterator:
+                    # Evaluate the move with the greedy charging stops first and the optimal ones as fallback
+                    moveTimeScore = currentSolution.evaluateMoveChargingTime(neighborhoodMove)
+                    if moveTimeScore is None: moveTimeScore = currentSolution.evaluateMoveChargingTime(neighborhoodMove, True)
 
-            # Check if there were already seen solutions
-            if foundAlreadySeenSolution > 0:
-                # Hint: Increase tabu list length because we saw an already seen solution
-                # Resolve the current max tabu list length (with fallback if None)
-                targetTabuListLength = tabuList.maxlen or len(tabuList)
-                
-                # Check if the targetTabuListLength is smaller then the maxTabuListLength
-                if targetTabuListLength < maxTabuListLength:
-                    # Use the reactive tabu search deltas to calculate the new targetTabuListLength
-                    targetTabuListLength = max(math.ceil(targetTabuListLength * deltaOne), targetTabuListLength + deltaTwo)
+                    # Constraint: The charging orders of the changed tours can be inserted
+                    if moveTimeScore is not None: scoredMoveList.append((moveTimeScore, neighborhoodMove))
+
+            # Score the moves without charging orders
+            else: scoredMoveList = [(currentSolution.evaluateMove(neighborhoodMove), neighborhoodMove) for neighborhoodMove in neighborhoodMoveIterator]
+
+            # Sort the moves by the time score of the moved solutions (evaluated without creating them, equal scores keep the neighborhood order)
+            scoredMoveList.sort(key=lambda x: x[0])
 
-                    # Check if the targetTabuListLength exceeds the maxTabuListLength
-                    targetTabuListLength = min(targetTabuListLength, maxTabuListLength)
-                    
-                    # Replace the tabuList to increase the max list length
-                    tabuList = deque(tabuList, targetTabuListLength)
+            # Inizialize the NeighborhoodSearch parameters
+            bestNotAllowedNeighborhoodMove = None
+            currentMove = None
+
+            # Loop over the sorted moves until the best allowed move is found
+            for moveTimeScore, neighborhoodMove in scoredMoveList:
+                # Check if the move is not blocked (no order returns to a tabu drone) or leads to a new best solution (aspiration)
+                if (moveTimeScore < bestTimeScore) or not any(tabuDictionary.get((order, destinationDrone), 0) >= currentIteration
+                    for order, _, destinationDrone in currentSolution.getMoveReassignments(neighborhoodMove)):
+                    # Set the neighborhoodMove as the best allowed move
+                    currentMove = neighborhoodMove
+                    break
+
+                # Set the first blocked neighborhoodMove as the bestNotAllowedNeighborhoodMove
+                if bestNotAllowedNeighborhoodMove is None: bestNotAllowedNeighborhoodMove = neighborhoodMove
+
+            # Get the best neighborhood move that is allowed, otherwise the best not allowed one
+            currentMove = currentMove or bestNotAllowedNeighborhoodMove
+
+            # Check if there is no neighborhood move left
+            if currentMove is None: break
+
+            # Block the drones the moved orders leave for the current tabu tenure
+            for order, sourceDrone, _ in currentSolution.getMoveReassignments(currentMove):
+                tabuDictionary[(order, sourceDrone)] = currentIteration + tabuTenure
+
+            # Apply the move to the current solution (the fingerprint is updated with the changed edges)
+            currentSolution.applyMoveInPlace(currentMove)
+            currentSolutionFingerprint = currentSolution.getFingerprint()
+
+            # Check if the current solution was already seen
+            if currentSolutionFingerprint in longTermMemory:
+                # Hint: Increase tabu tenure because we saw an already seen solution
+                # Check if the tabuTenure is smaller then the maxTabuListLength
+                if tabuTenure < maxTabuListLength:
+                    # Use the reactive tabu search deltas to calculate the new tabuTenure
+                    tabuTenure = max(math.ceil(tabuTenure * deltaOne), tabuTenure + deltaTwo)
+
+                    # Check if the tabuTenure exceeds the maxTabuListLength
+                    tabuTenure = min(tabuTenure, maxTabuListLength)
 
                 # Reset the iterationsWithoutRepetition counter 
                 iterationsWithoutRepetition = 0
 
-            # Check if there were enought iterations without repetitions
-            elif iterationsWithoutRepetition >= iterationsForListShortening:
-                # Hint: Decrease tabu list because we did not see some already seen solutions for a while
-                # Resolve the current max tabu list length (with fallback if None)
-                targetTabuListLength = tabuList.maxlen or len(tabuList)
+                # Mark the current solution as the most recently seen one of the longTermMemory
+                longTermMemory.move_to_end(currentSolutionFingerprint)
 
-                 # Check if the targetTabuListLength is greater then the minTabuListLength
-                if targetTabuListLength > minTabuListLength:
-                    # Use the reactive tabu search deltas to calculate the new targetTabuListLength
-                    targetTabuListLength = min(math.ceil(targetTabuListLength / deltaOne), targetTabuListLength - deltaTwo)
+            else:
+                # Check if there were enought iterations without repetitions
+                if iterationsWithoutRepetition >= iterationsForListShortening:
+                    # Hint: Decrease tabu tenure because we did not see some already seen solutions for a while
+                    # Check if the tabuTenure is greater then the minTabuListLength
+                    if tabuTenure > minTabuListLength:
+                        # Use the reactive tabu search deltas to calculate the new tabuTenure
+                        tabuTenure = min(math.ceil(tabuTenure / deltaOne), tabuTenure - deltaTwo)
 
-                    # Check if the targetTabuListLength subceed the minTabuListLength
-                    targetTabuListLength = max(targetTabuListLength, minTabuListLength)
-                    
-                    # Replace the tabuList to decrease the max list length
-                    tabuList = deque(tabuList, targetTabuListLength)
+                        # Check if the tabuTenure subceed the minTabuListLength
+                        tabuTenure = max(tabuTenure, minTabuListLength)
 
-                # Reset the iterationsWithoutRepetition counter 
-                iterationsWithoutRepetition = 0
+                    # Reset the iterationsWithoutRepetition counter 
+                    iterationsWithoutRepetition = 0
 
-            # Increase the iterationsWithoutRepetition counter 
-            else: iterationsWithoutRepetition += 1
+                # Increase the iterationsWithoutRepetition counter 
+                else: iterationsWithoutRepetition += 1
 
-            # Add the currentSolutionTabuKey to the tabuList
-            tabuList.append(currentSolutionTabuKey)
+                # Add the currentSolutionFingerprint to the longTermMemory
+                longTermMemory[currentSolutionFingerprint] = None
 
-            # Add the currentSolutionTabuKey to the longTermMemory
-            longTermMemory.add(currentSolutionTabuKey)
+                # Remove the least recently seen fingerprint if the longTermMemory exceeds its size
+                if len(longTermMemory) > longTermMemorySize: longTermMemory.popitem(last=False)
 
             # Check if the current solution solution has better time score the the best solution 
-            if (currentSolution.getTimeScore() < bestSolution.getTimeScore()):
-                # Replace the best solution with the current solution
-                bestSolution = currentSolution
+            if (solutionTimeScore(currentSolution) < bestTimeScore):
+                # Replace the best solution with a compact copy of the current solution
+                bestSolution = currentSolution.getCompactSolution()
+                bestTimeScore = solutionTimeScore(currentSolution)
                 
                 # Reset the iterationsWithoutImprovement counter
                 iterationsWithoutImprovement = 0
         
+        # Decode the compact best solution with the depot orders of the current solution to reinsert the charging orders
+        bestSolution = bestSolution.getSolution(currentSolution)
+
         # Loop over the drones to reinsert the charging orders
         for drone in bestSolution.getDroneList():
             # Try tp reinsert the charging orders into the drone tour
@@ -405,45 +550,110 @@ class Solver():
         
         # Return the best solution
         return bestSolution
-    
 
-    def performFullReactivTabuSearch(self, currentSolution: Solution, initialTabuListLength: int = 10, minTabuListLength: int = 5, maxTabuListLength: int = 5000, deltaOne: float = 1.2, deltaTwo: float = 2, maxIterationsOverall: int = 5000, maxIterationsWithoutImprovement: int = 5000, iterationsForListShortening: int = 10) -> Solution:
-        # Get a copy of the current solution with out charging orders
-        currentSolution = currentSolution.getSolutionCopy(False)
-            
-        # Set the current solution as the best solution
-        bestSolution = currentSolution
+    ################################################################################
+    ############################ STATIC SOLVER FUNCTIONS ###########################
+    ################################################################################
 
+    @staticmethod
+    def SelectMove(moveIterator: Iterator[Move], moveScore: Callable[[Move], float], referenceScore: float, acceptanceStrategy: AcceptanceStrategy = AcceptanceStrategy.BEST_IMPROVEMENT,
+        sampleSize: int = DEFAULT_SAMPLE_SIZE) -> Move | None:
+        # Check if the best move of the first moves should be selected (combine it with a random neighborhood order for a uniform sample)
+        if acceptanceStrategy == AcceptanceStrategy.BEST_OF_SAMPLE: return min(islice(moveIterator, sampleSize), key=moveScore, default=None)
 
+        # Check if the best move of the whole neighborhood should be selected (first one for equal scores)
+        if acceptanceStrategy == AcceptanceStrategy.BEST_IMPROVEMENT: return min(moveIterator, key=moveScore, default=None)
 
+        # Set the best move of the scanned moves as not found yet
+        bestMove, bestMoveScore = None, Solver.FLOAT_POSITIVE_INFINITY
 
+        # Loop through the moves only until the first improving move
+        for move in moveIterator:
+            # Score the move and check if it improves the reference score to stop the scan
+            score = moveScore(move)
+            if score < referenceScore: return move
 
+            # Check if the move is the best of the scanned moves (fallback if there is no improving move)
+            if (bestMove is None) or (score < bestMoveScore): bestMove, bestMoveScore = move, score
 
+        # Return the best of all moves as no move improves the reference score
+        return bestMove
 
+    @staticmethod
+    def GenerateInitialSolution(droneList: list[Drone], orderList: list[Order], solution: Solution, allowRecharge: bool = True, nodeBudget: int = None) -> ExitCode:
+        # Hint: Depth first search over the drones of each order with an explicit stack of the open search stages (no recursion per order)
+        # Resolve the solution matrix for easier access
+        solutionMatrix = solution.getSolutionMatrix()
 
-            
-        # Return the best solution
-        return bestSolution    
+        # Create the milage cache of this construction (milage of each added order since the start or the last charging order)
+        orderMilageCache = dict()
 
-    ################################################################################
-    ############################ STATIC SOLVER FUNCTIONS ###########################
-    ################################################################################
+        # Create the undo stack with the drone of each added order (the orders are removed in the reverse order of their insert)
+        undoStack = []
 
-    @staticmethod
-    def GenerateInitialSolution(droneList: list[Drone], orderList: list[Order], solution: Solution, allowRecharge: bool = True, orderIndex: int = 0, orderMilageCache: dict[Order, float] = dict()) -> ExitCode:
-         #Resolve the solution matrix for easier access
-        solutionMatrix = solution.getSolutionMatrix()
-        
-        # Check if all orders are assigned to a drone
-        if (orderIndex == len(orderList)):
-            # Try to close the route by inserting the return-to-start (depot) order
-            for drone in droneList:
-                # Close the route by inserting the return-to-start (depot) order
-                currentOrder = Order(solutionMatrix[drone][0].getDestination(), 0, 0)
+        # Resolve the maximum number of added orders before the search is stopped (linear in the number of orders by default)
+        nodeBudget = Solver.INITIAL_SOLUTION_NODE_BUDGET_FACTOR * max(len(orderList), 1) if nodeBudget is None else nodeBudget
+        nodeCount = 0
+
+        # Check if there is no order at all and close the routes directly
+        if len(orderList) == 0: return Solver.CloseInitialSolution(droneList, solution, orderMilageCache)
+
+        # Create the search stack with the stage of the first order
+        searchStack = [SearchStage(0, Solver.SortInitialSolutionDrones(droneList, orderList[0], solution))]
+
+        # Initialize the response code of the last finished search stage
+        responseCode = None
+
+        # Run the search until all search stages failed
+        while searchStack:
+            # Resolve the current search stage and its order
+            searchStage = searchStack[-1]
+            currentOrder = orderList[searchStage.orderIndex]
+
+            # Check if the search stage receives the failure of its following search stage
+            if responseCode is not None:
+                # Check if the order fails because no charging station in range and the drones are not recharged yet
+                if allowRecharge and (responseCode == ExitCode.NO_CHARGING_STATION_IN_RANGE) and (searchStage.rechargeUndoSize is None):
+                    # Save the undo stack size before the charging orders
+                    searchStage.rechargeUndoSize = len(undoStack)
+
+                    # Order the drones to the closest charging station
+                    for subDrone in droneList:
+                        # Get the closest charging station for the subDrone by its last order in the list
+                        targetChargingStation = solution.getClosestChargingStation(solutionMatrix[subDrone][-1])
+
+                        # Create a charging order for the current subdrone
+                        chargingOrder = Order(targetChargingStation, 0, ProblemInstance.CHARGING_ORDER_DWELL_TIME)
+
+                        # Add the charging station as next order of the subDrone
+                        solutionMatrix[subDrone].append(chargingOrder)
+                        undoStack.append(subDrone)
+
+                        # Reset the order milage cache to zero
+                        orderMilageCache[chargingOrder] = 0
+
+                    # Reset the response code and search the following orders again with the recharged drones
+                    responseCode = None
+
+                    # Check if the current order is the last one to close the routes or continue with the stage of the next order
+                    if searchStage.orderIndex + 1 == len(orderList): return Solver.CloseInitialSolution(droneList, solution, orderMilageCache)
+                    searchStack.append(SearchStage(searchStage.orderIndex + 1, Solver.SortInitialSolutionDrones(droneList, orderList[searchStage.orderIndex + 1], solution)))
+                    continue
+
+                # Revert the changes of the current drone candidate (the order and the charging orders) and reset the response code
+                Solver.RevertInitialSolution(solution, orderMilageCache, undoStack, searchStage.undoSize)
+                searchStage.rechargeUndoSize = None
+                responseCode = None
+
+            # Loop over the remaining sorted drones to check the drones from the closest to farest one
+            while searchStage.droneIndex < len(searchStage.droneList):
+                # Resolve the next drone candidate of the search stage
+                drone = searchStage.droneList[searchStage.droneIndex]
+                searchStage.droneIndex += 1
 
                 # Resolve the milage of the current drones last order if available
                 lastDroneMilage = orderMilageCache.get(solutionMatrix[drone][-1], 0)
-                
+
                 # Resolve the distance between the last and current order from the precalculated solution
                 lastToCurrentOrderDistance = solution.getOrderDistance(solutionMatrix[drone][-1], currentOrder)
 
@@ -452,38 +662,77 @@ class Solver():
 
                 # Constraint: Remaining range of the drone to reach the desired target
                 if (currentDroneMilage > drone.getRemainingFlightDistance()):
-                    # Get the closest charging station for the drone by its last order in the list
-                    targetChargingStation = solution.getClosestChargingStation(solutionMatrix[drone][-1])
-                    
-                    # Create a charging order for the current drone
-                    chargingOrder = Order(targetChargingStation, 0, 900)
+                    # Set the constrainFailureLevel exit code
+                    searchStage.constrainFailureLevel = ExitCode.ORDER_NOT_IN_RANGE
+
+                    # Goto next drone
+                    continue
 
-                    # Add the charging station as next order of the drone
-                    solutionMatrix[drone].append(chargingOrder)
+                # Calculate the remaining range of the drone after the current order
+                remainingDroneRange = drone.getRemainingFlightDistance() - currentDroneMilage
 
-                    # Reset the order milage cache to zero
-                    orderMilageCache[chargingOrder] = 0
+                # Constraint: Check if after the current order enough charge is left to reach a charging stations
+                if not solution.isChargingStationInRange(currentOrder, remainingDroneRange):
+                    # Set the constrainFailureLevel exit code
+                    searchStage.constrainFailureLevel = ExitCode.NO_CHARGING_STATION_IN_RANGE
+
+                    # Goto next drone
+                    continue
+
+                # Check if the node budget is exhausted to stop the search
+                nodeCount += 1
+                if nodeCount > nodeBudget: return ExitCode.NODE_BUDGET_EXCEEDED
+
+                # Save the undo stack size before the current order
+                searchStage.undoSize = len(undoStack)
 
                 # Drone has enough capacity add the current order
                 solutionMatrix[drone].append(currentOrder)
+                undoStack.append(drone)
 
                 # Update the order milage cache for the current order
                 orderMilageCache[currentOrder] = currentDroneMilage
+                break
 
-            # Return exit code for success
-            return ExitCode.SUCCESS
-        
-        # Define the constraint failure level exit code
-        constrainFailureLevel = ExitCode.NO_SOLUTION
+            # Check if all drones of the search stage failed
+            else:
+                # Remove the search stage and pass its last given constrainFailureLevel exit code to the previous search stage
+                responseCode = searchStack.pop().constrainFailureLevel
+                continue
+
+            # Check if the current order is the last one to close the routes or continue with the stage of the next order
+            if searchStage.orderIndex + 1 == len(orderList): return Solver.CloseInitialSolution(droneList, solution, orderMilageCache)
+            searchStack.append(SearchStage(searchStage.orderIndex + 1, Solver.SortInitialSolutionDrones(droneList, orderList[searchStage.orderIndex + 1], solution)))
 
-        # Resolve the current order by the index
-        currentOrder = orderList[orderIndex]
+        # Return the last given constrainFailureLevel exit code of the first order
+        return responseCode
+
+    @staticmethod
+    def SortInitialSolutionDrones(droneList: list[Drone], currentOrder: Order, solution: Solution) -> list[Drone]:
+        # Sort the drones by the distance between their last order and the current order (closest first)
+        return sorted(droneList, key=lambda x: solution.getOrderDistance(solution.getSolutionMatrix()[x][-1], currentOrder))
+
+    @staticmethod
+    def RevertInitialSolution(solution: Solution, orderMilageCache: dict[Order, float], undoStack: list[Drone], undoSize: int):
+        # Remove the orders from the drones of the undo stack until the given undo stack size is reached
+        while len(undoStack) > undoSize:
+            # Remove the last added order of the drone (del from both dicts)
+            removedOrder = solution.getSolutionMatrix()[undoStack.pop()].pop()
+            del orderMilageCache[removedOrder]
+
+    @staticmethod
+    def CloseInitialSolution(droneList: list[Drone], solution: Solution, orderMilageCache: dict[Order, float]) -> ExitCode:
+        # Resolve the solution matrix for easier access
+        solutionMatrix = solution.getSolutionMatrix()
+
+        # Try to close the route by inserting the return-to-start (depot) order
+        for drone in droneList:
+            # Close the route by inserting the return-to-start (depot) order
+            currentOrder = Order(solutionMatrix[drone][0].getDestination(), 0, 0)
 
-        # Loop over the sorted list of drones to check the drones from the closest to farest one
-        for drone in sorted(droneList, key=lambda x: solution.getOrderDistance(solutionMatrix[x][-1], currentOrder)):
             # Resolve the milage of the current drones last order if available
             lastDroneMilage = orderMilageCache.get(solutionMatrix[drone][-1], 0)
-            
+
             # Resolve the distance between the last and current order from the precalculated solution
             lastToCurrentOrderDistance = solution.getOrderDistance(solutionMatrix[drone][-1], currentOrder)
 
@@ -492,144 +741,470 @@ class Solver():
 
             # Constraint: Remaining range of the drone to reach the desired target
             if (currentDroneMilage > drone.getRemainingFlightDistance()):
-                # Set the constrainFailureLevel exit code
-                constrainFailureLevel = ExitCode.ORDER_NOT_IN_RANGE
-                
-                # Goto next drone
-                continue
+                # Get the closest charging station for the drone by its last order in the list
+                targetChargingStation = solution.getClosestChargingStation(solutionMatrix[drone][-1])
 
-            # Calculate the remaining range of the drone after the current order 
-            remainingDroneRange = drone.getRemainingFlightDistance() - currentDroneMilage
+                # Create a charging order for the current drone
+                chargingOrder = Order(targetChargingStation, 0, ProblemInstance.CHARGING_ORDER_DWELL_TIME)
 
-            # Constraint: Check if after the current order enough charge is left to reach a charging stations
-            if not solution.isChargingStationInRange(currentOrder, remainingDroneRange):
-                # Set the constrainFailureLevel exit code
-                constrainFailureLevel = ExitCode.NO_CHARGING_STATION_IN_RANGE
+                # Add the charging station as next order of the drone
+                solutionMatrix[drone].append(chargingOrder)
+
+                # Reset the order milage cache to zero
+                orderMilageCache[chargingOrder] = 0
 
-                # Goto next drone
-                continue
-            
             # Drone has enough capacity add the current order
             solutionMatrix[drone].append(currentOrder)
 
             # Update the order milage cache for the current order
             orderMilageCache[currentOrder] = currentDroneMilage
 
-            # Check the recursive alogrithms backtracking response code
-            recursiveResponseCode = Solver.GenerateInitialSolution(
-                droneList, orderList, solution, allowRecharge, orderIndex + 1, orderMilageCache)
-
-            # Check if the order fails because no charging station in range
-            if (allowRecharge and (recursiveResponseCode == ExitCode.NO_CHARGING_STATION_IN_RANGE)):
-                # Order the drones to the closest charging station
-                for subDrone in droneList:
-                    # Get the closest charging station for the subDrone by its last order in the list
-                    targetChargingStation = solution.getClosestChargingStation(solutionMatrix[subDrone][-1])
-                    
-                    # Create a charging order for the current subdrone
-                    chargingOrder = Order(targetChargingStation, 0, 900)
-
-                    # Add the charging station as next order of the subDrone
-                    solutionMatrix[subDrone].append(chargingOrder)
-
-                    # Reset the order milage cache to zero
-                    orderMilageCache[chargingOrder] = 0
-                
-                # Check the recursive alogrithms backtracking response code
-                recursiveResponseCode = Solver.GenerateInitialSolution(
-                    droneList, orderList, solution, allowRecharge, orderIndex + 1, orderMilageCache)
+        # Return exit code for success
+        return ExitCode.SUCCESS
 
-                # Check if the recursive algorithm was no success
-                if (recursiveResponseCode != ExitCode.SUCCESS):
-                    # Remove the charging order from all drones
-                    for subDrone in droneList:
-                        # Remove the charging order of the drone (del from both dicts)
-                        removedChargingOrder = solutionMatrix[drone].pop()
-                        del orderMilageCache[removedChargingOrder]
-
-            # Check if the recursive algorithm was a success to end it
-            if (recursiveResponseCode == ExitCode.SUCCESS):
-                # Return exit code for success
-                return ExitCode.SUCCESS
-            
-            # Revert the changes of the current stage (del from both dicts)
-            removedChargingOrder = solutionMatrix[drone].pop()
-            del orderMilageCache[removedChargingOrder]
+    @staticmethod
+    def GenerateSavingsSolution(droneList: list[Drone], orderList: list[Order], solution: Solution, allowRecharge: bool = True, routesPerDrone: int = SAVINGS_ROUTES_PER_DRONE) -> ExitCode:
+        # Hint: Clarke wright savings over the pairs of nearest orders, the routes are limited to an equal share of the orders and packed onto the fixed fleet afterwards
+        # Resolve the distance matrix, the matrix index of the depot and the matrix indices of the orders for easier access
+        distanceMatrix = solution.getDistanceMatrix()
+        depotIndex = solution.getOrderIndex(solution.getSolutionMatrix()[droneList[0]][0])
+        orderIndexArray = np.array(solution.getOrderIndices(orderList), dtype=np.intp)
 
-        # Return the last given constrainFailureLevel exit code
-        return constrainFailureLevel
-    
-################################################################################
-################################ SUPPORT CLASSES ###############################
-################################################################################
+        # Check if there is no order at all and close the empty routes directly
+        if len(orderList) == 0: return Solver.CloseConstructedSolution(droneList, solution, dict((drone, []) for drone in droneList), allowRecharge)
 
-class TabuKey():
-    # Constructor the tabu key with given arguemnts
-    def __init__(self, solution: Solution):
-        # Save the drone list for equality checks
-        self.droneList = solution.getDroneList()
+        # Resolve the drone with the smallest range (a merged route has to be feasible for every drone it is packed onto)
+        rangeDrone = min(droneList, key=lambda x: x.getRemainingFlightDistance())
 
-        # Save the drone order dict as the unique parameter
-        self.droneOrders = solution.getSolutionMatrix()
+        # Resolve the maximum number of orders per route
+        routeCapacity = math.ceil(len(orderList) / (len(droneList) * routesPerDrone))
 
-    ################################################################################
-    ################################ CLASS FUNCTIONS ###############################
-    ################################################################################
+        # Collect the pairs of the orders and their nearest orders from the neighborhood matrix (each pair once, instead of all quadratic pairs)
+        orderPositionDictionary = dict(map(reversed, enumerate(orderList)))
+        orderNeighborhoodMatrix = solution.getOrderNeighborhoodMatrix()
+        pairArray = np.array(sorted(set((min(x, y), max(x, y)) for x, order in enumerate(orderList) for y in map(orderPositionDictionary.get, orderNeighborhoodMatrix[order]) if (y is not None) and (x != y))), dtype=np.intp).reshape(-1, 2)
 
-    def __eq__(self, other):
-        # Check if the have the same reference
-        if self is other: return True
+        # Calculate the distances between the depot and the orders and the savings of serving each pair in one route instead of two
+        depotDistanceArray = distanceMatrix.getDistances(depotIndex, orderIndexArray)
+        pairDistanceArray = distanceMatrix.getDistances(orderIndexArray[pairArray[:, 0]], orderIndexArray[pairArray[:, 1]])
+        savingsArray = depotDistanceArray[pairArray[:, 0]] + depotDistanceArray[pairArray[:, 1]] - pairDistanceArray
 
-        # Check if the are the same class instance
-        if not isinstance(other, TabuKey): return False
+        # Create a route with each order and save the routes by their end orders (the inner orders of a route are never merged again)
+        endRouteDictionary = dict((x, ([x], 0.0)) for x in range(len(orderList)))
 
-        # Check if the drone orders are initialized in both tabu keys
-        if self.droneOrders is None or other.droneOrders is None: return False
+        # Loop through the pairs from the largest to the smallest savings to merge their routes
+        for pairIndex in np.argsort(-savingsArray, kind='stable').tolist():
+            # Check if the remaining pairs don't save any distance
+            if savingsArray[pairIndex] <= 0: break
 
-        # Check if the drone orders have the same reference
-        if self.droneOrders is other.droneOrders: return True
+            # Resolve the routes of the pair (only orders at the end of a route are merged)
+            x, y = pairArray[pairIndex].tolist()
+            xRoute, yRoute = endRouteDictionary.get(x), endRouteDictionary.get(y)
 
-        # Check if the drone orders have the same keys and key values
-        if self.droneOrders == other.droneOrders: return True
+            # Constraint: Both orders are the end of two different routes and the merged route is not larger than the route capacity
+            if (xRoute is None) or (yRoute is None) or (xRoute is yRoute) or (len(xRoute[0]) + len(yRoute[0]) > routeCapacity): continue
 
-        # Check if the length of the drone orders is equal
-        if len(self.droneOrders) != len(other.droneOrders): return False
+            # Orient the routes to end with the first and to start with the second order and merge them
+            xOrderList = xRoute[0] if xRoute[0][-1] == x else xRoute[0][::-1]
+            yOrderList = yRoute[0] if yRoute[0][0] == y else yRoute[0][::-1]
+            mergedOrderList = xOrderList + yOrderList
 
-        # Check if the length of the drone list is equal
-        if len(self.droneList) != len(other.droneList): return False
+            # Calculate the distance of the merged route (without the depot) and of its tour (with the depot)
+            mergedDistance = xRoute[1] + yRoute[1] + pairDistanceArray[pairIndex]
+            mergedTourDistance = depotDistanceArray[mergedOrderList[0]] + mergedDistance + depotDistanceArray[mergedOrderList[-1]]
 
-        # Loop through the list of drones to compare the 
-        for drone in self.droneList:
-            # Check if the drone orders are equal in size, content and order
-            if self.droneOrders[drone] == other.droneOrders[drone]: continue
-            
-            # Check fi the drone orders have the same size before in depth comparison
-            if len(self.droneOrders[drone]) != len(other.droneOrders[drone]): return False
-
-            # Iterate over the list of the drone in both tabu keys by index
-            for droneOrderIndex in range(len(self.droneOrders[drone])):
-                # Check if the order id of the current drone order index is equal in this and the other tabu key
-                if self.droneOrders[drone][droneOrderIndex].getId() != other.droneOrders[drone][droneOrderIndex].getId():
-                    # Not equal so return False
-                    return False
-
-        # Default to True
-        return True
-    
-    def __hash__(self):
-        # Initialize the result hash
-        resultHash = 1
-        
-        # Loop over the droneOrderDict for the drone and orderList
-        for drone, orderList in self.droneOrders.items():
-            # Iterate through the orderList of each drone
-            for orderIndex in range(len(orderList)):
-                # Calculate an orderHash with a magic number and the parameters
-                orderHash = 31 * drone.getId() + (orderIndex + 1)
-                orderHash = 31 * orderHash + orderList[orderIndex].getId()
-
-                # Add the position based order hash to the result hash
-                resultHash = (31 * resultHash + orderHash) % 4157396449
-
-        # Return the result hash
-        return resultHash
\ No newline at end of file
+            # Constraint: The tour of the merged route is in range of the drones (with the optimal charging stops)
+            if Solver.CalculateConstructedTourTime(solution, rangeDrone, [depotIndex] + orderIndexArray[mergedOrderList].tolist() + [depotIndex], mergedTourDistance, 0, allowRecharge) is None: continue
+
+            # Remove the previous end orders of both routes and save the merged route by its end orders
+            for endOrder in set((xOrderList[0], x, y, yOrderList[-1])): del endRouteDictionary[endOrder]
+            endRouteDictionary[mergedOrderList[0]] = endRouteDictionary[mergedOrderList[-1]] = (mergedOrderList, mergedDistance)
+
+        # Resolve the unique routes (each route is saved by both of its end orders)
+        routeList = list(dict((id(route), route) for route in endRouteDictionary.values()).values())
+
+        # Create the drone tours with their distances and dwell times
+        droneTourDictionary = dict((drone, []) for drone in droneList)
+        droneTourDistanceDictionary = dict((drone, 0.0) for drone in droneList)
+        droneTourDwellDictionary = dict((drone, 0) for drone in droneList)
+
+        # Create the list of the deferred orders (of the routes that don't fit onto any drone)
+        deferredList = []
+
+        # Loop through the routes from the longest to the shortest tour to pack them onto the drones (longest processing time first)
+        for routeOrderList, routeDistance in sorted(routeList, key=lambda x: depotDistanceArray[x[0][0]] + x[1] + depotDistanceArray[x[0][-1]], reverse=True):
+            # Resolve the dwell time of the route
+            routeDwellTime = sum(orderList[x].getDwellTime() for x in routeOrderList)
+
+            # Create the list of the drone candidates with their appended tours
+            candidateList = []
+
+            # Loop through the drones to append the route to their tours
+            for drone in droneList:
+                # Resolve the current tour of the drone and its last order (or the depot)
+                droneTour = droneTourDictionary[drone]
+                lastIndex = orderIndexArray[droneTour[-1]] if droneTour else depotIndex
+
+                # Orient the route to start with the end order closest to the last order of the tour (the tour joins the route directly instead of returning to the depot)
+                orientedOrderList = routeOrderList if distanceMatrix.getDistance(lastIndex, orderIndexArray[routeOrderList[0]]) <= distanceMatrix.getDistance(lastIndex, orderIndexArray[routeOrderList[-1]]) else routeOrderList[::-1]
+
+                # Calculate the tour distance with the appended route (the return to the depot moves to the end of the route)
+                tourDistance = (droneTourDistanceDictionary[drone] - (depotDistanceArray[droneTour[-1]] if droneTour else 0.0) + distanceMatrix.getDistance(lastIndex, orderIndexArray[orientedOrderList[0]])
+                    + routeDistance + depotDistanceArray[orientedOrderList[-1]])
+
+                # Calculate the tour time with the appended route (with the optimal charging stops)
+                tourTime = Solver.CalculateConstructedTourTime(solution, drone, [depotIndex] + orderIndexArray[droneTour + orientedOrderList].tolist() + [depotIndex], tourDistance, droneTourDwellDictionary[drone] + routeDwellTime, allowRecharge)
+
+                # Constraint: The tour with the appended route is in range of the drone
+                if tourTime is None: continue
+
+                # Save the drone candidate with its tour time, oriented route and tour distance
+                candidateList.append((tourTime, orientedOrderList, tourDistance, drone))
+
+            # Check if no drone can fly the route and defer its orders
+            if not candidateList:
+                # Save the orders of the route to insert them one by one after the routes
+                deferredList.extend(routeOrderList)
+                continue
+
+            # Append the route to the tour of the drone with the shortest tour time afterwards
+            _, orientedOrderList, tourDistance, drone = min(candidateList, key=lambda x: x[0])
+            droneTourDictionary[drone].extend(orientedOrderList)
+            droneTourDistanceDictionary[drone] = tourDistance
+            droneTourDwellDictionary[drone] += routeDwellTime
+
+        # Hint: A merged route is only checked as a round trip from the depot, appended to a tour it may not fit onto any drone anymore
+        # Loop through the deferred orders from the farest to the closest to the depot to insert them at the cheapest position of any drone tour
+        for x in sorted(deferredList, key=lambda x: depotDistanceArray[x], reverse=True):
+            # Create the list of the drone candidates with their inserted tours
+            candidateList = []
+
+            # Loop through the drones to insert the order into their tours
+            for drone in droneList:
+                # Calculate the insert distance deltas of the order between all following tour positions
+                tourIndices = [depotIndex] + orderIndexArray[droneTourDictionary[drone]].tolist() + [depotIndex]
+                sourceIndexArray, destinationIndexArray = np.array(tourIndices[:-1], dtype=np.intp), np.array(tourIndices[1:], dtype=np.intp)
+                insertDeltaArray = distanceMatrix.getDistances(sourceIndexArray, orderIndexArray[x]) + distanceMatrix.getDistances(orderIndexArray[x], destinationIndexArray) - distanceMatrix.getDistances(sourceIndexArray, destinationIndexArray)
+
+                # Loop through the tour positions from the cheapest to the most expensive insert
+                for tourPosition in np.argsort(insertDeltaArray, kind='stable').tolist():
+                    # Calculate the tour time with the inserted order (with the optimal charging stops)
+                    tourTime = Solver.CalculateConstructedTourTime(solution, drone, tourIndices[:tourPosition + 1] + [orderIndexArray.item(x)] + tourIndices[tourPosition + 1:],
+                        droneTourDistanceDictionary[drone] + insertDeltaArray[tourPosition], droneTourDwellDictionary[drone] + orderList[x].getDwellTime(), allowRecharge)
+
+                    # Constraint: The tour with the inserted order is in range of the drone
+                    if tourTime is None: continue
+
+                    # Save the drone candidate with its tour time, tour position and insert distance delta
+                    candidateList.append((tourTime, tourPosition, insertDeltaArray.item(tourPosition), drone))
+                    break
+
+            # Check if no drone can fly the order
+            if not candidateList: return ExitCode.NO_CHARGING_STATION_IN_RANGE if allowRecharge else ExitCode.ORDER_NOT_IN_RANGE
+
+            # Insert the order into the tour of the drone with the shortest tour time afterwards
+            _, tourPosition, insertDelta, drone = min(candidateList, key=lambda x: x[0])
+            droneTourDictionary[drone].insert(tourPosition, x)
+            droneTourDistanceDictionary[drone] += insertDelta
+            droneTourDwellDictionary[drone] += orderList[x].getDwellTime()
+
+        # Close the drone tours with the orders of the routes
+        return Solver.CloseConstructedSolution(droneList, solution, dict((drone, [orderList[x] for x in droneTour]) for drone, droneTour in droneTourDictionary.items()), allowRecharge)
+
+    @staticmethod
+    def GenerateSweepSolution(droneList: list[Drone], orderList: list[Order], solution: Solution, allowRecharge: bool = True) -> ExitCode:
+        # Hint: The orders are split by their angle around the depot into a sector per drone with an equal share of the estimated work, each sector is routed by cheapest insertion
+        # Resolve the distance matrix, the depot order and the matrix indices of the orders for easier access
+        distanceMatrix = solution.getDistanceMatrix()
+        depotOrder = solution.getSolutionMatrix()[droneList[0]][0]
+        depotIndex = solution.getOrderIndex(depotOrder)
+        orderIndexArray = np.array(solution.getOrderIndices(orderList), dtype=np.intp)
+
+        # Check if there is no order at all and close the empty routes directly
+        if len(orderList) == 0: return Solver.CloseConstructedSolution(droneList, solution, dict((drone, []) for drone in droneList), allowRecharge)
+
+        # Project the orders onto the tangent plane at the depot and sort them by their angle around the depot
+        coordinateArray = Element.GetProjectedCoordinates([order.getDestination() for order in orderList], depotOrder.getDestination().getCoordinates())
+        angleArray = np.arctan2(coordinateArray[:, 1], coordinateArray[:, 0])
+        sweepArray = np.argsort(angleArray, kind='stable')
+
+        # Start the sweep after the largest angular gap between two following orders (no sector spans the gap)
+        gapArray = np.diff(angleArray[sweepArray], append=angleArray[sweepArray[0]] + 2 * math.pi)
+        sweepArray = np.roll(sweepArray, -(int(np.argmax(gapArray)) + 1))
+
+        # Hint: The work of an order is estimated by the flight time from the previous order of the sweep and its dwell time
+        # Calculate the estimated work of the orders along the sweep
+        legDistanceArray = distanceMatrix.getDistances(np.concatenate(([depotIndex], orderIndexArray[sweepArray[:-1]])), orderIndexArray[sweepArray])
+        workPrefixArray = np.cumsum(droneList[0].calculateFlightTime(legDistanceArray) + np.array([orderList[x].getDwellTime() for x in sweepArray.tolist()], dtype=np.float64))
+
+        # Split the sweep into a sector per drone at the equal shares of the estimated work
+        sectorList = np.split(sweepArray, np.searchsorted(workPrefixArray, workPrefixArray[-1] * np.arange(1, len(droneList)) / len(droneList)))
+
+        # Create the drone tours of the sectors
+        droneTourDictionary = dict()
+
+        # Loop through the drones and their sectors to route them
+        for drone, sectorArray in zip(droneList, sectorList):
+            # Create the tour as matrix indices and order positions (the order positions are without the depot at both ends)
+            tourIndices, tourPositionList, tourDistance = [depotIndex, depotIndex], [], 0.0
+
+            # Create the pending orders of the sector from the farest to the closest to the depot (the outer orders span the tour first)
+            pendingList = sorted(sectorArray.tolist(), key=lambda x: distanceMatrix.getDistance(depotIndex, orderIndexArray[x]), reverse=True)
+
+            # Loop through the pending orders until all are inserted (the orders out of range are deferred and retried as long as the tour grows)
+            while pendingList:
+                # Create the list of the deferred orders
+                deferredList = []
+
+                # Loop through the pending orders to insert them
+                for x in pendingList:
+                    # Calculate the insert distance deltas of the order between all following tour positions
+                    sourceIndexArray, destinationIndexArray = np.array(tourIndices[:-1], dtype=np.intp), np.array(tourIndices[1:], dtype=np.intp)
+                    insertDeltaArray = distanceMatrix.getDistances(sourceIndexArray, orderIndexArray[x]) + distanceMatrix.getDistances(orderIndexArray[x], destinationIndexArray) - distanceMatrix.getDistances(sourceIndexArray, destinationIndexArray)
+
+                    # Loop through the tour positions from the cheapest to the most expensive insert
+                    for tourPosition in np.argsort(insertDeltaArray, kind='stable').tolist():
+                        # Create the tour indices with the inserted order
+                        insertedTourIndices = tourIndices[:tourPosition + 1] + [orderIndexArray.item(x)] + tourIndices[tourPosition + 1:]
+
+                        # Constraint: The tour with the inserted order is in range of the drone (with the optimal charging stops)
+                        if Solver.CalculateConstructedTourTime(solution, drone, insertedTourIndices, tourDistance + insertDeltaArray[tourPosition], 0, allowRecharge) is None: continue
+
+                        # Insert the order into the tour
+                        tourIndices, tourDistance = insertedTourIndices, tourDistance + insertDeltaArray[tourPosition]
+                        tourPositionList.insert(tourPosition, x)
+                        break
+
+                    # Check if the order can't be inserted anywhere in the tour and defer it
+                    else: deferredList.append(x)
+
+                # Check if no pending order was inserted (the tour didn't grow)
+                if len(deferredList) == len(pendingList):
+                    # Return the exit code of the failed range constraint
+                    return ExitCode.NO_CHARGING_STATION_IN_RANGE if allowRecharge else ExitCode.ORDER_NOT_IN_RANGE
+
+                # Retry the deferred orders
+                pendingList = deferredList
+
+            # Save the orders of the drone tour
+            droneTourDictionary[drone] = [orderList[x] for x in tourPositionList]
+
+        # Close the drone tours with the orders of the sectors
+        return Solver.CloseConstructedSolution(droneList, solution, droneTourDictionary, allowRecharge)
+
+    @staticmethod
+    def GenerateRegretSolution(droneList: list[Drone], orderList: list[Order], solution: Solution, allowRecharge: bool = True, regretCount: int = DEFAULT_REGRET_COUNT) -> ExitCode:
+        # Hint: Parallel insertion into all drone tours, the order with the largest regret (sum of the cost differences between its best and next best drone tours) is inserted first
+        # Hint: The insert cost is the time score delta (tour time sum + drone count / 2 * (max - min) tour time), so the tours are balanced while they grow
+        # Resolve the distance matrix and the matrix index of the depot for easier access
+        distanceMatrix = solution.getDistanceMatrix()
+        depotIndex = solution.getOrderIndex(solution.getSolutionMatrix()[droneList[0]][0])
+
+        # Resolve the number of orders and drones and limit the regret to the number of drones
+        orderCount, droneCount = len(orderList), len(droneList)
+        regretCount = max(1, min(regretCount, droneCount))
+
+        # Check if there is no order at all and close the empty routes directly
+        if orderCount == 0: return Solver.CloseConstructedSolution(droneList, solution, dict((drone, []) for drone in droneList), allowRecharge)
+
+        # Resolve the matrix index of each tour node (the orders and the depot as the last node) and the dwell times of the orders
+        depotNode = orderCount
+        nodeIndexArray = np.array(solution.getOrderIndices(orderList) + [depotIndex], dtype=np.intp)
+        dwellTimeArray = np.array([order.getDwellTime() for order in orderList], dtype=np.float64)
+
+        # Hint: The flight time of the drones is linear in the distance
+        # Resolve the flight time per meter of the drones
+        flightTimeFactorArray = np.array([drone.calculateFlightTime(1.0) for drone in droneList], dtype=np.float64)
+
+        # Create the tours of the drones as node lists from and to the depot node with their distances, dwell and tour times
+        tourList = [[depotNode, depotNode] for _ in droneList]
+        tourDistanceList, tourDwellTimeList = [0.0] * droneCount, [0.0] * droneCount
+        tourTimeArray = np.zeros(droneCount, dtype=np.float64)
+
+        # Calculate the distances between the depot and the orders
+        depotDistanceArray = distanceMatrix.getDistances(depotIndex, nodeIndexArray[:orderCount])
+
+        # Create the best insert distance delta and its predecessor node of each order in each tour (an empty tour has the one edge from the depot to the depot)
+        insertDeltaMatrix = np.repeat(2 * depotDistanceArray[:, None], droneCount, axis=1)
+        insertPredecessorMatrix = np.full((orderCount, droneCount), depotNode, dtype=np.intp)
+
+        # Create the mask of the orders that are not inserted yet
+        openMask = np.ones(orderCount, dtype=bool)
+
+        # Hint: The insert costs into empty tours don't show the balance of the final tours (the smallest tour time stays zero), so each tour starts with a seed order
+        # Create the distances of the orders to the depot and the previous seed orders
+        seedDistanceArray = depotDistanceArray.copy()
+
+        # Loop through the drone tours to seed them with the order farest from the depot and the previous seed orders
+        for r in range(min(droneCount, orderCount)):
+            # Loop through the seed candidates until the tour of a seed order is in range of the drone (with the optimal charging stops)
+            while True:
+                # Resolve the seed order and calculate the distance and time of its tour
+                x = int(np.argmax(seedDistanceArray))
+                tourDistance = 2 * depotDistanceArray.item(x)
+                tourTime = Solver.CalculateConstructedTourTime(solution, droneList[r], [depotIndex, nodeIndexArray.item(x), depotIndex], tourDistance, dwellTimeArray.item(x), allowRecharge)
+
+                # Check if there is no seed candidate left or the tour of the seed order is in range
+                if (seedDistanceArray[x] == Solver.FLOAT_NEGATIVE_INFINITY) or (tourTime is not None): break
+
+                # Exclude the seed order (it is only in range between other orders of a tour)
+                seedDistanceArray[x] = Solver.FLOAT_NEGATIVE_INFINITY
+
+            # Check if there is no seed candidate left to leave the remaining tours empty
+            if seedDistanceArray[x] == Solver.FLOAT_NEGATIVE_INFINITY: break
+
+            # Insert the seed order into the tour and update the tour distance, dwell and tour time
+            tourList[r].insert(1, x)
+            tourDistanceList[r], tourDwellTimeList[r], tourTimeArray[r] = tourDistance, dwellTimeArray.item(x), tourTime
+            openMask[x] = False
+
+            # Calculate the insert distance deltas into the seeded tour (both edges of the tour have the same delta) and the distances to the seed orders
+            orderDistanceArray = distanceMatrix.getDistances(nodeIndexArray[x], nodeIndexArray[:orderCount])
+            insertDeltaMatrix[:, r] = depotDistanceArray + orderDistanceArray - depotDistanceArray.item(x)
+            seedDistanceArray = np.where(openMask, np.minimum(seedDistanceArray, orderDistanceArray), Solver.FLOAT_NEGATIVE_INFINITY)
+
+        # Resolve the orders that are not inserted yet
+        openArray = np.flatnonzero(openMask)
+
+        # Run the insertion until all orders are inserted
+        while len(openArray):
+            # Resolve the largest and smallest tour time of the other drones for each drone (without other drones there is no difference)
+            sortedDroneArray = np.argsort(tourTimeArray, kind='stable')
+            otherMaxTimeArray = np.full(droneCount, tourTimeArray[sortedDroneArray[-1]])
+            otherMaxTimeArray[sortedDroneArray[-1]] = tourTimeArray[sortedDroneArray[-2]] if droneCount > 1 else Solver.FLOAT_NEGATIVE_INFINITY
+            otherMinTimeArray = np.full(droneCount, tourTimeArray[sortedDroneArray[0]])
+            otherMinTimeArray[sortedDroneArray[0]] = tourTimeArray[sortedDroneArray[1]] if droneCount > 1 else Solver.FLOAT_POSITIVE_INFINITY
+
+            # Calculate the insert costs of the open orders in each tour as the time score delta (without the constant previous difference)
+            insertTimeMatrix = insertDeltaMatrix[openArray] * flightTimeFactorArray + dwellTimeArray[openArray, None]
+            insertedTimeMatrix = tourTimeArray + insertTimeMatrix
+            insertCostMatrix = insertTimeMatrix + (droneCount / 2) * (np.maximum(insertedTimeMatrix, otherMaxTimeArray) - np.minimum(insertedTimeMatrix, otherMinTimeArray))
+
+            # Sort the insert costs of each open order and check if no order can be inserted into any tour (the other orders are deferred until their tours change)
+            sortedCostMatrix = np.sort(insertCostMatrix, axis=1)
+            insertableMask = np.isfinite(sortedCostMatrix[:, 0])
+            if not insertableMask.any(): return ExitCode.NO_CHARGING_STATION_IN_RANGE if allowRecharge else ExitCode.ORDER_NOT_IN_RANGE
+
+            # Calculate the regret of the insertable open orders and select the order with the largest regret (the largest best cost on ties, so the far orders span the tours first)
+            regretArray = np.where(insertableMask, (sortedCostMatrix[:, 1:regretCount] - np.where(insertableMask, sortedCostMatrix[:, 0], 0.0)[:, None]).sum(axis=1), Solver.FLOAT_NEGATIVE_INFINITY)
+            candidateArray = np.flatnonzero(regretArray == regretArray.max())
+            candidatePosition = candidateArray[np.argmax(sortedCostMatrix[candidateArray, 0])]
+
+            # Resolve the selected order, its best drone tour and the tour edge the order is inserted into
+            x, r = openArray.item(candidatePosition), int(np.argmin(insertCostMatrix[candidatePosition]))
+            predecessorNode = insertPredecessorMatrix.item(x, r)
+            tour = tourList[r]
+            tourPosition = tour.index(predecessorNode) + 1
+            successorNode = tour[tourPosition]
+            tourDistance = tourDistanceList[r] + insertDeltaMatrix.item(x, r)
+
+            # Calculate the tour time with the inserted order (with the optimal charging stops, so the balance of the tours includes the charging times)
+            tourTime = Solver.CalculateConstructedTourTime(solution, droneList[r], nodeIndexArray[tour[:tourPosition] + [x] + tour[tourPosition:]].tolist(), tourDistance, tourDwellTimeList[r] + dwellTimeArray.item(x), allowRecharge)
+
+            # Constraint: The tour with the inserted order is in range of the drone
+            if tourTime is None:
+                # Exclude the drone tour for the order until the tour changes and select the next order
+                insertDeltaMatrix[x, r] = Solver.FLOAT_POSITIVE_INFINITY
+                continue
+
+            # Insert the order into the tour and update the tour distance, dwell and tour time
+            tour.insert(tourPosition, x)
+            tourDistanceList[r], tourDwellTimeList[r], tourTimeArray[r] = tourDistance, tourDwellTimeList[r] + dwellTimeArray.item(x), tourTime
+
+            # Remove the order from the open orders
+            openMask[x] = False
+            openArray = np.flatnonzero(openMask)
+
+            # Split the open orders into the ones with their best insert at the replaced edge (full update) and the others (only the two new edges are checked)
+            replacedMask = insertPredecessorMatrix[openArray, r] == predecessorNode
+            fullArray, partialArray = openArray[replacedMask], openArray[~replacedMask]
+
+            # Calculate the insert distance deltas of the partial orders at the two new edges and keep the better ones
+            partialIndexArray = nodeIndexArray[partialArray]
+            orderDistanceArray = distanceMatrix.getDistances(nodeIndexArray[x], partialIndexArray)
+            for sourceNode, destinationNode, otherNode in ((predecessorNode, x, predecessorNode), (x, successorNode, successorNode)):
+                # Calculate the insert distance deltas at the new edge (between the inserted and the other node) and update the improved best inserts
+                edgeDeltaArray = distanceMatrix.getDistances(nodeIndexArray[otherNode], partialIndexArray) + orderDistanceArray - distanceMatrix.getDistance(nodeIndexArray.item(sourceNode), nodeIndexArray.item(destinationNode))
+                improvedMask = edgeDeltaArray < insertDeltaMatrix[partialArray, r]
+                insertDeltaMatrix[partialArray[improvedMask], r] = edgeDeltaArray[improvedMask]
+                insertPredecessorMatrix[partialArray[improvedMask], r] = sourceNode
+
+            # Check if there are orders to update fully
+            if len(fullArray):
+                # Calculate the insert distance deltas of the full orders between all following tour positions
+                sourceIndexArray, destinationIndexArray, fullIndexArray = nodeIndexArray[tour[:-1]], nodeIndexArray[tour[1:]], nodeIndexArray[fullArray][:, None]
+                fullDeltaMatrix = distanceMatrix.getDistances(sourceIndexArray, fullIndexArray) + distanceMatrix.getDistances(fullIndexArray, destinationIndexArray) - distanceMatrix.getDistances(sourceIndexArray, destinationIndexArray)
+
+                # Save the best insert distance deltas and their predecessor nodes
+                bestPositionArray = np.argmin(fullDeltaMatrix, axis=1)
+                insertDeltaMatrix[fullArray, r] = fullDeltaMatrix[np.arange(len(fullArray)), bestPositionArray]
+                insertPredecessorMatrix[fullArray, r] = np.array(tour, dtype=np.intp)[bestPositionArray]
+
+        # Close the drone tours with the inserted orders
+        return Solver.CloseConstructedSolution(droneList, solution, dict((drone, [orderList[x] for x in tour[1:-1]]) for drone, tour in zip(droneList, tourList)), allowRecharge)
+
+    @staticmethod
+    def CalculateConstructedTourTime(solution: Solution, drone: Drone, tourIndices: list[int], tourDistance: float, tourDwellTime: float, allowRecharge: bool) -> float | None:
+        # Resolve the remaining distance of the drone
+        droneDistance = drone.getRemainingFlightDistance()
+
+        # Check if the tour is in range of the drone without charging and return its tour time (flight + dwell time)
+        if tourDistance <= droneDistance: return drone.calculateFlightTime(tourDistance) + tourDwellTime
+
+        # Constraint: The drone is allowed to recharge
+        if not allowRecharge: return None
+
+        # Calculate the charging stops with the shortest tour time, if not possible the tour is out of range
+        chargingStops = solution.calculateChargingStops(tourIndices, droneDistance, Solution.GetChargingStopDistance(drone))
+        if chargingStops is None: return None
+
+        # Return the tour time with the charging detours and the dwell times of the charging stops
+        return drone.calculateFlightTime(chargingStops[0]) + tourDwellTime + len(chargingStops[1]) * ProblemInstance.CHARGING_ORDER_DWELL_TIME
+
+    @staticmethod
+    def CloseConstructedSolution(droneList: list[Drone], solution: Solution, droneTourDictionary: dict[Drone, list[Order]], allowRecharge: bool) -> ExitCode:
+        # Resolve the solution matrix for easier access
+        solutionMatrix = solution.getSolutionMatrix()
+
+        # Loop through the drones to close their constructed tours
+        for drone in droneList:
+            # Create the drone tour from the start over the constructed orders and back with the return-to-start (depot) order
+            droneTour = [solutionMatrix[drone][0]] + droneTourDictionary[drone] + [Order(solutionMatrix[drone][0].getDestination(), 0, 0)]
+            solution.setDroneTour(drone, droneTour)
+
+            # Calculate the tour distance and check if the tour is in range of the drone without charging
+            droneTourLength = solution.getTourDistance(droneTour)
+            if droneTourLength <= drone.getRemainingFlightDistance(): continue
+
+            # Constraint: The drone is allowed to recharge
+            if not allowRecharge: return ExitCode.ORDER_NOT_IN_RANGE
+
+            # Constraint: The charging orders with the least detour are inserted into the tour
+            if not solution.insertChargingOrders(drone, droneTour, droneTourLength): return ExitCode.NO_CHARGING_STATION_IN_RANGE
+
+        # Return exit code for success
+        return ExitCode.SUCCESS
+
+################################################################################
+################################ SUPPORT CLASSES ###############################
+################################################################################
+
+class SearchStage():
+    # Define the memory layout of the search stage (no instance dict)
+    __slots__ = ('orderIndex', 'droneList', 'droneIndex', 'undoSize', 'rechargeUndoSize', 'constrainFailureLevel')
+
+    # Constructor the search stage with given arguemnts
+    def __init__(self, orderIndex: int, droneList: list[Drone]):
+        # Save the index of the order that is added in the search stage
+        self.orderIndex = orderIndex
+
+        # Save the sorted drone candidates and the position of the next drone candidate
+        self.droneList = droneList
+        self.droneIndex = 0
+
+        # Set the undo stack sizes before the order and before the charging orders of the current drone candidate as not set yet
+        self.undoSize = None
+        self.rechargeUndoSize = None
+
+        # Set the default constraint failure level exit code
+        self.constrainFailureLevel = ExitCode.NO_SOLUTION
@@ -0,0 +1,261 @@
+import numpy as np
+
+from collections import OrderedDict
+
+from osm.Element import Element
+from osm.DistanceModel import DistanceModel
+
+from .DistanceMatrix import DistanceMatrix
+from .SpatialIndex import SpatialIndex
+
+class SparseDistanceMatrix(DistanceMatrix):
+    # Define constants for the sparse distance matrix class
+    DEFAULT_NEIGHBOR_COUNT = 25
+    DEFAULT_MEMORY_BUDGET = 1 << 26
+    CACHE_ENTRY_SIZE = 128
+
+    # Constructor the sparse distance matrix with given arguemnts
+    def __init__(self, buildingList: list[Element], distanceModel: DistanceModel = DistanceModel.WGS84, anchorBuildingList: list[Element] = None,
+        neighborCount: int = DEFAULT_NEIGHBOR_COUNT, memoryBudget: int = DEFAULT_MEMORY_BUDGET):
+        # Save the list of unique buildings in the order of their first appearance (dict keys preserve the insertion order)
+        self.buildingList = list(dict.fromkeys(buildingList))
+
+        # Save the number of matrix indices (each unique building has its own index)
+        self.indexCount = len(self.buildingList)
+
+        # Save the matrix index of each unique building as an array for the vectorized access
+        self.buildingIndexArray = np.arange(self.indexCount, dtype=np.intp)
+
+        # Create a dictionary to look up the stable matrix index for each building in a constant time
+        self.buildingIndexDictionary = dict(zip(self.buildingList, self.buildingIndexArray.tolist()))
+
+        # Save the distance model the distances are calculated with
+        self.distanceModel = distanceModel
+
+        # Save the coordinates of the unique buildings for the on demand calculation
+        self.coordinateArray = Element.GetCoordinateArray(self.buildingList)
+
+        # Save the unique anchor buildings (e.g. depot and charging stations) whose distances to all buildings are stored completely
+        self.anchorBuildingList = list(dict.fromkeys(anchorBuildingList or []))
+
+        # Create a list with the anchor column of each matrix index (-1 for buildings that are no anchor)
+        self.anchorColumnList = [-1] * self.indexCount
+
+        # Loop through the anchor buildings and save their column
+        for anchorColumn, anchorBuilding in enumerate(self.anchorBuildingList): self.anchorColumnList[self.buildingIndexDictionary[anchorBuilding]] = anchorColumn
+
+        # Save the anchor columns as an array for the vectorized access
+        self.anchorColumnArray = np.array(self.anchorColumnList, dtype=np.intp)
+
+        # Calculate the dense distances between all buildings and the anchor buildings
+        self.anchorMatrix = Element.GetDistanceMatrix(self.coordinateArray, Element.GetCoordinateArray(self.anchorBuildingList), distanceModel)
+
+        # Limit the number of stored neighbors to the number of other buildings
+        self.neighborCount = max(0, min(neighborCount, self.indexCount - 1))
+
+        # Calculate the distances between each building and its nearest neighbors
+        self.neighborDistanceDictionary = SparseDistanceMatrix.CalculateNeighborDistanceDictionary(self.buildingList, self.coordinateArray, self.neighborCount, distanceModel)
+
+        # Save the memory budget of the on demand distance cache [byte]
+        self.memoryBudget = memoryBudget
+
+        # Calculate the maximum number of cached distances within the memory budget
+        self.maximumCacheSize = max(0, memoryBudget // SparseDistanceMatrix.CACHE_ENTRY_SIZE)
+
+        # Create an ordered dictionary as the least recently used cache of the on demand distances
+        self.distanceCache = OrderedDict()
+
+        # Set the statistics of the on demand distance cache
+        self.hitCount = 0
+        self.missCount = 0
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getMatrix(self) -> np.ndarray:
+        # Hint: Check the hasDenseMatrix function before, the distances of a sparse distance matrix are only available with the getDistance and getDistances functions
+        # A sparse distance matrix has no dense matrix (it would not fit into the memory budget)
+        raise Exception(f"SparseDistanceMatrix - No dense matrix for {self.indexCount} buildings, use getDistances instead.")
+
+    def getAnchorBuildingList(self) -> list[Element]:
+        # Return the anchorBuildingList
+        return self.anchorBuildingList
+
+    def getAnchorMatrix(self) -> np.ndarray:
+        # Return the anchorMatrix
+        return self.anchorMatrix
+
+    def getNeighborCount(self) -> int:
+        # Return the neighborCount
+        return self.neighborCount
+
+    def getMemoryBudget(self) -> int:
+        # Return the memoryBudget
+        return self.memoryBudget
+
+    def getMaximumCacheSize(self) -> int:
+        # Return the maximumCacheSize
+        return self.maximumCacheSize
+
+    def getCacheSize(self) -> int:
+        # Return the number of cached distances
+        return len(self.distanceCache)
+
+    def getHitCount(self) -> int:
+        # Return the hitCount
+        return self.hitCount
+
+    def getMissCount(self) -> int:
+        # Return the missCount
+        return self.missCount
+
+    def getHitRate(self) -> float:
+        # Calculate the share of cache hits of all on demand lookups (zero if there was no lookup yet)
+        return self.hitCount / (self.hitCount + self.missCount) if (self.hitCount + self.missCount) > 0 else 0.0
+
+    def resetStatistics(self):
+        # Reset the statistics of the on demand distance cache
+        self.hitCount = 0
+        self.missCount = 0
+
+    ################################################################################
+    ############################### ACCESS FUNCTIONS ###############################
+    ################################################################################
+
+    def hasDenseMatrix(self) -> bool:
+        # A sparse distance matrix only stores the anchor and the nearest neighbor distances
+        return False
+
+    def getIndexCount(self) -> int:
+        # Return the number of matrix indices
+        return self.indexCount
+
+    def getDistance(self, sourceIndex: int, destinationIndex: int) -> float:
+        # Try to look up the distance in the stored and cached distances
+        distance = self.lookupDistance(sourceIndex, destinationIndex)
+
+        # Check if the distance is known
+        if distance is not None: return distance
+
+        # Calculate the distance of the missing pair and save it into the cache
+        return self.calculateDistances([min(sourceIndex, destinationIndex)], [max(sourceIndex, destinationIndex)])[0]
+
+    def getDistances(self, sourceIndices: np.ndarray, destinationIndices: np.ndarray) -> np.ndarray:
+        # Broadcast the index arrays against each other like the fancy indexing of the dense matrix
+        sourceIndices, destinationIndices = np.broadcast_arrays(np.asarray(sourceIndices, dtype=np.intp), np.asarray(destinationIndices, dtype=np.intp))
+
+        # Check if all destinations are anchor buildings to use the dense anchor matrix
+        if np.all(self.anchorColumnArray[destinationIndices] >= 0): return self.anchorMatrix[sourceIndices, self.anchorColumnArray[destinationIndices]]
+
+        # Check if all sources are anchor buildings to use the dense anchor matrix (the distances are symmetric)
+        if np.all(self.anchorColumnArray[sourceIndices] >= 0): return self.anchorMatrix[destinationIndices, self.anchorColumnArray[sourceIndices]]
+
+        # Try to look up each distance in the stored and cached distances
+        distanceList = list(map(self.lookupDistance, sourceIndices.ravel().tolist(), destinationIndices.ravel().tolist()))
+
+        # Resolve the positions of the missing distances
+        missingPositions = [position for position, distance in enumerate(distanceList) if distance is None]
+
+        # Check if there are missing distances to calculate them in one vectorized batch
+        if missingPositions:
+            # Resolve the unique missing pairs in the symmetric order
+            missingPairList = list(dict.fromkeys((min(x, y), max(x, y)) for x, y in zip(sourceIndices.ravel()[missingPositions].tolist(), destinationIndices.ravel()[missingPositions].tolist())))
+
+            # Calculate the distances of the missing pairs and save them into the cache
+            missingDistanceDictionary = dict(zip(missingPairList, self.calculateDistances([x for x, _ in missingPairList], [y for _, y in missingPairList])))
+
+            # Loop through the missing positions and fill in the calculated distances
+            for position in missingPositions:
+                # Resolve the symmetric pair of the position and set its distance
+                sourceIndex, destinationIndex = sourceIndices.item(position), destinationIndices.item(position)
+                distanceList[position] = missingDistanceDictionary[(min(sourceIndex, destinationIndex), max(sourceIndex, destinationIndex))]
+
+        # Return the distances in the shape of the broadcasted indices
+        return np.array(distanceList, dtype=np.float64).reshape(sourceIndices.shape)
+
+    def getBuildingDistance(self, sourceBuilding: Element, destinationBuilding: Element) -> float:
+        # Resolve the indices of both buildings and return the distance between them
+        return self.getDistance(self.buildingIndexDictionary[sourceBuilding], self.buildingIndexDictionary[destinationBuilding])
+
+    ################################################################################
+    ################################ CACHE FUNCTIONS ###############################
+    ################################################################################
+
+    def lookupDistance(self, sourceIndex: int, destinationIndex: int) -> float | None:
+        # Check if both indices are equal
+        if sourceIndex == destinationIndex: return 0.0
+
+        # Check if the destination is an anchor building to use the dense anchor matrix
+        anchorColumn = self.anchorColumnList[destinationIndex]
+        if anchorColumn >= 0: return self.anchorMatrix.item(sourceIndex, anchorColumn)
+
+        # Check if the source is an anchor building to use the dense anchor matrix
+        anchorColumn = self.anchorColumnList[sourceIndex]
+        if anchorColumn >= 0: return self.anchorMatrix.item(destinationIndex, anchorColumn)
+
+        # Create the symmetric key of the index pair (lower index first)
+        pairKey = (sourceIndex * self.indexCount + destinationIndex) if sourceIndex < destinationIndex else (destinationIndex * self.indexCount + sourceIndex)
+
+        # Check if the pair is a stored nearest neighbor pair
+        distance = self.neighborDistanceDictionary.get(pairKey)
+        if distance is not None: return distance
+
+        # Check if the pair is in the on demand distance cache
+        distance = self.distanceCache.get(pairKey)
+
+        # Check if the distance was not cached and count the miss
+        if distance is None:
+            self.missCount += 1
+            return None
+
+        # Count the hit and mark the pair as the most recently used one
+        self.hitCount += 1
+        self.distanceCache.move_to_end(pairKey)
+
+        # Return the cached distance
+        return distance
+
+    def calculateDistances(self, lowerIndexList: list[int], upperIndexList: list[int]) -> list[float]:
+        # Calculate the distances of the index pairs with the vectorized element wise distance function (lower index as source like the dense upper triangle)
+        distanceList = Element.GetPairwiseDistances(self.coordinateArray[lowerIndexList], self.coordinateArray[upperIndexList], self.distanceModel).tolist()
+
+        # Check if the cache is disabled by the memory budget
+        if self.maximumCacheSize == 0: return distanceList
+
+        # Save the distances into the cache with the symmetric keys of the index pairs
+        self.distanceCache.update(zip((x * self.indexCount + y for x, y in zip(lowerIndexList, upperIndexList)), distanceList))
+
+        # Evict the least recently used distances while the cache exceeds its maximum size
+        while len(self.distanceCache) > self.maximumCacheSize: self.distanceCache.popitem(last=False)
+
+        # Return the calculated distances
+        return distanceList
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def CalculateNeighborDistanceDictionary(buildingList: list[Element], coordinateArray: np.ndarray, neighborCount: int, distanceModel: DistanceModel = DistanceModel.WGS84) -> dict[int, float]:
+        # Check if there are no neighbors to store
+        if neighborCount == 0: return {}
+
+        # Use a spatial index to query the nearest neighbors of each building (plus the building itself)
+        _, neighborIndices = SpatialIndex(buildingList).queryNearestIndices(coordinateArray, neighborCount + 1)
+
+        # Create the index pairs between each building and its neighbors
+        sourceIndices, destinationIndices = np.repeat(np.arange(len(buildingList)), neighborIndices.shape[1]), neighborIndices.reshape(-1)
+
+        # Sort each pair into the symmetric order (lower index first) and drop the pairs of a building with itself
+        lowerIndices, upperIndices = np.minimum(sourceIndices, destinationIndices), np.maximum(sourceIndices, destinationIndices)
+        lowerIndices, upperIndices = lowerIndices[lowerIndices != upperIndices], upperIndices[lowerIndices != upperIndices]
+
+        # Create the symmetric keys of the pairs and remove the duplicates of mutual neighbors
+        pairKeys, uniquePositions = np.unique(lowerIndices * len(buildingList) + upperIndices, return_index=True)
+
+        # Calculate the distances of the unique pairs at once (lower index as source like the dense upper triangle)
+        distances = Element.GetPairwiseDistances(coordinateArray[lowerIndices[uniquePositions]], coordinateArray[upperIndices[uniquePositions]], distanceModel)
+
+        # Return the dictionary of the pair keys and distances
+        return dict(zip(pairKeys.tolist(), distances.tolist()))
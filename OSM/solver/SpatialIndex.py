@@ -0,0 +1,67 @@
+import numpy as np
+
+from sklearn.neighbors import KDTree
+
+from osm.Element import Element
+
+class SpatialIndex():
+    # Define constants for the spatial index class
+    DEFAULT_LEAF_SIZE = 40
+
+    # Constructor the spatial index with given arguemnts
+    def __init__(self, elementList: list[Element], referenceCoordinates: tuple[float, float] = None, leafSize: int = DEFAULT_LEAF_SIZE):
+        # Save the list of indexed elements
+        self.elementList = elementList
+
+        # Check if the reference coordinates are set or use the center of the elements as the tangent point of the projection
+        if referenceCoordinates is None and elementList: referenceCoordinates = tuple(Element.GetCoordinateArray(elementList).mean(axis=0))
+
+        # Save the reference coordinates of the projection
+        self.referenceCoordinates = referenceCoordinates
+
+        # Project the element coordinates onto the local tangent plane to index them in meters
+        self.projectedCoordinates = Element.GetProjectedCoordinates(elementList, referenceCoordinates) if elementList else np.zeros((0, 2))
+
+        # Build the kd-tree over the projected coordinates (no tree for an empty element list)
+        self.tree = KDTree(self.projectedCoordinates, leaf_size=leafSize) if elementList else None
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getElementList(self) -> list[Element]:
+        # Return the elementList
+        return self.elementList
+
+    def getReferenceCoordinates(self) -> tuple[float, float]:
+        # Return the referenceCoordinates
+        return self.referenceCoordinates
+
+    def getProjectedCoordinates(self) -> np.ndarray:
+        # Return the projectedCoordinates
+        return self.projectedCoordinates
+
+    ################################################################################
+    ################################ QUERY FUNCTIONS ###############################
+    ################################################################################
+
+    def queryNearestIndices(self, elements: 'list[Element | tuple[float, float]] | np.ndarray', neighborCount: int) -> tuple[np.ndarray, np.ndarray]:
+        # Limit the number of neighbors to the number of indexed elements
+        neighborCount = min(neighborCount, len(self.elementList))
+
+        # Project the query coordinates with the same tangent point as the indexed elements
+        queryCoordinates = Element.GetProjectedCoordinates(elements, self.referenceCoordinates)
+
+        # Check if there is nothing to query and return empty results
+        if (self.tree is None) or (neighborCount == 0) or (len(queryCoordinates) == 0):
+            return (np.zeros((len(queryCoordinates), 0)), np.zeros((len(queryCoordinates), 0), dtype=np.intp))
+
+        # Use the kd-tree to get the planar distances and element indices of the nearest neighbors sorted by distance
+        return self.tree.query(queryCoordinates, k=neighborCount, return_distance=True, sort_results=True)
+
+    def getNearestElements(self, element: 'Element | tuple[float, float]', neighborCount: int) -> list[Element]:
+        # Query the nearest indices for the single element
+        _, nearestIndices = self.queryNearestIndices([element], neighborCount)
+
+        # Convert the nearest indices back into elements
+        return [self.elementList[index] for index in nearestIndices[0]]
@@ -0,0 +1,58 @@
+import heapq
+
+from simulation.Drone import Drone
+
+class TourTimeTable():
+    # Define the number of kept extreme tour times (one more than the maximum number of changed drones of a move)
+    EXTREMA_COUNT = 3
+
+    # Constructor the tour time table with given arguemnts
+    def __init__(self, droneList: list[Drone], tourTimeList: list[float]):
+        # Save the tour time of each drone
+        self.tourTimeDictionary = dict(zip(droneList, tourTimeList))
+
+        # Save the sum and the number of all tour times (summed in the order of the drone list like the full time score)
+        self.tourTimeSum = sum(tourTimeList)
+        self.tourTimeCount = len(tourTimeList)
+
+        # Save the drones with the largest and smallest tour times (sorted, so the first unchanged drone has the extreme tour time of the unchanged drones)
+        self.largestDroneList = heapq.nlargest(TourTimeTable.EXTREMA_COUNT, droneList, key=self.tourTimeDictionary.__getitem__)
+        self.smallestDroneList = heapq.nsmallest(TourTimeTable.EXTREMA_COUNT, droneList, key=self.tourTimeDictionary.__getitem__)
+
+    ################################################################################
+    ############################### GETTER FUNCTIONS ###############################
+    ################################################################################
+
+    def getTourTimeDictionary(self) -> dict[Drone, float]:
+        # Return the tourTimeDictionary
+        return self.tourTimeDictionary
+
+    def getTourTimeSum(self) -> float:
+        # Return the tourTimeSum
+        return self.tourTimeSum
+
+    def getTourTimeCount(self) -> int:
+        # Return the tourTimeCount
+        return self.tourTimeCount
+
+    ################################################################################
+    ################################ LOOKUP FUNCTIONS ##############################
+    ################################################################################
+
+    def getMaximumTourTime(self, changedTourTimeDictionary: dict[Drone, float]) -> float:
+        # Resolve the largest tour time of the unchanged drones (at most two drones are changed, so one of the three largest is unchanged if there is any)
+        unchangedTourTimeList = [self.tourTimeDictionary[drone] for drone in self.largestDroneList if drone not in changedTourTimeDictionary][:1]
+
+        # Return the maximum of the changed and the largest unchanged tour time
+        return max(list(changedTourTimeDictionary.values()) + unchangedTourTimeList)
+
+    def getMinimumTourTime(self, changedTourTimeDictionary: dict[Drone, float]) -> float:
+        # Resolve the smallest tour time of the unchanged drones (at most two drones are changed, so one of the three smallest is unchanged if there is any)
+        unchangedTourTimeList = [self.tourTimeDictionary[drone] for drone in self.smallestDroneList if drone not in changedTourTimeDictionary][:1]
+
+        # Return the minimum of the changed and the smallest unchanged tour time
+        return min(list(changedTourTimeDictionary.values()) + unchangedTourTimeList)
+
+    def getTourTimeSumDelta(self, changedTourTimeDictionary: dict[Drone, float]) -> float:
+        # Sum up the differences between the changed and the current tour times
+        return sum(tourTime - self.tourTimeDictionary[drone] for drone, tourTime in changedTourTimeDictionary.items())
@@ -0,0 +1,55 @@
+import random
+
+from simulation.Drone import Drone
+
+class ZobristTable():
+    # Define the seed of the random keys (own random generator, so the keys are reproducible and the global random state is untouched)
+    KEY_SEED = 0x5EED
+
+    # Define the mask of the 64 bit keys
+    KEY_MASK = (1 << 64) - 1
+
+    # Constructor the zobrist table with given arguemnts
+    def __init__(self, droneList: list[Drone], orderCodeRange: range):
+        # Create the random generator of the keys
+        keyGenerator = random.Random(ZobristTable.KEY_SEED)
+
+        # Create a random key for each drone (the edges are keyed per drone, so equal tours of different drones differ)
+        self.droneKeyDictionary = dict((drone, keyGenerator.getrandbits(64)) for drone in droneList)
+
+        # Create a random key for each order code as the source and as the destination of an edge (the edges are directed)
+        self.sourceKeyDictionary = dict((orderCode, keyGenerator.getrandbits(64)) for orderCode in orderCodeRange)
+        self.destinationKeyDictionary = dict((orderCode, keyGenerator.getrandbits(64)) for orderCode in orderCodeRange)
+
+    ################################################################################
+    ################################ LOOKUP FUNCTIONS ##############################
+    ################################################################################
+
+    def getEdgeKey(self, drone: Drone, sourceOrderCode: int, destinationOrderCode: int) -> int:
+        # Hint: The keys of all edges are mixed instead of stored, so the table grows linear with the orders and not quadratic
+        # Combine the drone and order keys of the edge and mix them into an independent key
+        return ZobristTable.MixKey(((self.droneKeyDictionary[drone] ^ self.sourceKeyDictionary[sourceOrderCode]) + self.destinationKeyDictionary[destinationOrderCode]) & ZobristTable.KEY_MASK)
+
+    def getTourKey(self, drone: Drone, orderCodeList: list[int]) -> int:
+        # Initialize the tour key
+        tourKey = 0
+
+        # Loop through the edges of the tour to combine their keys
+        for sourceOrderCode, destinationOrderCode in zip(orderCodeList, orderCodeList[1:]):
+            tourKey ^= self.getEdgeKey(drone, sourceOrderCode, destinationOrderCode)
+
+        # Return the tour key
+        return tourKey
+
+    ################################################################################
+    ############################### STATIC FUNCTIONS ###############################
+    ################################################################################
+
+    @staticmethod
+    def MixKey(key: int) -> int:
+        # Mix the bits of the key with the finalizer of the splitmix64 generator
+        key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & ZobristTable.KEY_MASK
+        key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & ZobristTable.KEY_MASK
+
+        # Return the mixed key
+        return key ^ (key >> 31)